@@ -1,13 +1,30 @@
 import uuid
 import json
+import random
+from django.conf import settings
 from django.utils.deprecation import MiddlewareMixin
 from django.urls import resolve, Resolver404
-from auth_system.models import TblUser
-from auth_system.models.login_session import LoginSession
+from auth_system.models import APILog, TblUser
+from auth_system.models.login_session import LoginSession, hash_token
+from auth_system.utils.log_sink import log_sink
 
 
 class APILogMiddleware(MiddlewareMixin):
+    """
+    Writes one APILog row per API call.
+
+    ``API_LOG_MODE = "full"`` is the original behaviour. ``"lite"`` keeps the
+    per-request cost low: no session write, the LoginSession already loaded by
+    ``IsTokenValid`` is reused instead of queried again, bodies are only parsed
+    for requests that are actually logged (``API_LOG_SAMPLE_RATES`` per path
+    prefix, errors always), response bodies are size-capped, and rows go
+    through the batched log sink.
+    """
+
     def process_request(self, request):
+        if settings.API_LOG_MODE == "lite":
+            return self._process_request_lite(request)
+
         # --- Step 1: Authorization Token ---
         auth_header = request.headers.get("Authorization", "")
         token = None
@@ -32,7 +49,7 @@ class APILogMiddleware(MiddlewareMixin):
         if token:
             try:
                 session = LoginSession.objects.filter(
-                    token=token, is_active=True
+                    token_digest=hash_token(token), is_active=True
                 ).first()
                 if session:
                     session_uuid = str(session.pk)  # ✅ FIXED LINE
@@ -53,6 +70,9 @@ class APILogMiddleware(MiddlewareMixin):
         )
 
     def process_response(self, request, response):
+        if settings.API_LOG_MODE == "lite":
+            return self._process_response_lite(request, response)
+
         try:
             if getattr(request, "_log_saved", False):
                 return response
@@ -65,7 +85,6 @@ class APILogMiddleware(MiddlewareMixin):
             path = request.path_info
             method = request.method
 
-            EXCLUDED_PATHS = ["/admin/", "/static/", "/health/", "/test/"]
             if any(path.startswith(p) for p in EXCLUDED_PATHS):
                 return response
 
@@ -104,7 +123,7 @@ class APILogMiddleware(MiddlewareMixin):
                 elif path == "/auth_system/logout/" and token:
                     try:
                         session = LoginSession.objects.filter(
-                            token=token, is_active=True
+                            token_digest=hash_token(token), is_active=True
                         ).first()
                         if session and hasattr(session, "user"):
                             user_obj = session.user
@@ -165,6 +184,76 @@ class APILogMiddleware(MiddlewareMixin):
 
         return response
 
+    def _process_request_lite(self, request):
+        auth_header = request.headers.get("Authorization", "")
+        request._token = auth_header[7:].strip() if auth_header.startswith("Bearer ") else None
+
+        # Read (not parse) the body now: once DRF streams it, it cannot be read again
+        try:
+            request._raw_body = request.body
+        except Exception:
+            request._raw_body = b""
+
+    def _process_response_lite(self, request, response):
+        try:
+            if getattr(request, "_log_saved", False):
+                return response
+
+            path = request.path_info
+            if any(path.startswith(p) for p in EXCLUDED_PATHS):
+                return response
+            if getattr(request, "resolver_match", None) is None:
+                return response
+            if response.status_code < 400 and not _is_sampled(path):
+                return response
+
+            body_data = _parse_json(getattr(request, "_raw_body", b""))
+            query_params = _flatten_querydict(
+                request.GET,
+                exclude_keys=["page", "page_size", "limit", "offset"],
+            )
+
+            user = getattr(request, "user", None)
+            user_obj = user if user and user.is_authenticated else None
+            login_session = getattr(request, "_login_session", None)
+
+            uniqid = body_data.get("unique_id") if isinstance(body_data, dict) else None
+            if not uniqid and login_session is not None:
+                uniqid = str(login_session.pk)
+
+            if path == "/auth_system/login/" and response.status_code == 200:
+                data = _capture_response(response)
+                if isinstance(data, dict) and data.get("session_uuid"):
+                    uniqid = data["session_uuid"]
+                if not user_obj and isinstance(body_data, dict):
+                    user_obj = _find_login_user(body_data.get("username"))
+
+            if not user_obj and login_session is not None:
+                user_obj = getattr(login_session, "user", None)
+
+            if request.method == "GET" and not query_params:
+                request_data = {"message": "Full data fetched"}
+            elif isinstance(body_data, dict):
+                request_data = {**body_data, **query_params}
+            else:
+                request_data = query_params
+
+            log_sink.submit(APILog(
+                uniqid=uniqid or str(uuid.uuid4()),
+                user=user_obj,
+                method=request.method,
+                endpoint=path,
+                request_data=request_data,
+                response_status=response.status_code,
+                response_data=_capture_response(response),
+            ))
+            request._log_saved = True
+
+        except Exception as e:
+            print(f"[Middleware] APILog error: {e}")
+
+        return response
+
     def _import_apilog_model(self, app_name):
         try:
             module = __import__(f"{app_name}.models", fromlist=["APILog"])
@@ -181,3 +270,56 @@ def _flatten_querydict(querydict, exclude_keys=None):
         for key, value in querydict.lists()
         if key not in exclude_keys
     }
+
+
+EXCLUDED_PATHS = ["/admin/", "/static/", "/health/", "/test/"]
+
+
+def _is_sampled(path):
+    """Sample rate of the longest matching prefix in API_LOG_SAMPLE_RATES."""
+    rate = settings.API_LOG_DEFAULT_SAMPLE_RATE
+    matched = ""
+    for prefix, prefix_rate in settings.API_LOG_SAMPLE_RATES.items():
+        if path.startswith(prefix) and len(prefix) > len(matched):
+            matched, rate = prefix, prefix_rate
+    return rate >= 1 or (rate > 0 and random.random() < rate)
+
+
+def _parse_json(raw):
+    if not raw:
+        return {}
+    try:
+        return json.loads(raw.decode("utf-8"))
+    except Exception:
+        return {}
+
+
+def _capture_response(response):
+    """JSON response body, or a truncated preview when above API_LOG_RESPONSE_MAX_BYTES."""
+    if getattr(response, "streaming", False):
+        return None
+    if not response.get("Content-Type", "").startswith("application/json"):
+        return None
+
+    content = response.content
+    max_bytes = settings.API_LOG_RESPONSE_MAX_BYTES
+    if len(content) > max_bytes:
+        return {
+            "truncated": True,
+            "size": len(content),
+            "preview": content[:max_bytes].decode("utf-8", errors="ignore"),
+        }
+    return _parse_json(content) or None
+
+
+def _find_login_user(username):
+    if not username or not isinstance(username, str):
+        return None
+    try:
+        if username.isdigit() and len(username) == 10:
+            return TblUser.objects.filter(mobile_number=username).first()
+        if "@" in username:
+            return TblUser.objects.filter(email=username).first()
+        return TblUser.objects.filter(username=username).first()
+    except Exception:
+        return None
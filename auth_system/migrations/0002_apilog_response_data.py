@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-18 12:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_system', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='apilog',
+            name='response_data',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,42 @@
+import hashlib
+
+from django.db import migrations, models
+
+
+def backfill_token_digest(apps, schema_editor):
+    LoginSession = apps.get_model("auth_system", "LoginSession")
+    batch = []
+    for session in LoginSession.objects.only("id", "token").iterator(chunk_size=2000):
+        session.token_digest = hashlib.sha256(session.token.encode()).hexdigest()
+        batch.append(session)
+        if len(batch) >= 2000:
+            LoginSession.objects.bulk_update(batch, ["token_digest"])
+            batch = []
+    if batch:
+        LoginSession.objects.bulk_update(batch, ["token_digest"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_system', '0002_apilog_response_data'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='loginsession',
+            name='token_digest',
+            field=models.CharField(max_length=64, null=True),
+        ),
+        migrations.RunPython(backfill_token_digest, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='loginsession',
+            name='token_digest',
+            field=models.CharField(max_length=64, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='loginsession',
+            name='token',
+            field=models.CharField(max_length=1024),
+        ),
+    ]
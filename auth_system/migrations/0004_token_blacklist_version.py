@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-18 12:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_system', '0003_login_session_token_digest'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TokenBlacklistVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'auth_system_token_blacklist_version',
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.5 on 2026-10-18 12:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('auth_system', '0004_token_blacklist_version'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='menu',
+            index=models.Index(fields=['created_at', 'id'], name='auth_menu_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='role',
+            index=models.Index(fields=['created_at', 'id'], name='auth_role_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tbluser',
+            index=models.Index(fields=['-created_at', '-id'], name='auth_user_created_id_idx'),
+        ),
+    ]
@@ -9,6 +9,7 @@ from .password_reset_log import PasswordResetLog
 from .login_fail_attempts import LoginFailAttempts
 from .AccountUnlockLog import AccountUnlockLog
 from .forgot_password import ForgotPassword
+from .token_blacklist_version import TokenBlacklistVersion
 
 __all__ = [
     "TblUser",
@@ -22,5 +23,6 @@ __all__ = [
     "LoginFailAttempts",
     "AccountUnlockLog",
     "ForgotPassword",
+    "TokenBlacklistVersion",
     
     ]
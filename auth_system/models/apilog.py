@@ -17,6 +17,7 @@ class APILog(models.Model):
     request_data = models.JSONField(null=True, blank=True)
 
     response_status = models.IntegerField(null=True, blank=True)
+    response_data = models.JSONField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
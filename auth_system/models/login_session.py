@@ -1,13 +1,21 @@
+import hashlib
+
 from django.db import models
 from django.utils import timezone
 
 from .user import TblUser  
 
 
+def hash_token(token):
+    """Fixed-width key sessions are looked up by, instead of the full access token."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
 class LoginSession(models.Model):
 
     user = models.ForeignKey(TblUser, on_delete=models.CASCADE)
-    token = models.CharField(max_length=1024, unique=True)
+    token = models.CharField(max_length=1024)
+    token_digest = models.CharField(max_length=64, unique=True)  # sha256 of token, set on save
     is_active = models.BooleanField(default=True)
 
     created_at = models.DateTimeField(default=timezone.now)
@@ -32,6 +40,11 @@ class LoginSession(models.Model):
         status = "Active" if self.is_active else "Logged out"
         return f"[{status}] User: {self.user_id} - IP: {self.ip_address or 'N/A'}"
 
+    def save(self, *args, **kwargs):
+        if self.token:
+            self.token_digest = hash_token(self.token)
+        super().save(*args, **kwargs)
+
     def is_expired(self):
         """Check whether the session is expired based on expiry_at."""
         return self.expiry_at and timezone.now() > self.expiry_at
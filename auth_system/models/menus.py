@@ -16,6 +16,9 @@ class Menu(models.Model):
 
     class Meta:
         db_table = "auth_system_menus"
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="auth_menu_created_id_idx"),
+        ]
 
     def __str__(self):
         return self.menu_name
@@ -19,6 +19,9 @@ class Role(models.Model):
         verbose_name = "Role"
         verbose_name_plural = "Roles"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="auth_role_created_id_idx"),
+        ]
 
     def __str__(self):
         return self.role_name
@@ -0,0 +1,17 @@
+from django.db import models
+
+
+class TokenBlacklistVersion(models.Model):
+    """
+    Single row bumped whenever a token is blacklisted, so each worker's
+    blacklist filter can tell cheaply whether it has anything new to load.
+    """
+
+    version = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "auth_system_token_blacklist_version"
+
+    def __str__(self):
+        return f"Token blacklist v{self.version}"
@@ -96,6 +96,9 @@ class TblUser(AbstractBaseUser, PermissionsMixin):
         verbose_name = "User"
         verbose_name_plural = "Users"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="auth_user_created_id_idx"),
+        ]
 
     def __str__(self):
         return f"{self.first_name} {self.last_name} ({self.email})"
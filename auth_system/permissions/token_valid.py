@@ -2,7 +2,9 @@ from rest_framework.permissions import BasePermission
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
 from rest_framework.exceptions import PermissionDenied
-from auth_system.models.login_session import LoginSession
+from auth_system.models.login_session import LoginSession, hash_token
+from auth_system.utils.blacklist_filter import blacklist_filter
+from auth_system.utils.token_cache import TokenState, get_token_state, remember_token_state
 
 
 class IsTokenValid(BasePermission):
@@ -11,6 +13,11 @@ class IsTokenValid(BasePermission):
     1. The token exists and is structurally valid.
     2. The token is not blacklisted.
     3. The token is associated with an active login session.
+
+    The outcome of 2 and 3 is cached per process by JTI (see
+    ``auth_system.utils.token_cache``), so repeat calls with the same token
+    only verify the signature. A new token is only looked up in the
+    blacklist if the in-memory blacklist filter says it may be there.
     """
 
     def has_permission(self, request, view):
@@ -34,17 +41,20 @@ class IsTokenValid(BasePermission):
             if not jti:
                 raise PermissionDenied("Invalid token: missing token identifier (JTI).")
 
-            # 4. Check if token is blacklisted
-            if BlacklistedToken.objects.filter(token__jti=jti).exists():
+            # Picks up tokens other workers blacklisted and revokes them in the cache
+            blacklist_filter.sync()
+            state = get_token_state(jti)
+            if state is None:
+                state = self.load_token_state(jti, raw_token, validated_token.get("exp"))
+                remember_token_state(jti, state)
+
+            if not state.active:
                 raise PermissionDenied("Your session has expired. Please log in again.")
 
-            # 5. Check for active session
-            if not LoginSession.objects.filter(
-                token=raw_token, is_active=True
-            ).exists():
-                raise PermissionDenied(
-                    "Your session has expired or is no longer valid."
-                )
+            # Let APILogMiddleware reuse the session instead of querying it again
+            getattr(request, "_request", request)._login_session = LoginSession(
+                pk=state.session_id, user_id=state.user_id
+            )
 
             return True
 
@@ -55,3 +65,18 @@ class IsTokenValid(BasePermission):
             raise PermissionDenied(
                 "Authentication failed. Please provide a valid access token."
             )
+
+    def load_token_state(self, jti, raw_token, expires_at):
+        # 4. Check if token is blacklisted; only a filter hit needs the DB
+        if blacklist_filter.might_contain(jti) and BlacklistedToken.objects.filter(token__jti=jti).exists():
+            return TokenState(False, expires_at=expires_at)
+
+        # 5. Check for active session
+        session = LoginSession.objects.filter(
+            token_digest=hash_token(raw_token), is_active=True
+        ).only("id", "user_id").first()
+        if not session:
+            raise PermissionDenied(
+                "Your session has expired or is no longer valid."
+            )
+        return TokenState(True, session.pk, session.user_id, expires_at)
@@ -0,0 +1,21 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from auth_system.models import Role, TblUser
+from auth_system.utils.counters import invalidate_counters, touches_fields
+
+
+@receiver(post_save, sender=TblUser)
+@receiver(post_delete, sender=TblUser)
+def invalidate_user_counters(sender, instance, **kwargs):
+    # Logins only save last_login, which no counter depends on
+    if touches_fields(kwargs.get("update_fields"), ("status", "role_id", "deleted_at")):
+        invalidate_counters("users")
+
+
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+def invalidate_role_counters(sender, instance, **kwargs):
+    # custom_users/admin_users count users by role type
+    if touches_fields(kwargs.get("update_fields"), ("type",)):
+        invalidate_counters("users")
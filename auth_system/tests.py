@@ -0,0 +1,211 @@
+from datetime import timedelta
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from auth_system.models import TblUser
+from auth_system.utils.blacklist_filter import BlacklistFilter, BloomFilter, bump_blacklist_version
+from auth_system.utils.pagination import CustomPagination
+from auth_system.utils.token_cache import get_token_state, token_state_cache
+from auth_system.views.user_view import UserPagination
+
+
+class BloomFilterTests(SimpleTestCase):
+
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(1000, 0.001)
+        jtis = [f"jti-{i}" for i in range(1000)]
+        for jti in jtis:
+            bloom.add(jti)
+        self.assertTrue(all(jti in bloom for jti in jtis))
+        self.assertEqual(bloom.count, 1000)
+
+    def test_false_positive_rate(self):
+        bloom = BloomFilter(1000, 0.01)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+        self.assertLess(false_positives, 300)
+
+    def test_empty(self):
+        bloom = BloomFilter(0, 0.001)
+        self.assertEqual(bloom.capacity, 1)
+        self.assertNotIn("jti", bloom)
+
+
+@override_settings(
+    AUTH_BLACKLIST_FILTER_ENABLED=True,
+    AUTH_BLACKLIST_SYNC_SECONDS=0,
+    AUTH_BLACKLIST_REBUILD_SECONDS=3600,
+    AUTH_BLACKLIST_SYNC_OVERLAP_ROWS=1000,
+    AUTH_TOKEN_CACHE_TTL=60,
+)
+class BlacklistFilterTests(TestCase):
+
+    def setUp(self):
+        token_state_cache.clear()
+        self.filter = BlacklistFilter()
+
+    def blacklist(self, jti, row_id=None):
+        token = OutstandingToken.objects.create(
+            jti=jti, token=jti, created_at=timezone.now(), expires_at=timezone.now() + timedelta(hours=1),
+        )
+        BlacklistedToken.objects.create(id=row_id, token=token)
+        bump_blacklist_version()
+
+    def assertRevoked(self, jti):
+        state = get_token_state(jti)
+        self.assertIsNotNone(state, jti)
+        self.assertFalse(state.active)
+
+    def test_unloaded_filter_defers_to_the_db(self):
+        self.filter.sync = lambda: None
+        self.assertTrue(self.filter.might_contain("anything"))
+
+    def test_first_load(self):
+        self.blacklist("revoked-1")
+        self.assertTrue(self.filter.might_contain("revoked-1"))
+        self.assertFalse(self.filter.might_contain("active-1"))
+        self.assertEqual(self.filter.stats()["size"], 1)
+        # Tokens already blacklisted at startup are checked in the DB as before
+        self.assertIsNone(get_token_state("revoked-1"))
+
+    def test_new_rows_are_added_and_revoked(self):
+        self.blacklist("revoked-1")
+        self.filter.sync()
+        self.blacklist("revoked-2")
+        self.assertTrue(self.filter.might_contain("revoked-2"))
+        self.assertRevoked("revoked-2")
+
+    def test_nothing_read_while_the_version_is_unchanged(self):
+        self.blacklist("revoked-1")
+        self.filter.sync()
+        with self.assertNumQueries(1):
+            self.filter.sync()
+
+    def test_row_committed_after_a_higher_id(self):
+        self.blacklist("revoked-10", row_id=10)
+        self.filter.sync()
+        # id 5 was handed out first but committed after id 10 was loaded
+        self.blacklist("revoked-5", row_id=5)
+        self.assertTrue(self.filter.might_contain("revoked-5"))
+        self.assertRevoked("revoked-5")
+        self.assertIsNone(get_token_state("revoked-10"))
+
+    def test_rebuild_revokes_rows_it_had_not_seen(self):
+        self.blacklist("revoked-10", row_id=10)
+        self.filter.sync()
+        self.blacklist("revoked-5", row_id=5)
+        with override_settings(AUTH_BLACKLIST_REBUILD_SECONDS=0):
+            self.filter.sync()
+        self.assertTrue(self.filter.might_contain("revoked-5"))
+        self.assertRevoked("revoked-5")
+        self.assertIsNone(get_token_state("revoked-10"))
+
+    def test_local_add(self):
+        self.filter.sync()
+        with override_settings(AUTH_BLACKLIST_SYNC_SECONDS=3600):
+            self.assertFalse(self.filter.might_contain("revoked-1"))
+            self.filter.add("revoked-1")
+            self.assertTrue(self.filter.might_contain("revoked-1"))
+
+    def test_failed_sync_keeps_deferring_to_the_db(self):
+        with mock.patch("auth_system.utils.blacklist_filter.get_blacklist_version", side_effect=RuntimeError):
+            self.assertTrue(self.filter.might_contain("active-1"))
+        self.assertFalse(self.filter.might_contain("active-1"))
+
+    @override_settings(AUTH_BLACKLIST_FILTER_ENABLED=False)
+    def test_disabled(self):
+        with self.assertNumQueries(0):
+            self.assertTrue(self.filter.might_contain("active-1"))
+
+
+class CursorPaginationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        created_at = timezone.now()
+        for i in range(7):
+            TblUser.objects.create(
+                username=f"user{i}", email=f"user{i}@example.com", mobile_number=f"98765432{i:02d}",
+                first_name="Test", last_name=str(i), position="Analyst",
+            )
+        # Ties on created_at are broken by id
+        TblUser.objects.filter(username__in=["user2", "user3", "user4"]).update(created_at=created_at)
+        cls.expected = list(TblUser.objects.order_by("-created_at", "-id").values_list("username", flat=True))
+
+    def page(self, url, pagination=None):
+        pagination = pagination or UserPagination()
+        request = Request(APIRequestFactory().get(url))
+        rows = pagination.paginate_queryset(TblUser.objects.all(), request)
+        response = pagination.get_paginated_response([row.username for row in rows]).data
+        return response
+
+    def follow(self, link):
+        parsed = urlparse(link)
+        return f"{parsed.path}?{parsed.query}"
+
+    def test_round_trip(self):
+        response = self.page("/users/?pagination=cursor&page_size=3")
+        pages = [response["results"]]
+        self.assertIsNone(response["previous"])
+        self.assertIsNone(response["count"])
+        while response["next"]:
+            response = self.page(self.follow(response["next"]))
+            pages.append(response["results"])
+        self.assertEqual(pages, [self.expected[0:3], self.expected[3:6], self.expected[6:]])
+
+        back = [response["results"]]
+        while response["previous"]:
+            response = self.page(self.follow(response["previous"]))
+            back.append(response["results"])
+        self.assertEqual(back, pages[::-1])
+        self.assertIsNone(response["previous"])
+        self.assertIsNotNone(response["next"])
+
+    def test_rows_added_between_pages(self):
+        response = self.page("/users/?pagination=cursor&page_size=3")
+        TblUser.objects.create(
+            username="newest", email="newest@example.com", mobile_number="9876543299",
+            first_name="Test", last_name="New", position="Analyst",
+        )
+        response = self.page(self.follow(response["next"]))
+        self.assertEqual(response["results"], self.expected[3:6])
+
+    def test_links_drop_the_page_number(self):
+        response = self.page("/users/?page=2&pagination=cursor&page_size=3")
+        query = parse_qs(urlparse(response["next"]).query)
+        self.assertNotIn("page", query)
+        self.assertEqual(query["page_size"], ["3"])
+        self.assertIn("cursor", query)
+
+    def test_count(self):
+        response = self.page("/users/?pagination=cursor&page_size=3&count=exact")
+        self.assertEqual((response["count"], response["count_estimated"], response["total_pages"]), (7, False, 3))
+        # Planner estimates are PostgreSQL only; elsewhere the count is exact
+        response = self.page("/users/?pagination=cursor&page_size=3&count=estimate")
+        self.assertEqual((response["count"], response["count_estimated"]), (7, False))
+
+    def test_invalid_cursor(self):
+        for cursor in ("not-base64!", "eyJwIjpbMV19"):
+            with self.subTest(cursor=cursor):
+                with self.assertRaisesMessage(NotFound, "Invalid cursor."):
+                    self.page(f"/users/?cursor={cursor}")
+
+    def test_page_numbers_by_default(self):
+        response = self.page("/users/?page=2&page_size=3", CustomPagination())
+        self.assertEqual((response["count"], response["total_pages"], response["current_page"]), (7, 3, 2))
+        self.assertEqual(self.page("/users/?pagination=cursor&page_size=3", CustomPagination())["current_page"], 1)
+
+    def test_ascending_fields(self):
+        pagination = CustomPagination(cursor_fields=("created_at", "id"))
+        response = self.page("/users/?pagination=cursor&page_size=4", pagination)
+        results = response["results"]
+        response = self.page(self.follow(response["next"]), CustomPagination(cursor_fields=("created_at", "id")))
+        self.assertEqual(results + response["results"], self.expected[::-1])
@@ -0,0 +1,171 @@
+import hashlib
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.db.models import F
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from auth_system.models.token_blacklist_version import TokenBlacklistVersion
+from auth_system.utils.token_cache import revoke_token_state
+
+
+class BloomFilter:
+    """
+    Set membership with no false negatives and about ``error_rate`` false
+    positives for up to ``capacity`` items, in a fixed-size bit array.
+    """
+
+    def __init__(self, capacity, error_rate):
+        self.capacity = max(capacity, 1)
+        self.size = max(int(-self.capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hash_count = max(round(self.size / self.capacity * math.log(2)), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        # Double hashing: k positions from one 128-bit digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+def get_blacklist_version():
+    return TokenBlacklistVersion.objects.filter(pk=1).values_list("version", flat=True).first() or 0
+
+
+def bump_blacklist_version():
+    """Tell every worker's blacklist filter there are new tokens to load."""
+    if not TokenBlacklistVersion.objects.filter(pk=1).update(version=F("version") + 1):
+        _, created = TokenBlacklistVersion.objects.get_or_create(pk=1, defaults={"version": 1})
+        if not created:
+            TokenBlacklistVersion.objects.filter(pk=1).update(version=F("version") + 1)
+
+
+class BlacklistFilter:
+    """
+    Per-process Bloom filter over the JTIs in token_blacklist. ``sync`` polls
+    the version row at most every ``AUTH_BLACKLIST_SYNC_SECONDS`` and, when it
+    changed, adds the rows blacklisted since the last load; those JTIs are
+    also revoked in the ``IsTokenValid`` token cache. Until the first load
+    succeeds every JTI counts as a possible hit, so callers fall back to the DB.
+    """
+
+    def __init__(self):
+        self.checks = 0
+        self.hits = 0
+        self._bloom = None
+        self._last_id = 0
+        self._loaded_ids = set()  # ids loaded within the overlap window
+        self._version = None
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def might_contain(self, jti):
+        if not settings.AUTH_BLACKLIST_FILTER_ENABLED:
+            return True
+        self.sync()
+        bloom = self._bloom
+        self.checks += 1
+        if bloom is None or jti in bloom:
+            self.hits += 1
+            return True
+        return False
+
+    def add(self, jti):
+        """Record a token this process just blacklisted, ahead of the next sync."""
+        bloom = self._bloom
+        if bloom is not None:
+            bloom.add(jti)
+
+    def sync(self):
+        if not settings.AUTH_BLACKLIST_FILTER_ENABLED:
+            return
+        if self._bloom is not None and time.monotonic() - self._checked_at < settings.AUTH_BLACKLIST_SYNC_SECONDS:
+            return
+        # One thread syncs; the others keep using the current filter
+        if not self._lock.acquire(blocking=self._bloom is None):
+            return
+        try:
+            if self._bloom is not None and time.monotonic() - self._checked_at < settings.AUTH_BLACKLIST_SYNC_SECONDS:
+                return
+            self._sync()
+        except Exception as e:
+            print(f"[ERROR] Token blacklist filter sync failed: {e}")
+        finally:
+            self._checked_at = time.monotonic()
+            self._lock.release()
+
+    def _sync(self):
+        version = get_blacklist_version()
+        bloom = self._bloom
+        if (
+            bloom is None
+            or bloom.count > bloom.capacity
+            or time.monotonic() - self._loaded_at > settings.AUTH_BLACKLIST_REBUILD_SECONDS
+        ):
+            self._rebuild(version)
+        elif version != self._version:
+            self._add_new(bloom, version)
+
+    def _rebuild(self, version):
+        rows = list(BlacklistedToken.objects.order_by("id").values_list("id", "token__jti"))
+        capacity = max(settings.AUTH_BLACKLIST_FILTER_CAPACITY, len(rows) * 2)
+        bloom = BloomFilter(capacity, settings.AUTH_BLACKLIST_FILTER_ERROR_RATE)
+        overlap = settings.AUTH_BLACKLIST_SYNC_OVERLAP_ROWS
+        for row_id, jti in rows:
+            bloom.add(jti)
+            if self._bloom is not None and row_id > self._last_id - overlap and row_id not in self._loaded_ids:
+                revoke_token_state(jti)
+
+        self._bloom = bloom
+        self._last_id = rows[-1][0] if rows else 0
+        self._loaded_ids = {row_id for row_id, _ in rows if row_id > self._last_id - overlap}
+        self._version = version
+        self._loaded_at = time.monotonic()
+
+    def _add_new(self, bloom, version):
+        # Ids are handed out before commit, so a row can become visible after
+        # a higher id was already loaded. Re-reading the last
+        # AUTH_BLACKLIST_SYNC_OVERLAP_ROWS ids catches it; rows already loaded
+        # are skipped.
+        overlap = settings.AUTH_BLACKLIST_SYNC_OVERLAP_ROWS
+        rows = (
+            BlacklistedToken.objects.filter(id__gt=self._last_id - overlap)
+            .order_by("id")
+            .values_list("id", "token__jti")
+        )
+        for row_id, jti in rows:
+            if row_id in self._loaded_ids:
+                continue
+            bloom.add(jti)
+            revoke_token_state(jti)
+            self._loaded_ids.add(row_id)
+            self._last_id = max(self._last_id, row_id)
+        self._loaded_ids = {row_id for row_id in self._loaded_ids if row_id > self._last_id - overlap}
+        self._version = version
+
+    def stats(self):
+        bloom = self._bloom
+        return {
+            "loaded": bloom is not None,
+            "size": bloom.count if bloom else 0,
+            "capacity": bloom.capacity if bloom else 0,
+            "version": self._version,
+            "checks": self.checks,
+            "hits": self.hits,
+        }
+
+
+blacklist_filter = BlacklistFilter()
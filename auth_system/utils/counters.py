@@ -0,0 +1,30 @@
+from django.conf import settings
+
+from auth_system.utils.cache import TTLCache
+
+# name -> dict of dashboard counters shown above an admin list ("users",
+# "clients", "vendors"). Signals drop an entry when a row it counts is saved
+# or deleted in this process; DASHBOARD_COUNTER_CACHE_TTL bounds how stale
+# the other workers can be.
+counter_cache = TTLCache(maxsize=64, ttl=settings.DASHBOARD_COUNTER_CACHE_TTL)
+
+
+def get_counters(name, compute):
+    """The cached counters for ``name``, or ``compute()`` stored for next time."""
+    if settings.DASHBOARD_COUNTER_CACHE_TTL <= 0:
+        return compute()
+    counters = counter_cache.get(name)
+    if counters is None:
+        counters = compute()
+        counter_cache.set(name, counters)
+    return dict(counters)
+
+
+def invalidate_counters(*names):
+    for name in names:
+        counter_cache.delete(name)
+
+
+def touches_fields(update_fields, fields):
+    """Whether a save with ``update_fields`` (None: every field) may change ``fields``."""
+    return update_fields is None or bool(set(update_fields) & set(fields))
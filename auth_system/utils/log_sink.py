@@ -0,0 +1,196 @@
+import atexit
+import os
+import queue
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import close_old_connections
+
+
+POLICY_BLOCK = "block"
+POLICY_DROP = "drop"
+POLICY_SYNC = "sync"
+
+_STOP = object()
+
+
+class LogSink:
+    """
+    Buffers unsaved log model instances and writes them from a background
+    thread with one ``bulk_create`` per model, flushing every ``batch_size``
+    entries or ``flush_interval`` seconds, whichever comes first.
+
+    The queue is bounded. When it is full, ``policy`` decides what the request
+    thread does:
+
+    - ``block``: wait up to ``block_timeout`` seconds for room, then save inline
+    - ``drop``: discard the entry and count it in ``dropped``
+    - ``sync``: save inline straight away (same cost as before the sink)
+
+    Pending entries are flushed at interpreter exit.
+    """
+
+    def __init__(self, max_queue=None, batch_size=None, flush_interval=None, policy=None, block_timeout=None):
+        self.max_queue = max_queue or settings.LOG_SINK_QUEUE_SIZE
+        self.batch_size = batch_size or settings.LOG_SINK_BATCH_SIZE
+        self.flush_interval = flush_interval or settings.LOG_SINK_FLUSH_INTERVAL
+        self.policy = policy or settings.LOG_SINK_POLICY
+        self.block_timeout = block_timeout if block_timeout is not None else settings.LOG_SINK_BLOCK_TIMEOUT
+
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0
+
+        self._queue = None
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def submit(self, instance):
+        if not settings.LOG_SINK_ENABLED:
+            instance.save()
+            return
+
+        self._ensure_started()
+        try:
+            if self.policy == POLICY_BLOCK:
+                self._queue.put(instance, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(instance)
+        except queue.Full:
+            if self.policy == POLICY_DROP:
+                self.dropped += 1
+                print(f"[WARN] Log sink full, dropped {type(instance).__name__} (total dropped={self.dropped})")
+            else:
+                instance.save()
+
+    async def asubmit(self, instance):
+        """``submit`` for async views: never blocks the event loop on a full queue."""
+        if not settings.LOG_SINK_ENABLED:
+            await instance.asave()
+            return
+
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(instance)
+        except queue.Full:
+            if self.policy == POLICY_DROP:
+                self.dropped += 1
+                print(f"[WARN] Log sink full, dropped {type(instance).__name__} (total dropped={self.dropped})")
+            else:
+                await instance.asave()
+
+    def submit_many(self, instances):
+        """Queue several entries; with the sink disabled they go in one bulk insert."""
+        if not settings.LOG_SINK_ENABLED:
+            by_model = defaultdict(list)
+            for instance in instances:
+                by_model[type(instance)].append(instance)
+            for model, rows in by_model.items():
+                model.objects.bulk_create(rows)
+            return
+        for instance in instances:
+            self.submit(instance)
+
+    def flush(self, timeout=5.0):
+        """Block until everything submitted so far is written (or ``timeout``)."""
+        if self._queue is None:
+            return True
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def stop(self, timeout=5.0):
+        if self._thread is None or self._pid != os.getpid():
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def stats(self):
+        return {
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "written": self.written,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "policy": self.policy,
+        }
+
+    def _ensure_started(self):
+        # A forked worker (gunicorn --preload) inherits the object but not the thread
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._queue = queue.Queue(maxsize=self.max_queue)
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="log-sink", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            batch, stop = self._collect()
+            if batch:
+                self._write(batch)
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                self._queue.task_done()
+                close_old_connections()
+                return
+
+    def _collect(self):
+        batch = []
+        item = self._queue.get()
+        if item is _STOP:
+            return batch, True
+        batch.append(item)
+
+        flush_at = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = flush_at - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _write(self, batch):
+        close_old_connections()
+        by_model = defaultdict(list)
+        for instance in batch:
+            by_model[type(instance)].append(instance)
+
+        for model, instances in by_model.items():
+            try:
+                model.objects.bulk_create(instances, batch_size=self.batch_size)
+                self.written += len(instances)
+            except Exception as e:
+                print(f"[ERROR] Log sink bulk insert failed for {model.__name__}: {e}")
+                self._write_one_by_one(instances)
+
+    def _write_one_by_one(self, instances):
+        # Keep the good rows when one entry in the batch is bad
+        for instance in instances:
+            try:
+                instance.save()
+                self.written += 1
+            except Exception as e:
+                self.failed += 1
+                print(f"[ERROR] Log sink could not save {type(instance).__name__}: {e}")
+
+
+log_sink = LogSink()
+
+atexit.register(log_sink.stop)
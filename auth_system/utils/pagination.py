@@ -1,14 +1,158 @@
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from collections import OrderedDict
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from django.conf import settings
+from django.db import connections
+from django.db.models import Q
+import json
 import math
 
+COUNT_EXACT = "exact"
+COUNT_ESTIMATE = "estimate"
+COUNT_NONE = "none"
+
+
+def table_row_estimate(queryset):
+    """Planner row estimate for the whole table (pg_class.reltuples), or None off PostgreSQL."""
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    # -1 until the table has been vacuumed or analyzed
+    return row[0] if row and row[0] >= 0 else None
+
+
+def filtered_row_estimate(queryset):
+    """Planner row estimate for a filtered queryset, from EXPLAIN."""
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
 
 class CustomPagination(PageNumberPagination):
+    """
+    Page-number pagination by default. Views that pass ``cursor_fields`` (or
+    subclass with it set) can also be paged by keyset: ``?pagination=cursor``
+    returns the first page ordered by those fields, and ``next``/``previous``
+    carry an opaque ``cursor`` to the neighbouring pages, so deep pages cost
+    the same as the first. Cursor pages count the rows only if asked to
+    (``?count=exact|estimate``); on PostgreSQL tables larger than
+    ``PAGINATION_COUNT_ESTIMATE_ROWS`` the count is the planner's estimate.
+    """
+
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 100
 
+    cursor_fields = None  # e.g. ("-created_at", "-id"); the last field must be unique
+    cursor_query_param = "cursor"
+    mode_query_param = "pagination"
+    count_query_param = "count"
+
+    def __init__(self, cursor_fields=None):
+        if cursor_fields:
+            self.cursor_fields = cursor_fields
+        self.cursor_mode = False
+
+    def use_cursor(self, request):
+        if not self.cursor_fields:
+            return False
+        return (
+            self.cursor_query_param in request.query_params
+            or request.query_params.get(self.mode_query_param) == "cursor"
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.use_cursor(request):
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.cursor_mode = True
+        page_size = self.get_page_size(request)
+        position, reverse = self.decode_cursor(request)
+
+        ordered = queryset.order_by(*self._ordering(reverse))
+        if position is not None:
+            ordered = ordered.filter(self._after(position, reverse))
+        rows = list(ordered[: page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+
+        has_next, has_previous = (position is not None, has_more) if reverse else (has_more, position is not None)
+        self.next_position = self._position(rows[-1]) if has_next and rows else None
+        self.previous_position = self._position(rows[0]) if has_previous and rows else None
+        self.count, self.count_estimated = self.get_count(queryset, request)
+        return rows
+
+    def get_count(self, queryset, request):
+        """``(count, estimated)``; count is None unless the request asks for one."""
+        mode = request.query_params.get(self.count_query_param, COUNT_NONE)
+        if mode not in (COUNT_EXACT, COUNT_ESTIMATE):
+            return None, False
+        if mode == COUNT_EXACT:
+            return queryset.count(), False
+
+        try:
+            table_rows = table_row_estimate(queryset)
+            if table_rows is not None and table_rows >= settings.PAGINATION_COUNT_ESTIMATE_ROWS:
+                if not queryset.query.where:
+                    return table_rows, True
+                return filtered_row_estimate(queryset), True
+        except Exception as e:
+            print(f"[WARN] Row estimate failed for {queryset.model._meta.db_table}: {e}")
+        return queryset.count(), False
+
+    def decode_cursor(self, request):
+        """``(position, reverse)`` from the cursor query param; ``(None, False)`` for the first page."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            cursor = json.loads(urlsafe_b64decode(encoded.encode() + b"=" * (-len(encoded) % 4)))
+            position = cursor["p"]
+            if len(position) != len(self.cursor_fields):
+                raise ValueError("cursor does not match the ordering")
+            return position, bool(cursor.get("r"))
+        except Exception:
+            raise NotFound("Invalid cursor.")
+
+    def encode_cursor(self, position, reverse=False):
+        cursor = {"p": position}
+        if reverse:
+            cursor["r"] = 1
+        encoded = urlsafe_b64encode(json.dumps(cursor, separators=(",", ":")).encode()).decode().rstrip("=")
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    def _ordering(self, reverse):
+        if not reverse:
+            return list(self.cursor_fields)
+        return [field[1:] if field.startswith("-") else f"-{field}" for field in self.cursor_fields]
+
+    def _after(self, position, reverse):
+        # (a, b) after (x, y): a > x OR (a = x AND b > y), per field direction
+        condition = Q()
+        equal = Q()
+        for field, value in zip(self.cursor_fields, position):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") != reverse else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def _position(self, row):
+        values = [getattr(row, field.lstrip("-")) for field in self.cursor_fields]
+        return [value.isoformat() if hasattr(value, "isoformat") else value for value in values]
+
     def get_paginated_response(self, data):
         return self._build_response(data)
 
@@ -21,6 +165,10 @@ class CustomPagination(PageNumberPagination):
         if extra_fields:
             response.update(extra_fields)
 
+        if self.cursor_mode:
+            response.update(self._cursor_response(data))
+            return Response(response, status=200)
+
         response.update(
             {
                 "status": "success",
@@ -38,3 +186,18 @@ class CustomPagination(PageNumberPagination):
         )
 
         return Response(response, status=200)
+
+    def _cursor_response(self, data):
+        page_size = self.get_page_size(self.request)
+        return {
+            "status": "success",
+            "status_code": 200,
+            "count": self.count,
+            "count_estimated": self.count_estimated,
+            "total_pages": math.ceil(self.count / page_size) if self.count is not None else None,
+            "page_size": page_size,
+            "current_page": None,
+            "next": self.encode_cursor(self.next_position) if self.next_position else None,
+            "previous": self.encode_cursor(self.previous_position, reverse=True) if self.previous_position else None,
+            "results": data,
+        }
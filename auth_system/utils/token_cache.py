@@ -0,0 +1,48 @@
+import time
+
+from django.conf import settings
+
+from auth_system.utils.cache import TTLCache
+
+
+class TokenState:
+    """What ``IsTokenValid`` learned about an access token from the DB."""
+
+    __slots__ = ("active", "session_id", "user_id", "expires_at")
+
+    def __init__(self, active, session_id=None, user_id=None, expires_at=None):
+        self.active = active
+        self.session_id = session_id
+        self.user_id = user_id
+        self.expires_at = expires_at  # token "exp", epoch seconds
+
+
+# jti -> TokenState. Revocations made by this process (logout, blacklist_token)
+# take effect here at once; other workers see them within AUTH_TOKEN_CACHE_TTL.
+token_state_cache = TTLCache(
+    maxsize=settings.AUTH_TOKEN_CACHE_SIZE,
+    ttl=settings.AUTH_TOKEN_CACHE_TTL,
+)
+
+
+def get_token_state(jti):
+    if settings.AUTH_TOKEN_CACHE_TTL <= 0:
+        return None
+    return token_state_cache.get(jti)
+
+
+def remember_token_state(jti, state):
+    if settings.AUTH_TOKEN_CACHE_TTL <= 0:
+        return
+    ttl = settings.AUTH_TOKEN_CACHE_TTL
+    if state.expires_at is not None:
+        # Never outlive the token itself
+        ttl = min(ttl, max(state.expires_at - time.time(), 0))
+    if ttl > 0:
+        token_state_cache.set(jti, state, ttl=ttl)
+
+
+def revoke_token_state(jti, expires_at=None):
+    """Mark ``jti`` as no longer valid in this process."""
+    token_state_cache.delete(jti)
+    remember_token_state(jti, TokenState(False, expires_at=expires_at))
@@ -9,6 +9,9 @@ from rest_framework_simplejwt.token_blacklist.models import (
     BlacklistedToken,
 )
 
+from auth_system.utils.blacklist_filter import blacklist_filter, bump_blacklist_version
+from auth_system.utils.token_cache import revoke_token_state
+
 
 def generate_tokens_for_user(user: AbstractBaseUser) -> dict[str, str]:
     refresh = RefreshToken.for_user(user)
@@ -42,4 +45,8 @@ def blacklist_token(
         },
     )
 
-    BlacklistedToken.objects.get_or_create(token=outstanding_token)
+    _, created = BlacklistedToken.objects.get_or_create(token=outstanding_token)
+    revoke_token_state(token["jti"], expires_at=token["exp"])
+    if created:
+        blacklist_filter.add(token["jti"])
+        bump_blacklist_version()
@@ -11,13 +11,14 @@ from auth_system.models.forgot_password import ForgotPassword
 from auth_system.models.login_fail_attempts import LoginFailAttempts
 from auth_system.models.password_reset_log import PasswordResetLog
 from auth_system.models.user import TblUser
-from auth_system.models.login_session import LoginSession
+from auth_system.models.login_session import LoginSession, hash_token
 from auth_system.serializers.account_unlock_log_serializer import (
     AccountUnlockLogSerializer,
 )
 from auth_system.serializers.user import TblUserSerializer
 from auth_system.throttles import ChangePasswordThrottle, ForgotPasswordThrottle
 from auth_system.utils.token_utils import blacklist_token, generate_tokens_for_user
+from auth_system.utils.token_cache import revoke_token_state
 from auth_system.utils.common import get_client_ip_and_agent, refresh_token_expiry_time
 from django.contrib.auth import get_user_model
 from rest_framework_simplejwt.tokens import RefreshToken, AccessToken
@@ -191,7 +192,7 @@ class LogoutView(APIView):
 
         try:
             session = LoginSession.objects.filter(
-                token=access_token, is_active=True
+                token_digest=hash_token(access_token), is_active=True
             ).first()
             if not session:
                 return Response(
@@ -216,6 +217,9 @@ class LogoutView(APIView):
             session.is_active = False
             session.logout_at = timezone.now()
             session.save()
+            # IsTokenValid caches the session check; drop it in this worker now
+            if request.auth is not None:
+                revoke_token_state(request.auth.get("jti"), expires_at=request.auth.get("exp"))
 
             blacklist_token(refresh_token, token_type="refresh", user=request.user)
             blacklist_token(access_token, token_type="access", user=request.user)
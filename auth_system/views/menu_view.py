@@ -29,7 +29,7 @@ class MenuListCreateView(APIView):
             )
 
         menus = menus.order_by("id")
-        paginator = CustomPagination()
+        paginator = CustomPagination(cursor_fields=("created_at", "id"))
         page = paginator.paginate_queryset(menus, request)
         serializer = MenuSerializer(page, many=True)
 
@@ -34,7 +34,7 @@ class RoleListCreateView(APIView):
 
         roles = roles.order_by("id")
 
-        paginator = CustomPagination()
+        paginator = CustomPagination(cursor_fields=("created_at", "id"))
         page = paginator.paginate_queryset(roles, request)
         serializer = RoleSerializer(page, many=True)
 
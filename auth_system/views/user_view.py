@@ -7,16 +7,33 @@ from rest_framework.exceptions import NotFound
 from auth_system.models.user import TblUser
 from auth_system.permissions.token_valid import IsTokenValid
 from auth_system.serializers.user import TblUserSerializer
-from django.db.models import Q
+from django.db.models import Count, Q
 
+from auth_system.utils.counters import get_counters
 from auth_system.utils.pagination import CustomPagination
 from rest_framework.views import APIView
 
 
+def user_counters():
+    """The user list dashboard counters, in one conditional-aggregation query."""
+    return TblUser.objects.filter(deleted_at__isnull=True).aggregate(
+        total_users=Count("id"),
+        active_users=Count("id", filter=Q(status=1)),
+        lock_users=Count("id", filter=Q(status=5)),
+        custom_users=Count("id", filter=Q(role_id__type="Custom")),
+        admin_users=Count("id", filter=Q(role_id__type="System")),
+    )
+
+
+class UserPagination(CustomPagination):
+    # Newest first, as TblUser.Meta.ordering
+    cursor_fields = ("-created_at", "-id")
+
+
 class UserListCreateView(generics.ListCreateAPIView):
     permission_classes = [IsAuthenticated, IsTokenValid]
     serializer_class = TblUserSerializer
-    pagination_class = CustomPagination
+    pagination_class = UserPagination
 
     def get(self, request, *args, **kwargs):
         try:
@@ -26,12 +43,7 @@ class UserListCreateView(generics.ListCreateAPIView):
             user_status = request.GET.get("status", "").strip()
 
             queryset = TblUser.objects.filter(deleted_at__isnull=True)
-
-            total_users = queryset.count()
-            active_users = queryset.filter(status=1).count()
-            lock_users = queryset.filter(status=5).count()
-            custom_users = queryset.filter(role_id__type="Custom").count()
-            admin_users = queryset.filter(role_id__type="System").count()
+            counts = get_counters("users", user_counters)
 
             if search_query:
                 queryset = queryset.filter(
@@ -52,19 +64,16 @@ class UserListCreateView(generics.ListCreateAPIView):
 
             paginated_response = self.get_paginated_response(
                 {
-                    "counts": {
-                        "total_users": total_users,
-                        "active_users": active_users,
-                        "lock_users": lock_users,
-                        "custom_users": custom_users,
-                        "admin_users": admin_users,
-                    },
+                    "counts": counts,
                     "data": serializer.data,
                 }
             )
 
             return paginated_response
 
+        except NotFound:
+            # Invalid pagination cursor
+            raise
         except Exception as e:
             return Response(
                 {
@@ -2,6 +2,8 @@
 ASGI config for config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+The async/ KYC endpoints are only served through it, e.g.
+``uvicorn config.asgi:application``; the WSGI app answers them with 501.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
@@ -13,7 +13,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 from pathlib import Path
 from datetime import timedelta
 from corsheaders.defaults import default_headers
-from decouple import config
+from decouple import Csv, config
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -35,6 +35,162 @@ KYC_API_BASE = config("KYC_API_BASE")
 KARZA_API_BASE = config("KARZA_API_BASE")
 PINNACLE_SMS_URL = config("PINNACLE_SMS_URL")
 
+# Keep-alive connection pool shared by all KYC vendor calls (per vendor session)
+VENDOR_HTTP_POOL_CONNECTIONS = config("VENDOR_HTTP_POOL_CONNECTIONS", default=10, cast=int)
+VENDOR_HTTP_POOL_MAXSIZE = config("VENDOR_HTTP_POOL_MAXSIZE", default=20, cast=int)
+VENDOR_HTTP_POOL_BLOCK = config("VENDOR_HTTP_POOL_BLOCK", default=True, cast=bool)
+
+# Async (ASGI) KYC views: httpx connections per vendor, and vendor calls in
+# flight per vendor before further calls wait for a slot
+VENDOR_ASYNC_MAX_CONNECTIONS = config("VENDOR_ASYNC_MAX_CONNECTIONS", default=100, cast=int)
+VENDOR_ASYNC_MAX_KEEPALIVE = config("VENDOR_ASYNC_MAX_KEEPALIVE", default=20, cast=int)
+VENDOR_ASYNC_MAX_IN_FLIGHT = config("VENDOR_ASYNC_MAX_IN_FLIGHT", default=1000, cast=int)
+
+# Vendor timeouts (seconds) used when a vendor has none configured, and the
+# end-to-end budget for one KYC request across the whole vendor fallback chain
+VENDOR_DEFAULT_CONNECT_TIMEOUT = config("VENDOR_DEFAULT_CONNECT_TIMEOUT", default=3.0, cast=float)
+VENDOR_DEFAULT_READ_TIMEOUT = config("VENDOR_DEFAULT_READ_TIMEOUT", default=10.0, cast=float)
+KYC_REQUEST_DEADLINE_SECONDS = config("KYC_REQUEST_DEADLINE_SECONDS", default=15.0, cast=float)
+
+# Worker threads shared by hedged vendor calls (hedging is enabled per client service)
+KYC_HEDGE_MAX_WORKERS = config("KYC_HEDGE_MAX_WORKERS", default=16, cast=int)
+
+# Worker threads running plain (unhedged) vendor calls, so the request thread can
+# stop waiting once the deadline passes even while a vendor is still sending
+KYC_VENDOR_CALL_MAX_WORKERS = config("KYC_VENDOR_CALL_MAX_WORKERS", default=32, cast=int)
+
+# Vendor circuit breaker (state shared across workers through kyc_vendor_circuit_breaker)
+CIRCUIT_BREAKER_ENABLED = config("CIRCUIT_BREAKER_ENABLED", default=True, cast=bool)
+CIRCUIT_BREAKER_WINDOW_SECONDS = config("CIRCUIT_BREAKER_WINDOW_SECONDS", default=60, cast=int)
+CIRCUIT_BREAKER_MIN_REQUESTS = config("CIRCUIT_BREAKER_MIN_REQUESTS", default=10, cast=int)
+CIRCUIT_BREAKER_FAILURE_RATE = config("CIRCUIT_BREAKER_FAILURE_RATE", default=0.5, cast=float)
+CIRCUIT_BREAKER_SLOW_CALL_SECONDS = config("CIRCUIT_BREAKER_SLOW_CALL_SECONDS", default=5.0, cast=float)
+CIRCUIT_BREAKER_SLOW_CALL_RATE = config("CIRCUIT_BREAKER_SLOW_CALL_RATE", default=0.8, cast=float)
+CIRCUIT_BREAKER_OPEN_SECONDS = config("CIRCUIT_BREAKER_OPEN_SECONDS", default=30, cast=int)
+CIRCUIT_BREAKER_SNAPSHOT_SECONDS = config("CIRCUIT_BREAKER_SNAPSHOT_SECONDS", default=1.0, cast=float)
+# Attempts against closed breakers are counted in memory and added to the row
+# this often; counts that trip a breaker on their own are written at once
+CIRCUIT_BREAKER_FLUSH_SECONDS = config("CIRCUIT_BREAKER_FLUSH_SECONDS", default=1.0, cast=float)
+
+# Vendor bulkheads: max_in_flight on the vendor caps concurrent calls per
+# (vendor, service); further calls wait in a short queue and fall through to the
+# next vendor when it is full or the wait times out. 0 disables the queue.
+VENDOR_BULKHEAD_ENABLED = config("VENDOR_BULKHEAD_ENABLED", default=True, cast=bool)
+VENDOR_BULKHEAD_QUEUE_SIZE = config("VENDOR_BULKHEAD_QUEUE_SIZE", default=10, cast=int)
+VENDOR_BULKHEAD_QUEUE_TIMEOUT = config("VENDOR_BULKHEAD_QUEUE_TIMEOUT", default=0.2, cast=float)
+
+# Per-process cache of API key -> client; a revoked key stops working on other
+# workers within KYC_CLIENT_CACHE_TTL seconds
+KYC_CLIENT_CACHE_TTL = config("KYC_CLIENT_CACHE_TTL", default=10, cast=int)
+KYC_CLIENT_CACHE_SIZE = config("KYC_CLIENT_CACHE_SIZE", default=1024, cast=int)
+
+# Per-process routing table: (client, service) -> permission, cache days, vendors
+KYC_ROUTING_CACHE_TTL = config("KYC_ROUTING_CACHE_TTL", default=60, cast=int)
+KYC_ROUTING_CACHE_SIZE = config("KYC_ROUTING_CACHE_SIZE", default=4096, cast=int)
+
+# Number of gateway worker processes. Per-process limits (client token buckets,
+# vendor bulkheads) split their configured totals across them.
+KYC_WORKER_PROCESSES = config("KYC_WORKER_PROCESSES", default=1, cast=int)
+
+# Per-client rate limits and quotas (rate_limit_per_second, daily_quota, ... on
+# the client service). Token buckets live in each worker process. Quota usage
+# is counted in memory and added to kyc_client_usage every
+# KYC_QUOTA_FLUSH_SECONDS, so a quota can be overshot by what the other workers
+# admitted since their last flush.
+KYC_RATE_LIMIT_ENABLED = config("KYC_RATE_LIMIT_ENABLED", default=True, cast=bool)
+KYC_QUOTA_FLUSH_SECONDS = config("KYC_QUOTA_FLUSH_SECONDS", default=1.0, cast=float)
+
+# Worker threads refreshing records served stale (stale_grace_days on the client service)
+KYC_REVALIDATE_MAX_WORKERS = config("KYC_REVALIDATE_MAX_WORKERS", default=4, cast=int)
+
+# Bulk KYC jobs (bulk_jobs/ + run_bulk_jobs worker): max rows per upload, items
+# per chunk, vendor lookups in flight per worker, seconds a claimed chunk stays
+# leased without a heartbeat, and claims per chunk before its items are failed
+KYC_BULK_MAX_ITEMS = config("KYC_BULK_MAX_ITEMS", default=200000, cast=int)
+KYC_BULK_CHUNK_SIZE = config("KYC_BULK_CHUNK_SIZE", default=500, cast=int)
+KYC_BULK_WORKERS = config("KYC_BULK_WORKERS", default=8, cast=int)
+KYC_BULK_LEASE_SECONDS = config("KYC_BULK_LEASE_SECONDS", default=300, cast=int)
+KYC_BULK_MAX_ATTEMPTS = config("KYC_BULK_MAX_ATTEMPTS", default=3, cast=int)
+
+# prod_pan_details/batch/: max PANs per call, vendor lookups in flight across
+# all batch requests of a worker, and the time budget of a whole batch (each
+# PAN also gets the service's own deadline once its lookup starts)
+KYC_BATCH_MAX_ITEMS = config("KYC_BATCH_MAX_ITEMS", default=500, cast=int)
+KYC_BATCH_MAX_WORKERS = config("KYC_BATCH_MAX_WORKERS", default=8, cast=int)
+KYC_BATCH_DEADLINE_SECONDS = config("KYC_BATCH_DEADLINE_SECONDS", default=120.0, cast=float)
+
+# Coalesce concurrent cache misses for the same identifier so only one request
+# calls the vendors: "local" (per process), "advisory" (all workers, PostgreSQL
+# advisory lock) or "off"
+KYC_SINGLE_FLIGHT = config("KYC_SINGLE_FLIGHT", default="local")
+KYC_SINGLE_FLIGHT_WAIT_SECONDS = config("KYC_SINGLE_FLIGHT_WAIT_SECONDS", default=15.0, cast=float)
+
+# Per-process cache of identifiers a vendor rejected as invalid/not found, so
+# retries do not fan out to every vendor again. 0 disables it.
+KYC_NEGATIVE_CACHE_TTL = config("KYC_NEGATIVE_CACHE_TTL", default=300, cast=int)
+KYC_NEGATIVE_CACHE_SIZE = config("KYC_NEGATIVE_CACHE_SIZE", default=10000, cast=int)
+
+# How vendor results are written to the *Details tables: "append" inserts a new
+# row on every cache miss, "upsert" keeps one current row per identifier and
+# refreshes it (previous versions go to kyc_detail_history if enabled). A
+# partial unique index on each table holds upsert mode to one current row even
+# when workers race to insert the first one.
+KYC_DETAILS_WRITE_MODE = config("KYC_DETAILS_WRITE_MODE", default="append")
+KYC_DETAILS_KEEP_HISTORY = config("KYC_DETAILS_KEEP_HISTORY", default=True, cast=bool)
+
+# Background batched writer for request log tables. LOG_SINK_POLICY decides what
+# happens when the queue is full: "block", "drop" or "sync" (write inline)
+LOG_SINK_ENABLED = config("LOG_SINK_ENABLED", default=True, cast=bool)
+LOG_SINK_QUEUE_SIZE = config("LOG_SINK_QUEUE_SIZE", default=10000, cast=int)
+LOG_SINK_BATCH_SIZE = config("LOG_SINK_BATCH_SIZE", default=200, cast=int)
+LOG_SINK_FLUSH_INTERVAL = config("LOG_SINK_FLUSH_INTERVAL", default=1.0, cast=float)
+LOG_SINK_POLICY = config("LOG_SINK_POLICY", default="sync")
+LOG_SINK_BLOCK_TIMEOUT = config("LOG_SINK_BLOCK_TIMEOUT", default=0.05, cast=float)
+
+# IsTokenValid: per-process cache of JTI -> blacklist/session check result. A
+# logout is seen at once by the worker that served it and, through the
+# blacklist filter below, within AUTH_BLACKLIST_SYNC_SECONDS by the others.
+# AUTH_TOKEN_CACHE_TTL bounds everything else. 0 disables the cache.
+AUTH_TOKEN_CACHE_TTL = config("AUTH_TOKEN_CACHE_TTL", default=30, cast=int)
+AUTH_TOKEN_CACHE_SIZE = config("AUTH_TOKEN_CACHE_SIZE", default=10000, cast=int)
+
+# Per-process Bloom filter of blacklisted JTIs; only a filter hit is checked
+# against token_blacklist. Each worker polls the blacklist version row every
+# AUTH_BLACKLIST_SYNC_SECONDS and rebuilds the filter every
+# AUTH_BLACKLIST_REBUILD_SECONDS (dropping flushed tokens) or when it holds
+# more than AUTH_BLACKLIST_FILTER_CAPACITY JTIs. Each poll also re-reads the
+# last AUTH_BLACKLIST_SYNC_OVERLAP_ROWS ids, for transactions that committed
+# after a higher id was already loaded.
+AUTH_BLACKLIST_FILTER_ENABLED = config("AUTH_BLACKLIST_FILTER_ENABLED", default=True, cast=bool)
+AUTH_BLACKLIST_FILTER_CAPACITY = config("AUTH_BLACKLIST_FILTER_CAPACITY", default=100000, cast=int)
+AUTH_BLACKLIST_FILTER_ERROR_RATE = config("AUTH_BLACKLIST_FILTER_ERROR_RATE", default=0.001, cast=float)
+AUTH_BLACKLIST_SYNC_SECONDS = config("AUTH_BLACKLIST_SYNC_SECONDS", default=1.0, cast=float)
+AUTH_BLACKLIST_REBUILD_SECONDS = config("AUTH_BLACKLIST_REBUILD_SECONDS", default=3600, cast=int)
+AUTH_BLACKLIST_SYNC_OVERLAP_ROWS = config("AUTH_BLACKLIST_SYNC_OVERLAP_ROWS", default=1000, cast=int)
+
+# Cursor pages of CustomPagination asked for ?count=estimate report the
+# PostgreSQL planner's row estimate instead of COUNT(*) once the table
+# (pg_class.reltuples) holds at least this many rows
+PAGINATION_COUNT_ESTIMATE_ROWS = config("PAGINATION_COUNT_ESTIMATE_ROWS", default=100000, cast=int)
+
+# Per-process cache of the counters shown above the user, client and vendor
+# lists; writes in this process invalidate it at once. 0 disables the cache.
+DASHBOARD_COUNTER_CACHE_TTL = config("DASHBOARD_COUNTER_CACHE_TTL", default=10, cast=int)
+
+# APILogMiddleware: "lite" skips the session write and the extra LoginSession
+# lookup, samples per path prefix (errors are always logged) and writes through
+# the log sink; "full" is the original behaviour
+API_LOG_MODE = config("API_LOG_MODE", default="lite")
+API_LOG_DEFAULT_SAMPLE_RATE = config("API_LOG_DEFAULT_SAMPLE_RATE", default=1.0, cast=float)
+# e.g. API_LOG_SAMPLE_RATES=/kyc_api_gateway/=0.1,/auth_system/=1
+API_LOG_SAMPLE_RATES = {
+    prefix: float(rate)
+    for prefix, rate in (
+        item.split("=", 1) for item in config("API_LOG_SAMPLE_RATES", default="", cast=Csv())
+    )
+}
+API_LOG_RESPONSE_MAX_BYTES = config("API_LOG_RESPONSE_MAX_BYTES", default=4096, cast=int)
+
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = True
 
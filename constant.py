@@ -36,3 +36,48 @@ KYC_MY_SERVICES = {
     "DRIVING": 6,
 }
 
+
+# Vendor circuit breaker states
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+CIRCUIT_STATE_CHOICES = [
+    (CIRCUIT_CLOSED, "Closed"),
+    (CIRCUIT_OPEN, "Open"),
+    (CIRCUIT_HALF_OPEN, "Half Open"),
+]
+
+
+# Bulk KYC jobs
+BULK_JOB_SERVICES = ("PAN", "VOTER", "RC", "DRIVING")
+
+BULK_PENDING = "pending"
+BULK_RUNNING = "running"
+BULK_COMPLETED = "completed"
+BULK_FAILED = "failed"
+BULK_JOB_STATUS_CHOICES = [
+    (BULK_PENDING, "Pending"),
+    (BULK_RUNNING, "Running"),
+    (BULK_COMPLETED, "Completed"),
+    (BULK_FAILED, "Failed"),
+]
+
+BULK_ITEM_SUCCESS = "success"
+BULK_ITEM_INVALID = "invalid"
+BULK_ITEM_DUPLICATE = "duplicate"
+BULK_ITEM_STATUS_CHOICES = [
+    (BULK_PENDING, "Pending"),
+    (BULK_ITEM_SUCCESS, "Success"),
+    (BULK_FAILED, "Failed"),
+    (BULK_ITEM_INVALID, "Invalid"),
+    (BULK_ITEM_DUPLICATE, "Duplicate"),
+]
+
+
+# Client quota periods (kyc_client_usage)
+QUOTA_DAY = "day"
+QUOTA_MONTH = "month"
+QUOTA_PERIOD_CHOICES = [
+    (QUOTA_DAY, "Day"),
+    (QUOTA_MONTH, "Month"),
+]
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class KycApiGatewayConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'kyc_api_gateway'
+
+    def ready(self):
+        import kyc_api_gateway.signals  # noqa: F401
@@ -0,0 +1,69 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from kyc_api_gateway.services.detail_store import (
+    DETAIL_IDENTITY,
+    identity_keys,
+    save_history,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Collapse the KYC *Details tables to one row per identifier: keep the "
+        "newest row, point request logs at it and move the older rows to "
+        "kyc_detail_history. Run once before switching KYC_DETAILS_WRITE_MODE to upsert."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Only report how many rows would be removed")
+        parser.add_argument("--no-history", action="store_true", help="Delete older rows without keeping a snapshot")
+
+    def handle(self, *args, **options):
+        for model in DETAIL_IDENTITY:
+            removed = self.compact(model, options["dry_run"], not options["no_history"])
+            verb = "would remove" if options["dry_run"] else "removed"
+            self.stdout.write(f"{model._meta.db_table}: {verb} {removed} duplicate rows")
+
+    def compact(self, model, dry_run, keep_history):
+        keys = identity_keys(model)
+        duplicates = (
+            model.objects.annotate(**keys)
+            .exclude(**{f"{alias}__isnull": True for alias in keys})
+            .values(*keys)
+            .annotate(rows=Count("id"))
+            .filter(rows__gt=1)
+            .order_by()
+        )
+
+        removed = 0
+        for group in duplicates.iterator():
+            if dry_run:
+                removed += group["rows"] - 1
+                continue
+            with transaction.atomic():
+                removed += self.compact_group(model, keys, group, keep_history)
+        return removed
+
+    def compact_group(self, model, keys, group, keep_history):
+        lookup = {alias: group[alias] for alias in keys}
+        rows = list(
+            model.objects.alias(**keys).filter(**lookup).select_for_update().order_by("-created_at", "-id")
+        )
+        current, older = rows[0], rows[1:]
+        older_ids = [row.pk for row in older]
+
+        # Request logs referencing the old versions now point at the current row
+        for relation in model._meta.related_objects:
+            if relation.one_to_many:
+                relation.related_model.objects.filter(
+                    **{f"{relation.field.name}__in": older_ids}
+                ).update(**{relation.field.name: current})
+
+        if keep_history:
+            for row in older:
+                save_history(model, row)
+
+        model.objects.filter(pk__in=older_ids).delete()
+        return len(older_ids)
@@ -0,0 +1,49 @@
+import os
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from kyc_api_gateway.services.bulk_jobs import claim_chunk, process_chunk
+
+
+class Command(BaseCommand):
+    help = (
+        "Work through queued bulk KYC jobs chunk by chunk. Any number of these "
+        "can run side by side; a chunk left behind by a stopped worker is picked "
+        "up again once its lease (KYC_BULK_LEASE_SECONDS) expires."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers", type=int, default=settings.KYC_BULK_WORKERS,
+            help="Vendor lookups in flight at once (default KYC_BULK_WORKERS)",
+        )
+        parser.add_argument("--sleep", type=float, default=2.0, help="Seconds to wait when the queue is empty")
+        parser.add_argument("--once", action="store_true", help="Exit as soon as the queue is empty")
+
+    def handle(self, *args, **options):
+        worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.stdout.write(f"Bulk job worker {worker_id} started with {options['workers']} workers")
+
+        with ThreadPoolExecutor(max_workers=options["workers"], thread_name_prefix="kyc-bulk") as executor:
+            while True:
+                close_old_connections()
+                chunk = claim_chunk(worker_id)
+                if chunk is None:
+                    if options["once"]:
+                        break
+                    time.sleep(options["sleep"])
+                    continue
+
+                started = time.monotonic()
+                process_chunk(chunk, executor, worker_id)
+                self.stdout.write(
+                    f"Job {chunk.job_id} chunk {chunk.seq}: {chunk.item_count} items "
+                    f"in {time.monotonic() - started:.1f}s"
+                )
+
+        self.stdout.write("Bulk job queue empty")
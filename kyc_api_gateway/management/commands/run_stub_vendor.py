@@ -0,0 +1,82 @@
+import json
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "Run a local stub KYC vendor for exercising timeouts, fallback and hedging. "
+        "Point a VendorManagement row's base URL at it (e.g. http://127.0.0.1:9001/)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--port", type=int, default=9001)
+        parser.add_argument("--vendor", choices=["karza", "surepass"], default="karza",
+                            help="Response envelope to imitate")
+        parser.add_argument("--delay-ms", type=int, default=0, help="Delay before answering")
+        parser.add_argument("--status", type=int, default=200, help="HTTP status to answer with")
+        parser.add_argument("--response-file", default=None,
+                            help="JSON file served verbatim instead of the generated PAN-style body")
+
+    def handle(self, *args, **options):
+        fixed_body = None
+        if options["response_file"]:
+            with open(options["response_file"]) as f:
+                fixed_body = json.load(f)
+
+        command = self
+        delay = options["delay_ms"] / 1000
+        vendor = options["vendor"]
+        status = options["status"]
+
+        class StubVendorHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    payload = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    payload = {}
+
+                if delay:
+                    time.sleep(delay)
+
+                body = fixed_body if fixed_body is not None else build_stub_body(vendor, payload)
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                command.stdout.write(f"[StubVendor:{vendor}] {self.path} {format % args}")
+
+        server = ThreadingHTTPServer(("127.0.0.1", options["port"]), StubVendorHandler)
+        self.stdout.write(self.style.SUCCESS(
+            f"Stub {vendor} vendor on http://127.0.0.1:{options['port']}/ "
+            f"(delay={options['delay_ms']}ms, status={status})"
+        ))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+
+def build_stub_body(vendor, payload):
+    identifier = payload.get("pan") or payload.get("id_number") or "STUB0000X"
+    if vendor == "karza":
+        return {
+            "requestId": str(uuid.uuid4()),
+            "statusCode": 101,
+            "result": {"pan": identifier, "name": "STUB VENDOR", "status": "Active"},
+        }
+    return {
+        "success": True,
+        "status_code": 200,
+        "data": {"client_id": str(uuid.uuid4()), "pan_number": identifier, "full_name": "STUB VENDOR"},
+    }
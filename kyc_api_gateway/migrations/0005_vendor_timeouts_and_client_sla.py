@@ -0,0 +1,28 @@
+# Generated by Django 5.2.5 on 2026-10-18 11:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kyc_api_gateway', '0004_rename_vendor_namee_vendormanagement_vendor_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='kycclientservicesmanagement',
+            name='sla_seconds',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='vendormanagement',
+            name='connect_timeout',
+            field=models.FloatField(default=3.0),
+        ),
+        migrations.AddField(
+            model_name='vendormanagement',
+            name='read_timeout',
+            field=models.FloatField(default=10.0),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-18 11:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kyc_api_gateway', '0005_vendor_timeouts_and_client_sla'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='kycclientservicesmanagement',
+            name='hedge_delay_ms',
+            field=models.IntegerField(default=300),
+        ),
+        migrations.AddField(
+            model_name='kycclientservicesmanagement',
+            name='hedge_enabled',
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.5 on 2026-10-18 11:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kyc_api_gateway', '0006_client_service_hedging'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VendorCircuitBreaker',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('environment', models.CharField(max_length=10)),
+                ('state', models.CharField(choices=[('closed', 'Closed'), ('open', 'Open'), ('half_open', 'Half Open')], default='closed', max_length=20)),
+                ('window_started_at', models.DateTimeField(blank=True, null=True)),
+                ('request_count', models.IntegerField(default=0)),
+                ('failure_count', models.IntegerField(default=0)),
+                ('slow_count', models.IntegerField(default=0)),
+                ('opened_at', models.DateTimeField(blank=True, null=True)),
+                ('probe_started_at', models.DateTimeField(blank=True, null=True)),
+                ('last_failure_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_by', models.IntegerField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(blank=True, null=True)),
+                ('my_service', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='circuit_breakers', to='kyc_api_gateway.kycmyservices')),
+                ('vendor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='circuit_breakers', to='kyc_api_gateway.vendormanagement')),
+            ],
+            options={
+                'db_table': 'kyc_vendor_circuit_breaker',
+                'unique_together': {('vendor', 'my_service', 'environment')},
+            },
+        ),
+    ]
@@ -0,0 +1,106 @@
+# Generated by Django 5.2.5 on 2026-10-18 12:04
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Q
+from django.db.models.functions import Trim, Upper
+
+
+IDENTIFIER_FIELDS = {
+    "propandetails": "pan_number",
+    "uatpandetails": "pan_number",
+    "prorcdetails": "rc_number",
+    "uatrcdetails": "rc_number",
+    "prodrivinglicense": "dl_number",
+    "uatdrivinglicense": "dl_number",
+    "provoterdetail": "voter_id",
+    "uatvoterdetail": "voter_id",
+}
+
+
+def normalize_identifiers(apps, schema_editor):
+    # Cache lookups are now exact matches on the canonical (trimmed, upper
+    # case) form, so bring existing rows to that form first
+    for model_name, field in IDENTIFIER_FIELDS.items():
+        model = apps.get_model("kyc_api_gateway", model_name)
+        canonical = Upper(Trim(field))
+        model.objects.filter(**{f"{field}__isnull": False}).filter(~Q(**{field: canonical})).update(**{field: canonical})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kyc_api_gateway', '0007_vendor_circuit_breaker'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_identifiers, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='propandetails',
+            name='pan_number',
+            field=models.CharField(max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='prorcdetails',
+            name='rc_number',
+            field=models.CharField(max_length=30),
+        ),
+        migrations.AlterField(
+            model_name='uatpandetails',
+            name='pan_number',
+            field=models.CharField(max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='uatrcdetails',
+            name='rc_number',
+            field=models.CharField(max_length=30),
+        ),
+        migrations.AddIndex(
+            model_name='prodrivinglicense',
+            index=models.Index(fields=['dl_number', '-created_at'], name='pro_dl_number_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='proelectricitybill',
+            index=models.Index(fields=['customer_id', '-created_at'], name='pro_bill_customer_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pronamematch',
+            index=models.Index(django.db.models.functions.text.Upper('name_1'), django.db.models.functions.text.Upper('name_2'), models.OrderBy(models.F('created_at'), descending=True), name='pro_name_upper_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='propandetails',
+            index=models.Index(fields=['pan_number', '-created_at'], name='pro_pan_number_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='prorcdetails',
+            index=models.Index(fields=['rc_number', '-created_at'], name='pro_rc_number_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='provoterdetail',
+            index=models.Index(fields=['voter_id', '-created_at'], name='pro_voter_id_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='uatdrivinglicense',
+            index=models.Index(fields=['dl_number', '-created_at'], name='uat_dl_number_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='uatelectricitybill',
+            index=models.Index(fields=['customer_id', '-created_at'], name='uat_bill_customer_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='uatnamematch',
+            index=models.Index(django.db.models.functions.text.Upper('name_1'), django.db.models.functions.text.Upper('name_2'), models.OrderBy(models.F('created_at'), descending=True), name='uat_name_upper_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='uatpandetails',
+            index=models.Index(fields=['pan_number', '-created_at'], name='uat_pan_number_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='uatrcdetails',
+            index=models.Index(fields=['rc_number', '-created_at'], name='uat_rc_number_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='uatvoterdetail',
+            index=models.Index(fields=['voter_id', '-created_at'], name='uat_voter_id_created_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.5 on 2026-10-18 12:06
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kyc_api_gateway', '0008_details_identifier_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='KycDetailHistory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('detail_table', models.CharField(max_length=100)),
+                ('detail_id', models.BigIntegerField()),
+                ('identifier', models.CharField(blank=True, max_length=255, null=True)),
+                ('snapshot', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('replaced_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'kyc_detail_history',
+                'ordering': ['-replaced_at'],
+                'indexes': [models.Index(fields=['detail_table', 'detail_id'], name='kyc_detail_history_row_idx')],
+            },
+        ),
+    ]
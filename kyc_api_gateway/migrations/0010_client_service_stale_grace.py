@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-18 12:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kyc_api_gateway', '0009_kyc_detail_history'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='kycclientservicesmanagement',
+            name='stale_grace_days',
+            field=models.IntegerField(default=0),
+        ),
+    ]
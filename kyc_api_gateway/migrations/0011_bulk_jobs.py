@@ -0,0 +1,98 @@
+# Generated by Django 5.2.5 on 2026-10-18 12:17
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kyc_api_gateway', '0010_client_service_stale_grace'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='KycBulkJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('service', models.CharField(max_length=20)),
+                ('environment', models.CharField(max_length=10)),
+                ('file_name', models.CharField(blank=True, max_length=255, null=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('total_items', models.IntegerField(default=0)),
+                ('invalid_items', models.IntegerField(default=0)),
+                ('duplicate_items', models.IntegerField(default=0)),
+                ('total_chunks', models.IntegerField(default=0)),
+                ('processed_chunks', models.IntegerField(default=0)),
+                ('processed_items', models.IntegerField(default=0)),
+                ('succeeded_items', models.IntegerField(default=0)),
+                ('failed_items', models.IntegerField(default=0)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('client', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bulk_jobs', to='kyc_api_gateway.clientmanagement')),
+            ],
+            options={
+                'db_table': 'kyc_bulk_job',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='KycBulkJobChunk',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('seq', models.IntegerField()),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('item_count', models.IntegerField(default=0)),
+                ('claimed_by', models.CharField(blank=True, max_length=100, null=True)),
+                ('claimed_at', models.DateTimeField(blank=True, null=True)),
+                ('attempts', models.IntegerField(default=0)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='chunks', to='kyc_api_gateway.kycbulkjob')),
+            ],
+            options={
+                'db_table': 'kyc_bulk_job_chunk',
+                'ordering': ['job', 'seq'],
+            },
+        ),
+        migrations.CreateModel(
+            name='KycBulkJobItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('line_no', models.IntegerField()),
+                ('identifier', models.CharField(blank=True, max_length=100, null=True)),
+                ('extra', models.JSONField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('success', 'Success'), ('failed', 'Failed'), ('invalid', 'Invalid')], default='pending', max_length=20)),
+                ('status_code', models.IntegerField(blank=True, null=True)),
+                ('source', models.CharField(blank=True, max_length=100, null=True)),
+                ('result', models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+                ('chunk', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='items', to='kyc_api_gateway.kycbulkjobchunk')),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='kyc_api_gateway.kycbulkjob')),
+            ],
+            options={
+                'db_table': 'kyc_bulk_job_item',
+                'ordering': ['job', 'line_no'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='kycbulkjobchunk',
+            index=models.Index(fields=['status', 'claimed_at'], name='kyc_bulk_chunk_claim_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='kycbulkjobchunk',
+            unique_together={('job', 'seq')},
+        ),
+        migrations.AddIndex(
+            model_name='kycbulkjobitem',
+            index=models.Index(fields=['job', 'line_no'], name='kyc_bulk_item_job_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='kycbulkjobitem',
+            index=models.Index(fields=['chunk', 'status'], name='kyc_bulk_item_chunk_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.5 on 2026-10-18 12:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kyc_api_gateway', '0011_bulk_jobs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='kycclientservicesmanagement',
+            name='daily_quota',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='kycclientservicesmanagement',
+            name='monthly_quota',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='kycclientservicesmanagement',
+            name='rate_limit_burst',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='kycclientservicesmanagement',
+            name='rate_limit_per_second',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='KycClientUsage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('day', 'Day'), ('month', 'Month')], max_length=10)),
+                ('period_start', models.DateField()),
+                ('request_count', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('client', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='usage', to='kyc_api_gateway.clientmanagement')),
+                ('my_service', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='client_usage', to='kyc_api_gateway.kycmyservices')),
+            ],
+            options={
+                'db_table': 'kyc_client_usage',
+                'ordering': ['-period_start'],
+                'unique_together': {('client', 'my_service', 'period', 'period_start')},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-18 12:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kyc_api_gateway', '0012_client_rate_limits'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vendormanagement',
+            name='max_in_flight',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,122 @@
+# Generated by Django 5.2.5 on 2026-10-18 12:54
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kyc_api_gateway', '0013_vendor_max_in_flight'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='prodrivinglicense',
+            name='is_current',
+            field=models.BooleanField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='proelectricitybill',
+            name='is_current',
+            field=models.BooleanField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='pronamematch',
+            name='is_current',
+            field=models.BooleanField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='propandetails',
+            name='is_current',
+            field=models.BooleanField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='prorcdetails',
+            name='is_current',
+            field=models.BooleanField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='provoterdetail',
+            name='is_current',
+            field=models.BooleanField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='uatdrivinglicense',
+            name='is_current',
+            field=models.BooleanField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='uatelectricitybill',
+            name='is_current',
+            field=models.BooleanField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='uatnamematch',
+            name='is_current',
+            field=models.BooleanField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='uatpandetails',
+            name='is_current',
+            field=models.BooleanField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='uatrcdetails',
+            name='is_current',
+            field=models.BooleanField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='uatvoterdetail',
+            name='is_current',
+            field=models.BooleanField(editable=False, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='prodrivinglicense',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_current', True)), fields=('dl_number',), name='pro_dl_current_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='proelectricitybill',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_current', True)), fields=('customer_id',), name='pro_bill_current_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='pronamematch',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Upper('name_1'), django.db.models.functions.text.Upper('name_2'), condition=models.Q(('is_current', True)), name='pro_name_current_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='propandetails',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_current', True)), fields=('pan_number',), name='pro_pan_current_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='prorcdetails',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_current', True)), fields=('rc_number',), name='pro_rc_current_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='provoterdetail',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_current', True)), fields=('voter_id',), name='pro_voter_current_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='uatdrivinglicense',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_current', True)), fields=('dl_number',), name='uat_dl_current_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='uatelectricitybill',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_current', True)), fields=('customer_id',), name='uat_bill_current_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='uatnamematch',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Upper('name_1'), django.db.models.functions.text.Upper('name_2'), condition=models.Q(('is_current', True)), name='uat_name_current_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='uatpandetails',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_current', True)), fields=('pan_number',), name='uat_pan_current_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='uatrcdetails',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_current', True)), fields=('rc_number',), name='uat_rc_current_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='uatvoterdetail',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_current', True)), fields=('voter_id',), name='uat_voter_current_uniq'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-18 12:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kyc_api_gateway', '0014_detail_current_row'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='kycbulkjobitem',
+            name='duplicate_of',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='kycbulkjobitem',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('success', 'Success'), ('failed', 'Failed'), ('invalid', 'Invalid'), ('duplicate', 'Duplicate')], default='pending', max_length=20),
+        ),
+    ]
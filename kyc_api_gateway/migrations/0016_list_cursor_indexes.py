@@ -0,0 +1,25 @@
+# Generated by Django 5.2.5 on 2026-10-18 12:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kyc_api_gateway', '0015_bulk_item_duplicates'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='apimanagement',
+            index=models.Index(fields=['created_at', 'id'], name='kyc_api_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientmanagement',
+            index=models.Index(fields=['created_at', 'id'], name='kyc_client_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vendormanagement',
+            index=models.Index(fields=['created_at', 'id'], name='kyc_vendor_created_id_idx'),
+        ),
+    ]
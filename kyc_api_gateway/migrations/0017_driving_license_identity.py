@@ -0,0 +1,45 @@
+# Generated by Django 5.2.5 on 2026-10-18 13:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kyc_api_gateway', '0016_list_cursor_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='prodrivinglicense',
+            name='pro_dl_current_uniq',
+        ),
+        migrations.RemoveConstraint(
+            model_name='uatdrivinglicense',
+            name='uat_dl_current_uniq',
+        ),
+        migrations.RemoveIndex(
+            model_name='prodrivinglicense',
+            name='pro_dl_number_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='uatdrivinglicense',
+            name='uat_dl_number_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='prodrivinglicense',
+            index=models.Index(fields=['dl_number', 'dob', '-created_at'], name='pro_dl_number_dob_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='uatdrivinglicense',
+            index=models.Index(fields=['dl_number', 'dob', '-created_at'], name='uat_dl_number_dob_created_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='prodrivinglicense',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_current', True)), fields=('dl_number', 'dob'), name='pro_dl_current_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='uatdrivinglicense',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_current', True)), fields=('dl_number', 'dob'), name='uat_dl_current_uniq'),
+        ),
+    ]
@@ -6,6 +6,12 @@ from .uat_pan_request_log import UatPanRequestLog
 from .kyc_my_services import KycMyServices
 from .kyc_client_services_management import KycClientServicesManagement
 from .kyc_vendor_priority import KycVendorPriority
+from .vendor_circuit_breaker import VendorCircuitBreaker
+from .kyc_detail_history import KycDetailHistory
+from .kyc_bulk_job import KycBulkJob
+from .kyc_bulk_job_chunk import KycBulkJobChunk
+from .kyc_bulk_job_item import KycBulkJobItem
+from .kyc_client_usage import KycClientUsage
 # Uat Models Added
 
 from .uat_bill_details import UatElectricityBill
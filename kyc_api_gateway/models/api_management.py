@@ -27,6 +27,9 @@ class ApiManagement(models.Model):
 
     class Meta:
         db_table = "kyc_api_management"
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="kyc_api_created_id_idx"),
+        ]
 
     def __str__(self):
         return self.api_name
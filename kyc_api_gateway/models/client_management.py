@@ -32,6 +32,9 @@ class ClientManagement(models.Model):
 
     class Meta:
         db_table = "kyc_client_management"
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="kyc_client_created_id_idx"),
+        ]
 
     def __str__(self):
         return f"{self.company_name} ({self.business_type})"
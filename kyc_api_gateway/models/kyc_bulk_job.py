@@ -0,0 +1,39 @@
+from django.db import models
+
+from constant import BULK_JOB_STATUS_CHOICES, BULK_PENDING
+
+
+class KycBulkJob(models.Model):
+    client = models.ForeignKey(
+        "ClientManagement",
+        related_name="bulk_jobs",
+        on_delete=models.CASCADE
+    )
+    service = models.CharField(max_length=20)       # "PAN" / "VOTER" / "RC" / "DRIVING"
+    environment = models.CharField(max_length=10)   # "pro" / "uat"
+    file_name = models.CharField(max_length=255, null=True, blank=True)
+    status = models.CharField(max_length=20, choices=BULK_JOB_STATUS_CHOICES, default=BULK_PENDING)
+
+    # Upload counters, fixed once the job is created
+    total_items = models.IntegerField(default=0)       # unique valid identifiers queued
+    invalid_items = models.IntegerField(default=0)
+    duplicate_items = models.IntegerField(default=0)
+    total_chunks = models.IntegerField(default=0)
+
+    # Progress, incremented as chunks finish
+    processed_chunks = models.IntegerField(default=0)
+    processed_items = models.IntegerField(default=0)
+    succeeded_items = models.IntegerField(default=0)
+    failed_items = models.IntegerField(default=0)
+
+    error = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "kyc_bulk_job"
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Bulk {self.service} [{self.environment}] #{self.pk} → {self.status}"
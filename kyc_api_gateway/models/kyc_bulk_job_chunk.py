@@ -0,0 +1,34 @@
+from django.db import models
+
+from constant import BULK_JOB_STATUS_CHOICES, BULK_PENDING
+
+
+class KycBulkJobChunk(models.Model):
+    job = models.ForeignKey(
+        "KycBulkJob",
+        related_name="chunks",
+        on_delete=models.CASCADE
+    )
+    seq = models.IntegerField()
+    status = models.CharField(max_length=20, choices=BULK_JOB_STATUS_CHOICES, default=BULK_PENDING)
+    item_count = models.IntegerField(default=0)
+
+    # Lease held by the worker processing the chunk; a running chunk whose
+    # claimed_at is older than KYC_BULK_LEASE_SECONDS is picked up again
+    claimed_by = models.CharField(max_length=100, null=True, blank=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.IntegerField(default=0)
+
+    error = models.TextField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "kyc_bulk_job_chunk"
+        ordering = ["job", "seq"]
+        unique_together = ("job", "seq")
+        indexes = [
+            models.Index(fields=["status", "claimed_at"], name="kyc_bulk_chunk_claim_idx"),
+        ]
+
+    def __str__(self):
+        return f"Job #{self.job_id} chunk {self.seq} → {self.status}"
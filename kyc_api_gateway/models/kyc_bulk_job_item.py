@@ -0,0 +1,42 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+from constant import BULK_ITEM_STATUS_CHOICES, BULK_PENDING
+
+
+class KycBulkJobItem(models.Model):
+    job = models.ForeignKey(
+        "KycBulkJob",
+        related_name="items",
+        on_delete=models.CASCADE
+    )
+    # Rows rejected by validation, and repeats of an earlier row, are stored
+    # without a chunk
+    chunk = models.ForeignKey(
+        "KycBulkJobChunk",
+        related_name="items",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True
+    )
+    line_no = models.IntegerField()
+    identifier = models.CharField(max_length=100, null=True, blank=True)
+    extra = models.JSONField(null=True, blank=True)    # other inputs, e.g. {"dob": "1990-01-31"}
+    duplicate_of = models.IntegerField(null=True, blank=True)  # line_no of the first row with the same inputs
+    status = models.CharField(max_length=20, choices=BULK_ITEM_STATUS_CHOICES, default=BULK_PENDING)
+    status_code = models.IntegerField(null=True, blank=True)
+    source = models.CharField(max_length=100, null=True, blank=True)  # "CACHE" or the vendor name
+    result = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    error = models.TextField(null=True, blank=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "kyc_bulk_job_item"
+        ordering = ["job", "line_no"]
+        indexes = [
+            models.Index(fields=["job", "line_no"], name="kyc_bulk_item_job_idx"),
+            models.Index(fields=["chunk", "status"], name="kyc_bulk_item_chunk_idx"),
+        ]
+
+    def __str__(self):
+        return f"Job #{self.job_id} line {self.line_no}: {self.identifier} → {self.status}"
@@ -16,6 +16,15 @@ class KycClientServicesManagement(models.Model):
 
     status = models.BooleanField(default=True)
     day =  models.IntegerField(default=0)
+    sla_seconds = models.FloatField(null=True, blank=True)
+    hedge_enabled = models.BooleanField(default=False)
+    hedge_delay_ms = models.IntegerField(default=300)
+    stale_grace_days = models.IntegerField(default=0)  # serve expired cache this long while refreshing
+    # Rate limit and quotas on this client's requests; null means unlimited
+    rate_limit_per_second = models.FloatField(null=True, blank=True)
+    rate_limit_burst = models.IntegerField(null=True, blank=True)  # defaults to one second of rate
+    daily_quota = models.IntegerField(null=True, blank=True)
+    monthly_quota = models.IntegerField(null=True, blank=True)
     created_by = models.IntegerField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_by = models.IntegerField(null=True, blank=True)
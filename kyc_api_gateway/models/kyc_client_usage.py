@@ -0,0 +1,34 @@
+from django.db import models
+
+from constant import QUOTA_PERIOD_CHOICES
+
+
+class KycClientUsage(models.Model):
+    """
+    Requests a client made to one service in a quota period (a day or a
+    month). Workers add their in-memory counts with F() updates, see
+    kyc_api_gateway/services/rate_limit.py.
+    """
+
+    client = models.ForeignKey(
+        "ClientManagement",
+        related_name="usage",
+        on_delete=models.CASCADE
+    )
+    my_service = models.ForeignKey(
+        "KycMyServices",
+        related_name="client_usage",
+        on_delete=models.CASCADE
+    )
+    period = models.CharField(max_length=10, choices=QUOTA_PERIOD_CHOICES)
+    period_start = models.DateField()
+    request_count = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "kyc_client_usage"
+        unique_together = ("client", "my_service", "period", "period_start")
+        ordering = ["-period_start"]
+
+    def __str__(self):
+        return f"{self.client} / {self.my_service} [{self.period} {self.period_start}] → {self.request_count}"
@@ -0,0 +1,25 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class KycDetailHistory(models.Model):
+    """
+    Previous version of a *Details row, kept when KYC_DETAILS_WRITE_MODE is
+    "upsert" and the current row for an identifier is overwritten.
+    """
+
+    detail_table = models.CharField(max_length=100)  # e.g. "pro_pan_details"
+    detail_id = models.BigIntegerField()
+    identifier = models.CharField(max_length=255, null=True, blank=True)
+    snapshot = models.JSONField(encoder=DjangoJSONEncoder)
+    replaced_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "kyc_detail_history"
+        ordering = ["-replaced_at"]
+        indexes = [
+            models.Index(fields=["detail_table", "detail_id"], name="kyc_detail_history_row_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.detail_table}#{self.detail_id} ({self.identifier})"
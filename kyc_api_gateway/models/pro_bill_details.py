@@ -29,9 +29,21 @@ class ProElectricityBill(models.Model):
     deleted_by = models.IntegerField(null=True, blank=True)
     created_by = models.IntegerField()
 
+    # True on the one row KYC_DETAILS_WRITE_MODE=upsert keeps current per
+    # identifier, NULL on appended rows
+    is_current = models.BooleanField(null=True, editable=False)
+
     class Meta:
         db_table = "pro_bill_details"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["customer_id", "-created_at"], name="pro_bill_customer_created_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["customer_id"], condition=models.Q(is_current=True), name="pro_bill_current_uniq"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.full_name or 'Unknown'} - {self.consumer_id or self.customer_id}"
@@ -31,9 +31,21 @@ class ProDrivingLicense(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # True on the one row KYC_DETAILS_WRITE_MODE=upsert keeps current per
+    # identifier, NULL on appended rows
+    is_current = models.BooleanField(null=True, editable=False)
+
     class Meta:
         db_table = "pro_driving_license"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["dl_number", "dob", "-created_at"], name="pro_dl_number_dob_created_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dl_number", "dob"], condition=models.Q(is_current=True), name="pro_dl_current_uniq"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name or 'Unknown'} ({self.dl_number or 'No DL'})"
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Upper
 
 class ProNameMatch(models.Model):
     client_id = models.CharField(max_length=100, null=True, blank=True)
@@ -13,9 +15,21 @@ class ProNameMatch(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # True on the one row KYC_DETAILS_WRITE_MODE=upsert keeps current per
+    # identifier, NULL on appended rows
+    is_current = models.BooleanField(null=True, editable=False)
+
     class Meta:
         db_table = "pro_name_match"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(Upper("name_1"), Upper("name_2"), F("created_at").desc(), name="pro_name_upper_created_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                Upper("name_1"), Upper("name_2"), condition=models.Q(is_current=True), name="pro_name_current_uniq"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name_1} ↔ {self.name_2} ({'Matched' if self.match_status else 'Not Matched'})"
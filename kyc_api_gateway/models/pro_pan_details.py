@@ -5,7 +5,7 @@ class ProPanDetails(models.Model):
     client_id = models.CharField(
         max_length=100, null=True, blank=True
     )  
-    pan_number = models.CharField(max_length=20, db_index=True)
+    pan_number = models.CharField(max_length=20)
     full_name = models.CharField(max_length=255, null=True, blank=True)
     first_name = models.CharField(max_length=100, null=True, blank=True)
     middle_name = models.CharField(max_length=100, null=True, blank=True)
@@ -55,9 +55,21 @@ class ProPanDetails(models.Model):
     deleted_by = models.IntegerField(null=True, blank=True)
     created_by = models.IntegerField()
 
+    # True on the one row KYC_DETAILS_WRITE_MODE=upsert keeps current per
+    # identifier, NULL on appended rows
+    is_current = models.BooleanField(null=True, editable=False)
+
     class Meta:
         db_table = "pro_pan_details" 
         ordering = ["-created_at"] 
+        indexes = [
+            models.Index(fields=["pan_number", "-created_at"], name="pro_pan_number_created_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["pan_number"], condition=models.Q(is_current=True), name="pro_pan_current_uniq"
+            ),
+        ]
 
 
     def __str__(self):
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Upper
 from django.utils import timezone
 
 class UatNameMatch(models.Model):
@@ -14,9 +16,21 @@ class UatNameMatch(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # True on the one row KYC_DETAILS_WRITE_MODE=upsert keeps current per
+    # identifier, NULL on appended rows
+    is_current = models.BooleanField(null=True, editable=False)
+
     class Meta:
         db_table = "uat_name_match"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(Upper("name_1"), Upper("name_2"), F("created_at").desc(), name="uat_name_upper_created_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                Upper("name_1"), Upper("name_2"), condition=models.Q(is_current=True), name="uat_name_current_uniq"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name_1} ↔ {self.name_2} ({'Matched' if self.match_status else 'Not Matched'})"
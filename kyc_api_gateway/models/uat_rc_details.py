@@ -4,7 +4,7 @@ class UatRcDetails(models.Model):
     request_id = models.CharField(max_length=100, null=True, blank=True)
     client_id = models.CharField(max_length=100, null=True, blank=True)
 
-    rc_number = models.CharField(max_length=30, db_index=True)
+    rc_number = models.CharField(max_length=30)
     owner_name = models.CharField(max_length=255, null=True, blank=True)
     father_name = models.CharField(max_length=255, null=True, blank=True)
     present_address = models.TextField(null=True, blank=True)
@@ -59,9 +59,21 @@ class UatRcDetails(models.Model):
     updated_by = models.IntegerField(null=True, blank=True)
     deleted_by = models.IntegerField(null=True, blank=True)
 
+    # True on the one row KYC_DETAILS_WRITE_MODE=upsert keeps current per
+    # identifier, NULL on appended rows
+    is_current = models.BooleanField(null=True, editable=False)
+
     class Meta:
         db_table = "uat_rc_details"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["rc_number", "-created_at"], name="uat_rc_number_created_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["rc_number"], condition=models.Q(is_current=True), name="uat_rc_current_uniq"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.rc_number} - {self.owner_name or ''}"
@@ -46,9 +46,21 @@ class UatVoterDetail(models.Model):
     created_by = models.IntegerField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # True on the one row KYC_DETAILS_WRITE_MODE=upsert keeps current per
+    # identifier, NULL on appended rows
+    is_current = models.BooleanField(null=True, editable=False)
+
     class Meta:
         db_table = "uat_voter_detail"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["voter_id", "-created_at"], name="uat_voter_id_created_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["voter_id"], condition=models.Q(is_current=True), name="uat_voter_current_uniq"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name or 'Unknown'} | {self.vendor}"
@@ -0,0 +1,40 @@
+from django.db import models
+
+from constant import CIRCUIT_CLOSED, CIRCUIT_STATE_CHOICES
+
+
+class VendorCircuitBreaker(models.Model):
+    vendor = models.ForeignKey(
+        "VendorManagement",
+        related_name="circuit_breakers",
+        on_delete=models.CASCADE
+    )
+    my_service = models.ForeignKey(
+        "KycMyServices",
+        related_name="circuit_breakers",
+        on_delete=models.CASCADE
+    )
+    environment = models.CharField(max_length=10)  # "pro" / "uat"
+    state = models.CharField(max_length=20, choices=CIRCUIT_STATE_CHOICES, default=CIRCUIT_CLOSED)
+
+    # Rolling window counters, reset every CIRCUIT_BREAKER_WINDOW_SECONDS
+    window_started_at = models.DateTimeField(null=True, blank=True)
+    request_count = models.IntegerField(default=0)
+    failure_count = models.IntegerField(default=0)
+    slow_count = models.IntegerField(default=0)
+
+    opened_at = models.DateTimeField(null=True, blank=True)
+    probe_started_at = models.DateTimeField(null=True, blank=True)
+    last_failure_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_by = models.IntegerField(null=True, blank=True)
+    updated_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "kyc_vendor_circuit_breaker"
+        unique_together = ("vendor", "my_service", "environment")
+
+    def __str__(self):
+        return f"{self.vendor} / {self.my_service} [{self.environment}] → {self.state}"
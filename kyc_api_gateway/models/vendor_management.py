@@ -11,6 +11,9 @@ class VendorManagement(models.Model):
     prod_api_key = models.CharField(max_length=255, null=True, blank=True)
     contact_phone = models.CharField(max_length=10,blank=True, null=True,unique=False)
     contact_email = models.EmailField(max_length=255,unique=False,blank=True, null=True)
+    connect_timeout = models.FloatField(default=3.0)
+    read_timeout = models.FloatField(default=10.0)
+    max_in_flight = models.IntegerField(null=True, blank=True)  # concurrent calls per service; null = unlimited
     status = models.BooleanField(default=False)
     created_by = models.IntegerField()
     created_at = models.DateTimeField(auto_now_add=True)
@@ -20,6 +23,9 @@ class VendorManagement(models.Model):
     deleted_at = models.DateTimeField(null=True, blank=True)
     class Meta:
         db_table = "kyc_vendor_management"
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="kyc_vendor_created_id_idx"),
+        ]
 
     def __str__(self):
         return self.vendor_name
@@ -0,0 +1,8 @@
+from rest_framework import serializers
+from kyc_api_gateway.models.kyc_bulk_job import KycBulkJob
+
+
+class KycBulkJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = KycBulkJob
+        exclude = ["client"]
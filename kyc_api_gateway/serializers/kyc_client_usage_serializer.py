@@ -0,0 +1,11 @@
+from rest_framework import serializers
+from kyc_api_gateway.models.kyc_client_usage import KycClientUsage
+
+
+class KycClientUsageSerializer(serializers.ModelSerializer):
+    client_name = serializers.CharField(source="client.company_name", read_only=True)
+    service_name = serializers.CharField(source="my_service.name", read_only=True)
+
+    class Meta:
+        model = KycClientUsage
+        fields = "__all__"
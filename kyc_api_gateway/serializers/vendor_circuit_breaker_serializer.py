@@ -0,0 +1,11 @@
+from rest_framework import serializers
+from kyc_api_gateway.models.vendor_circuit_breaker import VendorCircuitBreaker
+
+
+class VendorCircuitBreakerSerializer(serializers.ModelSerializer):
+    vendor_name = serializers.CharField(source="vendor.vendor_name", read_only=True)
+    service_name = serializers.CharField(source="my_service.name", read_only=True)
+
+    class Meta:
+        model = VendorCircuitBreaker
+        fields = "__all__"
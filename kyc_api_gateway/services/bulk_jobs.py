@@ -0,0 +1,420 @@
+import codecs
+import csv
+import json
+from concurrent.futures import wait
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from constant import (
+    BULK_COMPLETED,
+    BULK_FAILED,
+    BULK_ITEM_DUPLICATE,
+    BULK_ITEM_INVALID,
+    BULK_ITEM_SUCCESS,
+    BULK_JOB_SERVICES,
+    BULK_PENDING,
+    BULK_RUNNING,
+    KYC_MY_SERVICES,
+)
+from kyc_api_gateway.models import KycBulkJob, KycBulkJobChunk, KycBulkJobItem
+from kyc_api_gateway.services.kyc_services import get_kyc_service
+from kyc_api_gateway.services.circuit_breaker import VendorCircuitBreakerGuard
+from kyc_api_gateway.services.negative_cache import get_invalid_identifier, remember_invalid_identifier
+from kyc_api_gateway.services.routing import get_route
+from kyc_api_gateway.services.vendor_chain import get_hedge_delay, iter_vendor_attempts
+from kyc_api_gateway.utils.deadline import Deadline
+from kyc_api_gateway.utils.identifiers import InvalidIdentifier, detect_invalid_identifier
+
+
+NDJSON_EXTENSIONS = (".ndjson", ".jsonl")
+CSV_EXTENSIONS = (".csv",)
+
+# Pending chunks looked at per claim attempt; more than one so workers racing
+# for the head of the queue don't all come back empty-handed
+CLAIM_CANDIDATES = 10
+
+ITEM_RESULT_FIELDS = ["status", "status_code", "source", "result", "error", "processed_at"]
+RESULT_COLUMNS = ["line_no", "identifier", "extra", "status", "status_code", "source", "error", "result", "duplicate_of"]
+# Taken from the first occurrence for a duplicate row
+SHARED_RESULT_COLUMNS = ["status", "status_code", "source", "error", "result"]
+
+
+class BulkUploadError(ValueError):
+    """The upload as a whole cannot be turned into a job."""
+
+
+def create_job(client, service, environment, upload):
+    """
+    Validate, dedupe and queue an uploaded CSV/NDJSON file in one streaming pass.
+
+    Valid unique rows are written in chunks of KYC_BULK_CHUNK_SIZE items; rows
+    that fail validation and repeats of an earlier row are kept (without a
+    chunk) so they show up in the results, a repeat pointing at the line of
+    its first occurrence, whose result it shares. Everything is written in
+    one transaction, so workers never see a half-uploaded job. Raises
+    ``BulkUploadError`` for an unusable file.
+    """
+    spec = get_kyc_service(service, environment)
+    if spec is None or spec.name not in BULK_JOB_SERVICES:
+        raise BulkUploadError(f"Bulk jobs are not supported for {service} [{environment}]")
+
+    chunk_size = settings.KYC_BULK_CHUNK_SIZE
+    max_items = settings.KYC_BULK_MAX_ITEMS
+
+    with transaction.atomic():
+        job = KycBulkJob.objects.create(
+            client=client,
+            service=spec.name,
+            environment=spec.environment,
+            file_name=upload.name,
+        )
+
+        seen = {}  # inputs -> line_no of their first occurrence
+        queued, unchunked = [], []
+        rows = 0
+        for line_no, row, error in iter_upload_rows(upload):
+            rows += 1
+            if rows > max_items:
+                raise BulkUploadError(f"At most {max_items} rows per bulk job")
+
+            identifier, extra = None, None
+            if error is None:
+                try:
+                    identifier, extra = spec.parse(row, strict=True)
+                except ValueError as e:
+                    error = str(e)
+
+            key = None if error else (identifier, *sorted(extra.items()))
+            if error:
+                job.invalid_items += 1
+                unchunked.append(KycBulkJobItem(
+                    job=job,
+                    line_no=line_no,
+                    identifier=spec.raw_identifier(row) if row else None,
+                    status=BULK_ITEM_INVALID,
+                    status_code=400,
+                    error=error,
+                ))
+            elif key in seen:
+                job.duplicate_items += 1
+                unchunked.append(KycBulkJobItem(
+                    job=job,
+                    line_no=line_no,
+                    identifier=identifier,
+                    extra=extra or None,
+                    status=BULK_ITEM_DUPLICATE,
+                    duplicate_of=seen[key],
+                ))
+            else:
+                seen[key] = line_no
+                queued.append(KycBulkJobItem(job=job, line_no=line_no, identifier=identifier, extra=extra or None))
+
+            if len(queued) >= chunk_size:
+                _queue_chunk(job, queued)
+                queued = []
+            if len(unchunked) >= chunk_size:
+                KycBulkJobItem.objects.bulk_create(unchunked)
+                unchunked = []
+
+        if queued:
+            _queue_chunk(job, queued)
+        if unchunked:
+            KycBulkJobItem.objects.bulk_create(unchunked)
+
+        if not job.total_items:
+            job.status = BULK_COMPLETED
+            job.finished_at = timezone.now()
+        job.save()
+
+    print(
+        f"[INFO] Bulk job {job.pk} queued: {job.total_items} items in {job.total_chunks} chunks, "
+        f"{job.invalid_items} invalid, {job.duplicate_items} duplicates"
+    )
+    return job
+
+
+def _queue_chunk(job, items):
+    chunk = KycBulkJobChunk.objects.create(job=job, seq=job.total_chunks, item_count=len(items))
+    for item in items:
+        item.chunk = chunk
+    KycBulkJobItem.objects.bulk_create(items)
+    job.total_chunks += 1
+    job.total_items += len(items)
+
+
+def iter_upload_rows(upload):
+    """
+    ``(line_no, row, error)`` for each record of an uploaded file, read line by
+    line. CSV needs a header row; NDJSON has one JSON object per line. Column
+    names are lower-cased.
+    """
+    name = (upload.name or "").lower()
+    lines = codecs.iterdecode(upload, "utf-8-sig")
+
+    try:
+        if name.endswith(NDJSON_EXTENSIONS):
+            for line_no, line in enumerate(lines, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    yield line_no, None, "Malformed JSON line"
+                    continue
+                if not isinstance(row, dict):
+                    yield line_no, None, "Each line must be a JSON object"
+                    continue
+                yield line_no, {str(k).strip().lower(): v for k, v in row.items()}, None
+
+        elif name.endswith(CSV_EXTENSIONS):
+            reader = csv.DictReader(lines)
+            for row in reader:
+                row = {str(k).strip().lower(): v for k, v in row.items() if k is not None}
+                if not any(str(v or "").strip() for v in row.values()):
+                    continue
+                yield reader.line_num, row, None
+
+        else:
+            raise BulkUploadError("Unsupported file type, upload a .csv or .ndjson file")
+
+    except UnicodeDecodeError:
+        raise BulkUploadError("File must be UTF-8 encoded")
+    except csv.Error as e:
+        raise BulkUploadError(f"Malformed CSV: {e}")
+
+
+def claim_chunk(worker_id):
+    """
+    Claim the next pending chunk, or one whose lease expired because its worker
+    died, for ``worker_id``. The claim is a compare-and-set update on the
+    chunk's status and claimed_at, so two workers can never both win it.
+    """
+    now = timezone.now()
+    lease_expired = now - timedelta(seconds=settings.KYC_BULK_LEASE_SECONDS)
+
+    candidates = (
+        KycBulkJobChunk.objects
+        .filter(Q(status=BULK_PENDING) | Q(status=BULK_RUNNING, claimed_at__lt=lease_expired))
+        .order_by("job_id", "seq")
+        .values_list("pk", "status", "claimed_at")[:CLAIM_CANDIDATES]
+    )
+    for pk, status, claimed_at in candidates:
+        claimed = KycBulkJobChunk.objects.filter(pk=pk, status=status, claimed_at=claimed_at).update(
+            status=BULK_RUNNING,
+            claimed_by=worker_id,
+            claimed_at=now,
+            attempts=F("attempts") + 1,
+        )
+        if claimed:
+            if status == BULK_RUNNING:
+                print(f"[WARN] Bulk chunk {pk} lease expired, taken over by {worker_id}")
+            return KycBulkJobChunk.objects.select_related("job", "job__client").get(pk=pk)
+    return None
+
+
+def process_chunk(chunk, executor, worker_id):
+    """
+    Look up every pending item of a claimed chunk on ``executor``, then store
+    the results and the job's progress in one transaction. A chunk interrupted
+    half way (worker restart) is simply processed again once its lease expires.
+    """
+    job = chunk.job
+    if job.status == BULK_PENDING:
+        KycBulkJob.objects.filter(pk=job.pk, status=BULK_PENDING).update(
+            status=BULK_RUNNING, started_at=timezone.now()
+        )
+
+    items = list(chunk.items.filter(status=BULK_PENDING).order_by("line_no"))
+
+    if chunk.attempts > settings.KYC_BULK_MAX_ATTEMPTS:
+        print(f"[ERROR] Bulk chunk {chunk.pk} failed {chunk.attempts - 1} times, giving up")
+        for item in items:
+            _fail(item, 500, f"Gave up after {chunk.attempts - 1} attempts")
+        return _finish_chunk(chunk, items, worker_id, BULK_FAILED)
+
+    spec = get_kyc_service(job.service, job.environment)
+    service_id = KYC_MY_SERVICES.get(job.service)
+    route = get_route(job.client, service_id)
+    client_service = route.client_service
+
+    if spec is None or not client_service or client_service.status is False:
+        for item in items:
+            _fail(item, 403, "Service is not permitted for client")
+        return _finish_chunk(chunk, items, worker_id, BULK_COMPLETED)
+
+    fresh_after = timezone.now() - timedelta(days=client_service.day)
+    breaker = VendorCircuitBreakerGuard(service_id, job.environment)
+    vendors = [vp.vendor for vp in route.vendors]
+    futures = [
+        executor.submit(_process_item, spec, item, job.client, client_service, vendors, fresh_after, breaker)
+        for item in items
+    ]
+    _wait_for(futures, chunk, worker_id)
+    return _finish_chunk(chunk, items, worker_id, BULK_COMPLETED)
+
+
+def _wait_for(futures, chunk, worker_id):
+    """Wait for the chunk's lookups, renewing its lease while they run."""
+    heartbeat = max(settings.KYC_BULK_LEASE_SECONDS / 3, 1)
+    pending = set(futures)
+    while pending:
+        _, pending = wait(pending, timeout=heartbeat)
+        if pending:
+            KycBulkJobChunk.objects.filter(pk=chunk.pk, claimed_by=worker_id).update(claimed_at=timezone.now())
+
+
+def _finish_chunk(chunk, items, worker_id, status):
+    now = timezone.now()
+    succeeded = sum(1 for item in items if item.status == BULK_ITEM_SUCCESS)
+
+    with transaction.atomic():
+        released = KycBulkJobChunk.objects.filter(
+            pk=chunk.pk, status=BULK_RUNNING, claimed_by=worker_id
+        ).update(status=status, finished_at=now)
+        if not released:
+            # Lease lost to another worker, which will store its own results
+            print(f"[WARN] Bulk chunk {chunk.pk} was taken over, discarding results of {worker_id}")
+            return False
+
+        KycBulkJobItem.objects.bulk_update(items, ITEM_RESULT_FIELDS, batch_size=500)
+        KycBulkJob.objects.filter(pk=chunk.job_id).update(
+            processed_chunks=F("processed_chunks") + 1,
+            processed_items=F("processed_items") + len(items),
+            succeeded_items=F("succeeded_items") + succeeded,
+            failed_items=F("failed_items") + len(items) - succeeded,
+        )
+        completed = KycBulkJob.objects.filter(
+            pk=chunk.job_id, status=BULK_RUNNING, processed_chunks__gte=F("total_chunks")
+        ).update(status=BULK_COMPLETED, finished_at=now)
+
+    if completed:
+        print(f"[INFO] Bulk job {chunk.job_id} completed")
+    return True
+
+
+def _process_item(spec, item, client, client_service, vendors, fresh_after, breaker):
+    """Cache, then the vendor chain, for one item. Runs on the worker's pool."""
+    close_old_connections()
+    try:
+        extra = item.extra or {}
+        with spec.flight(item.identifier, extra) as flight:
+            cached = flight.lookup(
+                lambda: spec.find_cached(item.identifier, extra, fresh_after),
+                known_invalid=get_invalid_identifier,
+            )
+            if isinstance(cached, InvalidIdentifier):
+                return _fail(item, 404, cached.reason, source="NEGATIVE_CACHE")
+            if cached:
+                return _succeed(item, spec, cached, "CACHE")
+
+            if not vendors:
+                return _fail(item, 403, "No vendors assigned for this service")
+
+            request_data = spec.request_data(item.identifier, extra)
+            deadline = Deadline.for_service(client_service)
+            attempts = iter_vendor_attempts(
+                vendors,
+                lambda vendor, timeout: spec.call(vendor, request_data, timeout=timeout),
+                deadline,
+                hedge_delay=get_hedge_delay(client_service),
+                breaker=breaker,
+            )
+            for attempt in attempts:
+                if attempt.error:
+                    continue
+                vendor_name = attempt.vendor.vendor_name
+                response = attempt.response
+
+                invalid = detect_invalid_identifier(vendor_name, response)
+                if invalid:
+                    remember_invalid_identifier(flight.key, invalid)
+                    return _fail(item, 404, invalid.reason, source=vendor_name)
+
+                if isinstance(response, dict) and response.get("http_error"):
+                    continue
+
+                normalized = spec.normalize(vendor_name, response or {}, request_data)
+                if normalized:
+                    return _succeed(item, spec, spec.save(normalized, client.id), vendor_name)
+
+            if deadline.expired():
+                return _fail(item, 504, "Request deadline exceeded")
+            return _fail(item, 404, "No vendor returned valid data")
+    except Exception as e:
+        print(f"[ERROR] Bulk lookup failed for job {item.job_id} line {item.line_no}: {e}")
+        return _fail(item, 500, str(e))
+    finally:
+        close_old_connections()
+
+
+def _succeed(item, spec, details, source):
+    item.status = BULK_ITEM_SUCCESS
+    item.status_code = 200
+    item.source = source
+    item.result = spec.serializer(details).data
+    item.error = None
+    item.processed_at = timezone.now()
+    return item
+
+
+def _fail(item, status_code, error, source=None):
+    item.status = BULK_FAILED
+    item.status_code = status_code
+    item.source = source
+    item.result = None
+    item.error = error
+    item.processed_at = timezone.now()
+    return item
+
+
+class _Echo:
+    """File-like object whose write() hands back the line, for csv.writer."""
+
+    def write(self, value):
+        return value
+
+
+def iter_results(job, output="ndjson"):
+    """
+    Lines of a job's results (one per upload row, in file order) as NDJSON or
+    CSV. A duplicate row carries the result of its first occurrence, which
+    always comes earlier in the file, and that occurrence's line in
+    ``duplicate_of``.
+    """
+    rows = _iter_result_rows(job)
+
+    if output == "csv":
+        writer = csv.writer(_Echo())
+        yield writer.writerow(RESULT_COLUMNS)
+        for row in rows:
+            yield writer.writerow([
+                json.dumps(value, cls=DjangoJSONEncoder) if isinstance(value, (dict, list)) else value
+                for value in row
+            ])
+        return
+
+    for row in rows:
+        yield json.dumps(dict(zip(RESULT_COLUMNS, row)), cls=DjangoJSONEncoder) + "\n"
+
+
+def _iter_result_rows(job):
+    shared = {}
+    referenced = set(job.items.filter(status=BULK_ITEM_DUPLICATE).values_list("duplicate_of", flat=True))
+    shared_index = [RESULT_COLUMNS.index(column) for column in SHARED_RESULT_COLUMNS]
+
+    rows = job.items.order_by("line_no").values_list(*RESULT_COLUMNS).iterator(chunk_size=2000)
+    for row in rows:
+        line_no, duplicate_of = row[0], row[-1]
+        if line_no in referenced:
+            shared[line_no] = [row[i] for i in shared_index]
+        if duplicate_of is not None and duplicate_of in shared:
+            row = list(row)
+            for i, value in zip(shared_index, shared[duplicate_of]):
+                row[i] = value
+        yield row
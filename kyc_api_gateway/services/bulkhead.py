@@ -0,0 +1,199 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+
+from django.conf import settings
+
+
+class BulkheadFull(Exception):
+    """No free slot for a vendor call, and none freed up within the queue timeout."""
+
+
+class _Waiter:
+    def __init__(self):
+        self.granted = False
+        self.event = threading.Event()
+
+    def wake(self):
+        self.granted = True
+        self.event.set()
+
+
+class _AsyncWaiter:
+    def __init__(self):
+        self.granted = False
+        self.loop = asyncio.get_running_loop()
+        self.future = self.loop.create_future()
+
+    def wake(self):
+        # Called from whichever thread or loop released the slot
+        self.granted = True
+        self.loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self):
+        if not self.future.done():
+            self.future.set_result(None)
+
+
+class Bulkhead:
+    """
+    At most ``max_in_flight`` concurrent calls. Further callers wait, first in
+    first out, in a queue of at most ``max_queue`` for up to ``queue_timeout``
+    seconds, after which ``BulkheadFull`` is raised. A released slot is handed
+    straight to the oldest waiter, so sync (thread) and async (event loop)
+    callers share the same slots.
+    """
+
+    def __init__(self, name, max_in_flight, max_queue=0, queue_timeout=0.0):
+        self.name = name
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.calls = 0
+        self.queued_calls = 0
+        self.rejected_full = 0
+        self.rejected_timeout = 0
+        self.wait_seconds = 0.0
+
+        self._waiters = deque()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def slot(self):
+        waiter = self._enter(_Waiter)
+        if waiter is not None:
+            started = time.monotonic()
+            waiter.event.wait(self.queue_timeout)
+            self._settle(waiter, started)
+        try:
+            yield
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def aslot(self):
+        waiter = self._enter(_AsyncWaiter)
+        if waiter is not None:
+            started = time.monotonic()
+            try:
+                await asyncio.wait_for(asyncio.shield(waiter.future), self.queue_timeout)
+            except asyncio.TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                # A cancelled hedge must not keep the slot it may have been handed
+                self._abandon(waiter)
+                raise
+            self._settle(waiter, started)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "max_in_flight": self.max_in_flight,
+                "in_flight": self.in_flight,
+                "queued": len(self._waiters),
+                "peak_in_flight": self.peak_in_flight,
+                "calls": self.calls,
+                "queued_calls": self.queued_calls,
+                "rejected_full": self.rejected_full,
+                "rejected_timeout": self.rejected_timeout,
+                "avg_wait_ms": round(self.wait_seconds * 1000 / self.queued_calls, 1) if self.queued_calls else 0.0,
+            }
+
+    def _enter(self, waiter_class):
+        """Take a free slot (returns None) or join the queue (returns the waiter)."""
+        with self._lock:
+            if self.in_flight < self.max_in_flight and not self._waiters:
+                self._grant()
+                return None
+            if len(self._waiters) >= self.max_queue or self.queue_timeout <= 0:
+                self.rejected_full += 1
+                raise BulkheadFull(f"{self.name}: {self.in_flight} calls in flight, queue full")
+            waiter = waiter_class()
+            self._waiters.append(waiter)
+            self.queued_calls += 1
+            return waiter
+
+    def _settle(self, waiter, started):
+        with self._lock:
+            self.wait_seconds += time.monotonic() - started
+            if waiter.granted:
+                return
+            self._waiters.remove(waiter)
+            self.rejected_timeout += 1
+        raise BulkheadFull(f"{self.name}: no free slot within {self.queue_timeout}s")
+
+    def _abandon(self, waiter):
+        with self._lock:
+            if not waiter.granted:
+                self._waiters.remove(waiter)
+                return
+        self._release()
+
+    def _grant(self):
+        self.in_flight += 1
+        self.calls += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def _release(self):
+        with self._lock:
+            self.in_flight -= 1
+            if self._waiters and self.in_flight < self.max_in_flight:
+                self._grant()
+                self._waiters.popleft().wake()
+
+
+class BulkheadRegistry:
+    """
+    One ``Bulkhead`` per (vendor, service) in this worker process, sized from
+    the vendor's ``max_in_flight`` split across ``KYC_WORKER_PROCESSES``.
+    Vendors without a limit get none.
+    """
+
+    def __init__(self):
+        self._bulkheads = {}
+        self._lock = threading.Lock()
+
+    def get(self, vendor, service):
+        max_in_flight = getattr(vendor, "max_in_flight", None)
+        if not settings.VENDOR_BULKHEAD_ENABLED or not max_in_flight:
+            return None
+
+        processes = max(settings.KYC_WORKER_PROCESSES, 1)
+        max_in_flight = max(max_in_flight // processes, 1)
+        key = (vendor.id, service)
+        with self._lock:
+            bulkhead = self._bulkheads.get(key)
+            if bulkhead is None or bulkhead.max_in_flight != max_in_flight:
+                # New vendor/service, or the limit was changed; calls holding a
+                # slot of the old bulkhead release it there
+                bulkhead = self._bulkheads[key] = Bulkhead(
+                    f"{vendor.vendor_name}/{service}",
+                    max_in_flight,
+                    max_queue=max(settings.VENDOR_BULKHEAD_QUEUE_SIZE, 0),
+                    queue_timeout=settings.VENDOR_BULKHEAD_QUEUE_TIMEOUT,
+                )
+            return bulkhead
+
+    def stats(self):
+        with self._lock:
+            bulkheads = list(self._bulkheads.items())
+        return [
+            {"vendor_id": vendor_id, "service": service, "name": bulkhead.name, **bulkhead.stats()}
+            for (vendor_id, service), bulkhead in bulkheads
+        ]
+
+    def clear(self):
+        with self._lock:
+            self._bulkheads = {}
+
+
+vendor_bulkheads = BulkheadRegistry()
@@ -0,0 +1,400 @@
+import atexit
+import os
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from constant import CIRCUIT_CLOSED, CIRCUIT_HALF_OPEN, CIRCUIT_OPEN
+from kyc_api_gateway.models import VendorCircuitBreaker
+
+
+class BreakerSnapshot:
+    """
+    Per-process copy of the breakers that are not closed, refreshed at most every
+    ``CIRCUIT_BREAKER_SNAPSHOT_SECONDS``. The DB row is the state shared by all
+    gunicorn workers; the snapshot keeps the request path from querying it for
+    every vendor.
+    """
+
+    def __init__(self):
+        self._rows = {}
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        if time.monotonic() - self._loaded_at > settings.CIRCUIT_BREAKER_SNAPSHOT_SECONDS:
+            self.reload()
+        return self._rows.get(key)
+
+    def put(self, row):
+        key = (row.vendor_id, row.my_service_id, row.environment)
+        with self._lock:
+            if row.state == CIRCUIT_CLOSED:
+                self._rows.pop(key, None)
+            else:
+                self._rows[key] = row
+
+    def reload(self):
+        rows = {
+            (row.vendor_id, row.my_service_id, row.environment): row
+            for row in VendorCircuitBreaker.objects.exclude(state=CIRCUIT_CLOSED)
+        }
+        with self._lock:
+            self._rows = rows
+            self._loaded_at = time.monotonic()
+
+    def clear(self):
+        with self._lock:
+            self._rows = {}
+            self._loaded_at = 0.0
+
+
+breaker_snapshot = BreakerSnapshot()
+
+
+def is_vendor_failure(attempt):
+    """
+    Whether a vendor attempt counts against the breaker. Timeouts, transport
+    errors, 5xx and throttling do; a vendor answering "not found" does not,
+    nor does our own bulkhead turning the call away before it was made.
+    """
+    if attempt.error is not None or attempt.response is None:
+        return True
+    response = attempt.response
+    if isinstance(response, dict) and response.get("bulkhead_full"):
+        return False
+    if isinstance(response, dict) and response.get("http_error"):
+        status_code = response.get("status_code")
+        return status_code is None or status_code >= 500 or status_code in (408, 429)
+    return False
+
+
+class VendorCircuitBreakerGuard:
+    """Breaker checks for one service/environment, used by the vendor chain."""
+
+    def __init__(self, service_id, environment):
+        self.service_id = service_id
+        self.environment = environment
+
+    def allow(self, vendor):
+        if not settings.CIRCUIT_BREAKER_ENABLED:
+            return True
+        try:
+            return allow_request(vendor.id, self.service_id, self.environment)
+        except Exception as e:
+            print(f"[ERROR] Circuit breaker check failed for {vendor.vendor_name}: {e}")
+            return True
+
+    def record(self, attempt):
+        if not settings.CIRCUIT_BREAKER_ENABLED:
+            return
+        error = attempt.error
+        if error is None and isinstance(attempt.response, dict):
+            error = attempt.response.get("error_message")
+        try:
+            record_result(
+                attempt.vendor.id,
+                self.service_id,
+                self.environment,
+                failed=is_vendor_failure(attempt),
+                elapsed=attempt.elapsed,
+                error=error,
+            )
+        except Exception as e:
+            print(f"[ERROR] Circuit breaker update failed for {attempt.vendor.vendor_name}: {e}")
+
+
+def allow_request(vendor_id, service_id, environment):
+    row = breaker_snapshot.get((vendor_id, service_id, environment))
+    if row is None:
+        return True
+
+    cool_off = timezone.now() - timedelta(seconds=settings.CIRCUIT_BREAKER_OPEN_SECONDS)
+    if row.state == CIRCUIT_OPEN and row.opened_at and row.opened_at <= cool_off:
+        return _claim_probe(row)
+    if row.state == CIRCUIT_HALF_OPEN and (row.probe_started_at is None or row.probe_started_at <= cool_off):
+        # The previous probe never reported back (worker died, request lost)
+        return _claim_probe(row)
+    return False
+
+
+def _claim_probe(row):
+    """Let exactly one request, across all workers, through as the half-open probe."""
+    now = timezone.now()
+    if row.probe_started_at is None:
+        same_probe = Q(probe_started_at__isnull=True)
+    else:
+        same_probe = Q(probe_started_at=row.probe_started_at)
+
+    claimed = VendorCircuitBreaker.objects.filter(same_probe, pk=row.pk, state=row.state).update(
+        state=CIRCUIT_HALF_OPEN, probe_started_at=now
+    )
+    if claimed:
+        row.state = CIRCUIT_HALF_OPEN
+        row.probe_started_at = now
+        breaker_snapshot.put(row)
+    return bool(claimed)
+
+
+class PendingCounts:
+    """Vendor attempts recorded by this process and not yet flushed to the row."""
+
+    __slots__ = ("request_count", "failure_count", "slow_count", "last_failure_at", "last_error")
+
+    def __init__(self):
+        self.request_count = 0
+        self.failure_count = 0
+        self.slow_count = 0
+        self.last_failure_at = None
+        self.last_error = None
+
+    def add(self, failed, slow, now, error=None):
+        self.request_count += 1
+        if failed:
+            self.failure_count += 1
+            self.last_failure_at = now
+            self.last_error = str(error)[:500] if error else None
+        if slow:
+            self.slow_count += 1
+
+
+class BreakerCounter:
+    """
+    Per-process counts of vendor attempts for closed breakers. A background
+    thread adds them to each breaker row with one F() update every
+    ``CIRCUIT_BREAKER_FLUSH_SECONDS`` and trips the breaker if the row's window
+    totals call for it. Only state changes (starting a window, tripping,
+    probe results) take the row lock. Counts that would trip the breaker on
+    their own are flushed straight away rather than waiting for the thread.
+    """
+
+    def __init__(self, flush_interval=None):
+        self.flush_interval = flush_interval or settings.CIRCUIT_BREAKER_FLUSH_SECONDS
+        self.flush_failures = 0
+
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self._stopped = threading.Event()
+
+    def add(self, key, failed, slow, now, error=None):
+        self._ensure_started()
+        with self._lock:
+            counts = self._pending.get(key)
+            if counts is None:
+                counts = self._pending[key] = PendingCounts()
+            counts.add(failed, slow, now, error)
+            trips = _should_trip(counts)
+            if trips:
+                del self._pending[key]
+        if trips:
+            self._flush_key(key, counts)
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for key, counts in pending.items():
+            self._flush_key(key, counts)
+
+    def stop(self, timeout=5.0):
+        if self._thread is None or self._pid != os.getpid():
+            return
+        self._stopped.set()
+        self._thread.join(timeout)
+        self._thread = None
+        self.flush()
+
+    def clear(self):
+        with self._lock:
+            self._pending = {}
+
+    def stats(self):
+        with self._lock:
+            return {
+                "tracked": len(self._pending),
+                "pending": sum(counts.request_count for counts in self._pending.values()),
+                "flush_failures": self.flush_failures,
+            }
+
+    def _flush_key(self, key, counts):
+        try:
+            flush_counts(key, counts)
+        except Exception as e:
+            # Dropped rather than retried: by the next flush the window has moved on
+            self.flush_failures += 1
+            print(f"[ERROR] Circuit breaker flush failed for {key}: {e}")
+
+    def _ensure_started(self):
+        # A forked worker (gunicorn --preload) inherits the object but not the thread
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._stopped = threading.Event()
+            self._thread = threading.Thread(target=self._run, name="breaker-flush", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stopped.wait(self.flush_interval):
+            close_old_connections()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[ERROR] Circuit breaker flush failed: {e}")
+
+
+breaker_counter = BreakerCounter()
+
+atexit.register(breaker_counter.stop)
+
+
+def record_result(vendor_id, service_id, environment, failed, elapsed, error=None):
+    """
+    Count one vendor attempt. While the breaker is closed this only touches
+    memory; the result of a half-open probe opens or closes it at once.
+    """
+    key = (vendor_id, service_id, environment)
+    now = timezone.now()
+    slow = elapsed >= settings.CIRCUIT_BREAKER_SLOW_CALL_SECONDS
+
+    row = breaker_snapshot.get(key)
+    if row is not None and row.state == CIRCUIT_HALF_OPEN:
+        return _record_probe(key, failed, slow, now, error)
+    breaker_counter.add(key, failed, slow, now, error)
+    return None
+
+
+def _breaker_rows(key):
+    vendor_id, service_id, environment = key
+    return VendorCircuitBreaker.objects.filter(vendor_id=vendor_id, my_service_id=service_id, environment=environment)
+
+
+def _apply_counts(row, counts):
+    row.request_count += counts.request_count
+    row.failure_count += counts.failure_count
+    row.slow_count += counts.slow_count
+    if counts.last_failure_at:
+        row.last_failure_at = counts.last_failure_at
+        row.last_error = counts.last_error
+
+
+def flush_counts(key, counts):
+    """Add ``counts`` to the breaker row, tripping it if its window now calls for it."""
+    now = timezone.now()
+    window_start = now - timedelta(seconds=settings.CIRCUIT_BREAKER_WINDOW_SECONDS)
+
+    updates = {
+        "request_count": F("request_count") + counts.request_count,
+        "failure_count": F("failure_count") + counts.failure_count,
+        "slow_count": F("slow_count") + counts.slow_count,
+        "updated_at": now,
+    }
+    if counts.last_failure_at:
+        updates["last_failure_at"] = counts.last_failure_at
+        updates["last_error"] = counts.last_error
+    if _breaker_rows(key).filter(window_started_at__gt=window_start).update(**updates):
+        row = _breaker_rows(key).first()
+        if row.state != CIRCUIT_CLOSED or not _should_trip(row):
+            return row
+        counts = PendingCounts()  # already added above; only the trip is left
+
+    # No row yet, its window has ended, or it has to trip
+    with transaction.atomic():
+        vendor_id, service_id, environment = key
+        row, _ = VendorCircuitBreaker.objects.select_for_update().get_or_create(
+            vendor_id=vendor_id,
+            my_service_id=service_id,
+            environment=environment,
+        )
+        if row.window_started_at is None or row.window_started_at <= window_start:
+            _reset_window(row, now)
+        _apply_counts(row, counts)
+        if row.state == CIRCUIT_CLOSED and _should_trip(row):
+            _open(row, now)
+        row.updated_at = now
+        row.save()
+
+    breaker_snapshot.put(row)
+    return row
+
+
+def _record_probe(key, failed, slow, now, error=None):
+    counts = PendingCounts()
+    counts.add(failed, slow, now, error)
+
+    with transaction.atomic():
+        row = _breaker_rows(key).select_for_update().first()
+        if row is None:
+            return None
+        _apply_counts(row, counts)
+        if row.state == CIRCUIT_HALF_OPEN:
+            if failed or slow:
+                _open(row, now)
+            else:
+                _close(row, now)
+        row.updated_at = now
+        row.save()
+
+    breaker_snapshot.put(row)
+    return row
+
+
+def _should_trip(row):
+    if row.request_count < settings.CIRCUIT_BREAKER_MIN_REQUESTS:
+        return False
+    failure_rate = row.failure_count / row.request_count
+    slow_rate = row.slow_count / row.request_count
+    return (
+        failure_rate >= settings.CIRCUIT_BREAKER_FAILURE_RATE
+        or slow_rate >= settings.CIRCUIT_BREAKER_SLOW_CALL_RATE
+    )
+
+
+def _reset_window(row, now):
+    row.window_started_at = now
+    row.request_count = 0
+    row.failure_count = 0
+    row.slow_count = 0
+
+
+def _open(row, now):
+    print(
+        f"[WARN] Circuit opened for vendor={row.vendor_id} service={row.my_service_id} "
+        f"env={row.environment} ({row.failure_count} failed, {row.slow_count} slow of {row.request_count})"
+    )
+    row.state = CIRCUIT_OPEN
+    row.opened_at = now
+    row.probe_started_at = None
+
+
+def _close(row, now):
+    print(f"[INFO] Circuit closed for vendor={row.vendor_id} service={row.my_service_id} env={row.environment}")
+    row.state = CIRCUIT_CLOSED
+    row.opened_at = None
+    row.probe_started_at = None
+    _reset_window(row, now)
+
+
+def set_breaker_state(row, state, user_id=None):
+    """Force a breaker into ``state`` from the admin endpoint."""
+    now = timezone.now()
+    if state == CIRCUIT_CLOSED:
+        _close(row, now)
+    elif state == CIRCUIT_OPEN:
+        _open(row, now)
+    else:
+        row.state = CIRCUIT_HALF_OPEN
+        row.probe_started_at = None
+    row.updated_by = user_id
+    row.updated_at = now
+    row.save()
+    breaker_snapshot.put(row)
+    return row
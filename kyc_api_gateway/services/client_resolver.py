@@ -0,0 +1,46 @@
+from django.conf import settings
+
+from auth_system.utils.cache import TTLCache
+from kyc_api_gateway.models import ClientManagement
+
+
+KEY_FIELDS = {
+    "pro": "production_key",
+    "uat": "uat_key",
+}
+
+_MISSING = object()
+
+# (environment, api_key) -> ClientManagement, or None for unknown keys so a
+# flood of bad keys does not hit the DB either.
+client_cache = TTLCache(
+    maxsize=settings.KYC_CLIENT_CACHE_SIZE,
+    ttl=settings.KYC_CLIENT_CACHE_TTL,
+)
+
+
+def resolve_client(api_key, environment):
+    """Active client owning ``api_key`` in ``environment`` ("pro"/"uat"), or None."""
+    cache_key = (environment, api_key)
+    client = client_cache.get(cache_key, _MISSING)
+    if client is not _MISSING:
+        return client
+
+    client = ClientManagement.objects.filter(
+        **{KEY_FIELDS[environment]: api_key},
+        deleted_at__isnull=True,
+    ).first()
+    client_cache.set(cache_key, client)
+    return client
+
+
+def invalidate_client(client):
+    """
+    Forget everything cached for ``client``: entries still resolving its old
+    keys, and cached misses for its current keys.
+    """
+    client_cache.delete_where(lambda key, value: value is not None and value.pk == client.pk)
+    for environment, field in KEY_FIELDS.items():
+        api_key = getattr(client, field)
+        if api_key:
+            client_cache.delete((environment, api_key))
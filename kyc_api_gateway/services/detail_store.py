@@ -0,0 +1,134 @@
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.functions import Upper
+from django.utils import timezone
+
+from kyc_api_gateway.models import (
+    KycDetailHistory,
+    ProDrivingLicense,
+    ProElectricityBill,
+    ProNameMatch,
+    ProPanDetails,
+    ProRcDetails,
+    ProVoterDetail,
+    UatDrivingLicense,
+    UatElectricityBill,
+    UatNameMatch,
+    UatPanDetails,
+    UatRcDetails,
+    UatVoterDetail,
+)
+
+
+WRITE_MODE_APPEND = "append"
+WRITE_MODE_UPSERT = "upsert"
+
+# model -> (identifier fields, compared case-insensitively). These are the same
+# keys the views use for their cache lookups, so "current row" means the row
+# the cache would serve.
+DETAIL_IDENTITY = {
+    ProPanDetails: (("pan_number",), False),
+    UatPanDetails: (("pan_number",), False),
+    ProRcDetails: (("rc_number",), False),
+    UatRcDetails: (("rc_number",), False),
+    ProDrivingLicense: (("dl_number", "dob"), False),
+    UatDrivingLicense: (("dl_number", "dob"), False),
+    ProVoterDetail: (("voter_id",), False),
+    UatVoterDetail: (("voter_id",), False),
+    ProElectricityBill: (("customer_id",), False),
+    UatElectricityBill: (("customer_id",), False),
+    ProNameMatch: (("name_1", "name_2"), True),
+    UatNameMatch: (("name_1", "name_2"), True),
+}
+
+
+def identity_keys(model):
+    """
+    ``{alias: expression}`` for the identifier of ``model``, usable with
+    ``.alias()``/``.annotate()`` so both lookups and grouping hit the same index.
+    """
+    fields, fold_case = DETAIL_IDENTITY[model]
+    return {f"{field}_key": Upper(field) if fold_case else F(field) for field in fields}
+
+
+def identity_queryset(model, values):
+    """Rows of ``model`` with the same identifier as ``values``, newest first."""
+    fields, fold_case = DETAIL_IDENTITY[model]
+    if fold_case:
+        lookup = {f"{field}_key": values[field].upper() for field in fields}
+        queryset = model.objects.alias(**identity_keys(model)).filter(**lookup)
+    else:
+        queryset = model.objects.filter(**{field: values[field] for field in fields})
+    return queryset.order_by("-created_at", "-id")
+
+
+def describe_identifier(model, row):
+    fields, _ = DETAIL_IDENTITY[model]
+    return " / ".join(str(getattr(row, field)) for field in fields)[:255]
+
+
+def store_detail(model, **values):
+    """
+    Save a vendor result into ``model``.
+
+    In "append" mode (the default) this is ``model.objects.create(**values)``.
+    In "upsert" mode the current row for the identifier is overwritten in
+    place, keeping its id so request logs pointing at it stay valid, and its
+    ``created_at`` is reset so the cache window starts again. If there is no
+    such row, or the identifier is missing, a new row is inserted. A partial
+    unique constraint on the identifier (``is_current``) keeps two workers
+    from both inserting the first row; the loser updates the winner's row.
+    """
+    fields, _ = DETAIL_IDENTITY[model]
+    if settings.KYC_DETAILS_WRITE_MODE != WRITE_MODE_UPSERT or any(not values.get(f) for f in fields):
+        return model.objects.create(**values)
+
+    try:
+        return upsert_detail(model, values)
+    except IntegrityError:
+        # Another worker inserted (or made current) a row for this identifier
+        # first; it is committed now, so this time it is found and updated
+        return upsert_detail(model, values)
+
+
+def upsert_detail(model, values):
+    with transaction.atomic():
+        rows = identity_queryset(model, values).select_for_update()
+        # Rows appended before upsert mode was switched on have no is_current;
+        # the newest of them becomes the current row
+        current = rows.filter(is_current=True).first() or rows.first()
+        if current is None:
+            return model.objects.create(is_current=True, **values)
+
+        if settings.KYC_DETAILS_KEEP_HISTORY:
+            save_history(model, current)
+
+        for field, value in values.items():
+            setattr(current, field, value)
+        current.is_current = True
+        current.created_at = timezone.now()
+        current.save()
+        return current
+
+
+def save_history(model, row):
+    snapshot = {field.attname: getattr(row, field.attname) for field in model._meta.concrete_fields}
+    return KycDetailHistory.objects.create(
+        detail_table=model._meta.db_table,
+        detail_id=row.pk,
+        identifier=describe_identifier(model, row),
+        snapshot=snapshot,
+    )
+
+
+def store_details(model, rows):
+    """
+    Save several vendor results (a list of field dicts) into ``model`` and
+    return the saved instances in the same order. Append mode writes them with
+    one ``bulk_create``; upsert mode has to look up each identifier, so it goes
+    through ``store_detail`` row by row.
+    """
+    if settings.KYC_DETAILS_WRITE_MODE == WRITE_MODE_UPSERT:
+        return [store_detail(model, **values) for values in rows]
+    return model.objects.bulk_create([model(**values) for values in rows])
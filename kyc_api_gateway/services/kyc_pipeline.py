@@ -0,0 +1,436 @@
+import asyncio
+import time
+from contextlib import AsyncExitStack, ExitStack
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.utils import timezone
+
+from auth_system.utils.log_sink import log_sink
+from constant import KYC_MY_SERVICES
+from kyc_api_gateway.services.circuit_breaker import VendorCircuitBreakerGuard
+from kyc_api_gateway.services.client_resolver import resolve_client
+from kyc_api_gateway.services.kyc_services import get_kyc_service
+from kyc_api_gateway.services.negative_cache import get_invalid_identifier, remember_invalid_identifier
+from kyc_api_gateway.services.rate_limit import check_rate_limit
+from kyc_api_gateway.services.revalidate import get_stale_cutoff, schedule_refresh
+from kyc_api_gateway.services.routing import get_route
+from kyc_api_gateway.services.vendor_chain import aiter_vendor_attempts, get_hedge_delay, iter_vendor_attempts
+from kyc_api_gateway.utils.deadline import Deadline
+from kyc_api_gateway.utils.identifiers import InvalidIdentifier, detect_invalid_identifier
+
+
+class PipelineStop(Exception):
+    """Raised by a stage to end the run with an error response (and request log)."""
+
+    def __init__(self, status_code, error, vendor_name=None, response_payload=None, headers=None):
+        super().__init__(error)
+        self.status_code = status_code
+        self.error = error
+        self.vendor_name = vendor_name
+        self.response_payload = response_payload
+        self.headers = headers or {}
+
+
+class KycPipelineContext:
+    """State of one KYC lookup as it moves through the pipeline stages."""
+
+    def __init__(self, body, api_key, log_context):
+        self.body = body
+        self.api_key = api_key
+        self.log_context = log_context
+
+        self.identifier = None
+        self.extra = {}
+        self.request_data = None
+        self.client = None
+        self.client_service = None
+        self.vendors = []
+        self.days_ago = None
+        self.serve_after = None
+        self.flight = None
+        self.deadline = None
+
+        # Vendor answer being persisted
+        self.vendor_name = None
+        self.normalized = None
+
+        self.result = None      # (status_code, response body) once decided
+        self.outcome = None     # request log fields for the result
+        self.timings = {}       # stage -> milliseconds
+        self.headers = {}       # extra response headers
+        self.resources = ExitStack()
+
+    def finish(self, status_code, body, vendor_name=None, response_payload=None, details=None, error_message=None):
+        self.result = (status_code, body)
+        self.outcome = dict(
+            vendor_name=vendor_name,
+            status_code=status_code,
+            status="success" if status_code == 200 else "fail",
+            response_payload=response_payload,
+            error_message=error_message,
+            details=details,
+        )
+
+    def stop(self, stop):
+        self.headers.update(stop.headers)
+        self.finish(
+            stop.status_code,
+            {"success": False, "status": stop.status_code, "error": stop.error},
+            vendor_name=stop.vendor_name,
+            response_payload=stop.response_payload,
+            error_message=stop.error,
+        )
+
+    def server_timing(self):
+        """``Server-Timing`` header value for the stage timings."""
+        return ", ".join(f"{stage};dur={ms:.1f}" for stage, ms in self.timings.items())
+
+
+class KycPipeline:
+    """
+    The pro/uat KYC details request as a sequence of stages over a
+    ``KycService`` spec, so every service and environment shares one
+    implementation of the hot path:
+
+        validate -> authenticate -> route -> throttle -> cache -> vendor_chain -> log
+
+    A stage is a method taking the context; it either fills the context in,
+    decides the result (``ctx.finish``) or raises ``PipelineStop``. Once a
+    result is decided the remaining ``stages`` are skipped; ``final_stages``
+    (the request log) always run. ``persist`` runs inside ``vendor_chain`` for
+    each usable vendor answer, so a failed save falls through to the next
+    vendor. Each stage's wall time is recorded in ``ctx.timings``.
+
+    ``success_message``, ``exhausted_error`` and ``unconfigured_status`` keep
+    the per-service response wording the endpoints have always returned.
+    """
+
+    stages = ("validate", "authenticate", "route", "throttle", "cache", "vendor_chain")
+    final_stages = ("log",)
+
+    def __init__(self, spec, success_message="Data from {vendor}", exhausted_error="No vendor returned valid data",
+                 unconfigured_status=500):
+        self.spec = spec
+        self.service_id = KYC_MY_SERVICES.get(spec.name)
+        self.success_message = success_message
+        self.exhausted_error = exhausted_error
+        self.unconfigured_status = unconfigured_status
+
+    def run(self, ctx):
+        """Run the stages for ``ctx``; returns ``(status_code, response body)``."""
+        try:
+            for stage in self.stages:
+                if ctx.result is not None:
+                    break
+                self.run_stage(stage, ctx)
+        finally:
+            ctx.resources.close()
+
+        for stage in self.final_stages:
+            self.run_stage(stage, ctx)
+        return ctx.result
+
+    def run_stage(self, stage, ctx):
+        started = time.perf_counter()
+        try:
+            getattr(self, stage)(ctx)
+        except PipelineStop as stop:
+            ctx.stop(stop)
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            ctx.timings[stage] = ctx.timings.get(stage, 0) + elapsed
+
+    def log_entry(self, ctx, vendor_name, status_code, status, response_payload=None, error_message=None,
+                  details=None):
+        """Unsaved request log row for this lookup."""
+        return self.spec.build_log(
+            ctx.identifier,
+            ctx.extra,
+            details=details,
+            vendor=vendor_name,
+            status_code=status_code,
+            status=status,
+            response_payload=response_payload,
+            error_message=error_message,
+            **ctx.log_context,
+        )
+
+    def log_request(self, ctx, **fields):
+        log_sink.submit(self.log_entry(ctx, **fields))
+
+    def finish_cached(self, ctx, cached):
+        spec = self.spec
+        stale = cached.created_at < ctx.days_ago
+        if stale:
+            schedule_refresh(
+                ctx.flight.key,
+                lambda: spec.find_cached(ctx.identifier, ctx.extra, ctx.days_ago),
+                ctx.vendors,
+                lambda vendor, timeout: spec.call(vendor, ctx.request_data, timeout=timeout),
+                lambda vendor_name, data: spec.normalize(vendor_name, data, ctx.request_data),
+                lambda normalized: spec.save(normalized, ctx.client.id),
+                ctx.client_service,
+                breaker=VendorCircuitBreakerGuard(self.service_id, spec.environment),
+            )
+        data = spec.serializer(cached).data
+        ctx.finish(
+            200,
+            {"success": True, "status": 200, "message": "Cached data", "stale": stale, "data": data},
+            vendor_name="CACHE_STALE" if stale else "CACHE",
+            response_payload=data,
+            details=cached,
+        )
+
+    def finish_saved(self, ctx, details):
+        if details is None:
+            raise ValueError("Could not save vendor data")
+
+        data = self.spec.serializer(details).data
+        ctx.finish(
+            200,
+            {
+                "success": True,
+                "status": 200,
+                "message": self.success_message.format(vendor=ctx.vendor_name),
+                "data": data,
+            },
+            vendor_name=ctx.vendor_name,
+            response_payload=data,
+            details=details,
+        )
+
+    def check_attempt(self, ctx, attempt):
+        """
+        ``(normalized, None)`` for a usable vendor answer, else ``(None, log
+        fields)`` saying why it is not. Raises ``PipelineStop`` when the vendor
+        says the identifier itself is invalid.
+        """
+        vendor_name = attempt.vendor.vendor_name
+        try:
+            if attempt.error:
+                raise attempt.error
+            response = attempt.response
+
+            invalid = detect_invalid_identifier(vendor_name, response)
+            if invalid:
+                remember_invalid_identifier(ctx.flight.key, invalid)
+                raise PipelineStop(404, invalid.reason, vendor_name=vendor_name, response_payload=response)
+
+            if isinstance(response, dict) and response.get("http_error"):
+                return None, dict(
+                    vendor_name=vendor_name,
+                    status_code=response.get("status_code") or 500,
+                    status="fail",
+                    response_payload=response.get("vendor_response"),
+                    error_message=response.get("error_message"),
+                )
+
+            normalized = self.spec.normalize(vendor_name, response or {}, ctx.request_data)
+            if not normalized:
+                return None, dict(
+                    vendor_name=vendor_name,
+                    status_code=204,
+                    status="fail",
+                    response_payload=response,
+                    error_message="No valid data returned",
+                )
+            return normalized, None
+
+        except PipelineStop:
+            raise
+        except Exception as e:
+            return None, dict(vendor_name=vendor_name, status_code=500, status="fail", error_message=str(e))
+
+    def vendor_attempts(self, ctx, call):
+        if not ctx.vendors:
+            raise PipelineStop(403, "No vendors assigned for this service")
+
+        ctx.deadline = Deadline.for_service(ctx.client_service)
+        iterate = aiter_vendor_attempts if asyncio.iscoroutinefunction(call) else iter_vendor_attempts
+        return iterate(
+            ctx.vendors,
+            lambda vendor, timeout: call(vendor, ctx.request_data, timeout=timeout),
+            ctx.deadline,
+            hedge_delay=get_hedge_delay(ctx.client_service),
+            breaker=VendorCircuitBreakerGuard(self.service_id, self.spec.environment),
+        )
+
+    def vendors_exhausted(self, ctx):
+        if ctx.deadline.expired():
+            return PipelineStop(504, "Request deadline exceeded")
+        return PipelineStop(404, self.exhausted_error)
+
+    # Stages
+
+    def validate(self, ctx):
+        if not hasattr(ctx.body, "get"):
+            raise PipelineStop(400, "Request body must be a JSON object")
+        try:
+            ctx.identifier, ctx.extra = self.spec.parse(ctx.body)
+        except ValueError as e:
+            raise PipelineStop(400, str(e))
+        ctx.request_data = self.spec.request_data(ctx.identifier, ctx.extra, ctx.body)
+
+    def authenticate(self, ctx):
+        if not ctx.api_key:
+            raise PipelineStop(401, "Missing API key")
+        ctx.client = resolve_client(ctx.api_key, self.spec.environment)
+        if not ctx.client:
+            raise PipelineStop(401, "Invalid API key")
+
+    def route(self, ctx):
+        route = get_route(ctx.client, self.service_id)
+        client_service = route.client_service
+        if not client_service:
+            raise PipelineStop(
+                self.unconfigured_status,
+                f"Cache days not configured for client={ctx.client.id}, service_id={self.service_id}",
+            )
+        if client_service.status is False:
+            raise PipelineStop(403, "Service is not permitted for client")
+
+        ctx.client_service = client_service
+        ctx.vendors = [vp.vendor for vp in route.vendors]
+        ctx.days_ago = timezone.now() - timedelta(days=client_service.day)
+        ctx.serve_after = get_stale_cutoff(client_service, ctx.days_ago)
+
+    def throttle(self, ctx):
+        throttled = check_rate_limit(ctx.client_service)
+        if throttled:
+            raise PipelineStop(429, throttled.reason, headers={"Retry-After": str(throttled.retry_after)})
+
+    def cache(self, ctx):
+        spec = self.spec
+        ctx.flight = ctx.resources.enter_context(spec.flight(ctx.identifier, ctx.extra))
+        cached = ctx.flight.lookup(
+            lambda: spec.find_cached(ctx.identifier, ctx.extra, ctx.serve_after),
+            known_invalid=get_invalid_identifier,
+        )
+
+        if isinstance(cached, InvalidIdentifier):
+            raise PipelineStop(404, cached.reason, vendor_name="NEGATIVE_CACHE")
+        if cached:
+            self.finish_cached(ctx, cached)
+
+    def vendor_chain(self, ctx):
+        for attempt in self.vendor_attempts(ctx, self.spec.call):
+            normalized, failure = self.check_attempt(ctx, attempt)
+            if normalized:
+                ctx.vendor_name, ctx.normalized = attempt.vendor.vendor_name, normalized
+                try:
+                    self.run_stage("persist", ctx)
+                    return
+                except Exception as e:
+                    failure = dict(vendor_name=ctx.vendor_name, status_code=500, status="fail", error_message=str(e))
+            self.log_request(ctx, **failure)
+
+        raise self.vendors_exhausted(ctx)
+
+    def persist(self, ctx):
+        self.finish_saved(ctx, self.spec.save(ctx.normalized, ctx.client.id))
+
+    def log(self, ctx):
+        if ctx.outcome is not None:
+            self.log_request(ctx, **ctx.outcome)
+
+
+class AsyncKycPipeline(KycPipeline):
+    """
+    ``KycPipeline`` for the async views. ``arun`` awaits ``a<stage>`` where a
+    stage has an async variant and runs the sync stage in a worker thread
+    otherwise, so stages added to ``KycPipeline`` also apply here.
+    """
+
+    async def arun(self, ctx):
+        ctx.resources = AsyncExitStack()
+        try:
+            for stage in self.stages:
+                if ctx.result is not None:
+                    break
+                await self.arun_stage(stage, ctx)
+        finally:
+            await ctx.resources.aclose()
+
+        for stage in self.final_stages:
+            await self.arun_stage(stage, ctx)
+        return ctx.result
+
+    async def arun_stage(self, stage, ctx):
+        started = time.perf_counter()
+        try:
+            method = getattr(self, f"a{stage}", None)
+            if method is not None:
+                await method(ctx)
+            else:
+                await sync_to_async(getattr(self, stage))(ctx)
+        except PipelineStop as stop:
+            ctx.stop(stop)
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            ctx.timings[stage] = ctx.timings.get(stage, 0) + elapsed
+
+    async def alog_request(self, ctx, **fields):
+        await log_sink.asubmit(self.log_entry(ctx, **fields))
+
+    async def avalidate(self, ctx):
+        self.validate(ctx)
+
+    async def acache(self, ctx):
+        spec = self.spec
+        ctx.flight = await ctx.resources.enter_async_context(spec.async_flight(ctx.identifier, ctx.extra))
+        cached = await ctx.flight.lookup(
+            lambda: spec.afind_cached(ctx.identifier, ctx.extra, ctx.serve_after),
+            known_invalid=get_invalid_identifier,
+        )
+
+        if isinstance(cached, InvalidIdentifier):
+            raise PipelineStop(404, cached.reason, vendor_name="NEGATIVE_CACHE")
+        if cached:
+            self.finish_cached(ctx, cached)
+
+    async def avendor_chain(self, ctx):
+        attempts = self.vendor_attempts(ctx, self.spec.acall)
+        try:
+            async for attempt in attempts:
+                normalized, failure = self.check_attempt(ctx, attempt)
+                if normalized:
+                    ctx.vendor_name, ctx.normalized = attempt.vendor.vendor_name, normalized
+                    try:
+                        await self.arun_stage("persist", ctx)
+                        return
+                    except Exception as e:
+                        failure = dict(
+                            vendor_name=ctx.vendor_name, status_code=500, status="fail", error_message=str(e)
+                        )
+                await self.alog_request(ctx, **failure)
+        finally:
+            await attempts.aclose()
+
+        raise self.vendors_exhausted(ctx)
+
+    async def apersist(self, ctx):
+        self.finish_saved(ctx, await self.spec.asave(ctx.normalized, ctx.client.id))
+
+    async def alog(self, ctx):
+        if ctx.outcome is not None:
+            await self.alog_request(ctx, **ctx.outcome)
+
+
+# Response wording the RC and driving licence endpoints have always used
+PIPELINE_OPTIONS = {
+    "RC": {"success_message": "Data retrieved from {vendor}", "exhausted_error": "All vendors failed"},
+    "DRIVING": {"unconfigured_status": 403},
+}
+
+_pipelines = {}
+
+
+def get_pipeline(service, environment, pipeline_class=KycPipeline):
+    """The shared ``pipeline_class`` instance for a service and environment."""
+    key = (service, environment, pipeline_class)
+    pipeline = _pipelines.get(key)
+    if pipeline is None:
+        spec = get_kyc_service(service, environment)
+        pipeline = _pipelines[key] = pipeline_class(spec, **PIPELINE_OPTIONS.get(service, {}))
+    return pipeline
@@ -0,0 +1,331 @@
+import re
+from datetime import datetime
+
+from asgiref.sync import sync_to_async
+from django.db.models.functions import Upper
+
+from kyc_api_gateway.models import (
+    ProBillRequestLog,
+    ProDrivingLicense,
+    ProDrivingLicenseRequestLog,
+    ProElectricityBill,
+    ProNameMatch,
+    ProNameMatchRequestLog,
+    ProPanDetails,
+    ProPanRequestLog,
+    ProRcDetails,
+    ProRcRequestLog,
+    ProVoterDetail,
+    ProVoterRequestLog,
+    UatBillRequestLog,
+    UatDrivingLicense,
+    UatDrivingLicenseRequestLog,
+    UatElectricityBill,
+    UatNameMatch,
+    UatNameMatchRequestLog,
+    UatPanDetails,
+    UatPanRequestLog,
+    UatRcDetails,
+    UatRcRequestLog,
+    UatVoterDetail,
+    UatVoterRequestLog,
+)
+from kyc_api_gateway.serializers.pro_bill_details_serializer import ProElectricityBillSerializer
+from kyc_api_gateway.serializers.pro_driving_serializer import ProDrivingLicenseSerializer
+from kyc_api_gateway.serializers.pro_name_match_serializer import ProNameMatchSerializer
+from kyc_api_gateway.serializers.pro_pan_details_serializer import ProPanDetailsSerializer
+from kyc_api_gateway.serializers.pro_rc_detail_serializer import ProRcDetailsSerializer
+from kyc_api_gateway.serializers.pro_voter_details_serializer import ProVoterDetailSerializer
+from kyc_api_gateway.serializers.uat_bill_details_serializer import UatElectricityBillSerializer
+from kyc_api_gateway.serializers.uat_driving_serializer import UatDrivingLicenseSerializer
+from kyc_api_gateway.serializers.uat_name_match_serializer import UatNameMatchSerializer
+from kyc_api_gateway.serializers.uat_pan_details_serializer import UatPanDetailsSerializer
+from kyc_api_gateway.serializers.uat_rc_detail_serializer import UatRcDetailsSerializer
+from kyc_api_gateway.serializers.uat_voter_details_serializer import UatVoterDetailSerializer
+from kyc_api_gateway.services.pro import bill_handler as pro_bill
+from kyc_api_gateway.services.pro import driving_license_handler as pro_dl
+from kyc_api_gateway.services.pro import name_handler as pro_name
+from kyc_api_gateway.services.pro import pan_handler as pro_pan
+from kyc_api_gateway.services.pro import rc_handler as pro_rc
+from kyc_api_gateway.services.pro import voter_handler as pro_voter
+from kyc_api_gateway.services.uat import bill_handler as uat_bill
+from kyc_api_gateway.services.uat import driving_license_handler as uat_dl
+from kyc_api_gateway.services.uat import name_handler as uat_name
+from kyc_api_gateway.services.uat import pan_handler as uat_pan
+from kyc_api_gateway.services.uat import rc_handler as uat_rc
+from kyc_api_gateway.services.uat import voter_handler as uat_voter
+from kyc_api_gateway.services.vendor_adapters import acall_vendor
+from kyc_api_gateway.utils.identifiers import normalize_identifier
+from kyc_api_gateway.utils.single_flight import async_single_flight, single_flight
+
+
+PAN_PATTERN = re.compile(r"^[A-Z]{5}[0-9]{4}[A-Z]$")
+IDENTIFIER_MAX_LENGTH = 100
+
+# Same formats the driving licence views accept
+DOB_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y")
+
+
+class KycService:
+    """
+    Everything needed to look up one KYC service in one environment outside
+    its sync view (bulk job worker, async views): the view's handler
+    functions, details model, serializer and request log model, so such a
+    lookup caches, saves, serializes and logs exactly like a sync one.
+
+    ``columns`` are the accepted names of the identifier field in a request
+    body or upload row, the first being the key the vendor handler expects.
+    """
+
+    def __init__(self, name, environment, model, serializer, columns, detail_field, call, normalize, save,
+                 log_model, log_detail_field, log_identifier_field=None, pattern=None, missing_error=None):
+        self.name = name
+        self.environment = environment
+        self.model = model
+        self.serializer = serializer
+        self.columns = columns
+        self.detail_field = detail_field
+        self.call = call
+        self.normalize_response = normalize
+        self.save_details = save
+        self.log_model = log_model
+        self.log_detail_field = log_detail_field
+        self.log_identifier_field = log_identifier_field
+        self.pattern = pattern
+        self.missing_error = missing_error or f"Missing required field: {columns[0]}"
+        self._log_fields = {field.name for field in log_model._meta.get_fields()}
+
+    def raw_identifier(self, row):
+        for column in self.columns:
+            value = row.get(column)
+            if value not in (None, ""):
+                return str(value)[:IDENTIFIER_MAX_LENGTH]
+        return None
+
+    def parse(self, row, strict=False):
+        """
+        ``(identifier, extra)`` for a request body or upload row; raises
+        ValueError if it is unusable. ``strict`` also checks the identifier's
+        format, where the service has one (the sync views leave that to the
+        vendors).
+        """
+        identifier = normalize_identifier(self.raw_identifier(row))
+        if not identifier:
+            raise ValueError(self.missing_error)
+        if strict and self.pattern and not self.pattern.match(identifier):
+            raise ValueError(f"Invalid {self.columns[0]}: {identifier}")
+        return identifier, {}
+
+    def request_data(self, identifier, extra, row=None):
+        """What the sync view would pass the handler as ``request.data``."""
+        return {**(row or {}), self.columns[0]: identifier}
+
+    def cached(self, identifier, extra, since):
+        return self.model.objects.filter(
+            **{self.detail_field: identifier},
+            created_at__gte=since,
+        )
+
+    def find_cached(self, identifier, extra, since):
+        return self.cached(identifier, extra, since).first()
+
+    async def afind_cached(self, identifier, extra, since):
+        return await self.cached(identifier, extra, since).afirst()
+
+    def flight_parts(self, identifier, extra):
+        return (identifier,)
+
+    def flight(self, identifier, extra):
+        return single_flight(self.name, self.environment, *self.flight_parts(identifier, extra))
+
+    def async_flight(self, identifier, extra):
+        return async_single_flight(self.name, self.environment, *self.flight_parts(identifier, extra))
+
+    def normalize(self, vendor_name, data, request_data):
+        return self.normalize_response(vendor_name, data)
+
+    def save(self, normalized, created_by):
+        return self.save_details(normalized, created_by)
+
+    async def asave(self, normalized, created_by):
+        # store_detail may lock and snapshot rows in a transaction, which the
+        # async ORM cannot do
+        return await sync_to_async(self.save_details)(normalized, created_by)
+
+    async def acall(self, vendor, request_data, timeout=None):
+        """Async counterpart of the handler's call function, with the same return contract."""
+        return await acall_vendor(self.name, self.environment, vendor, request_data, timeout=timeout)
+
+    def log_identity(self, identifier, extra):
+        if self.log_identifier_field:
+            return {self.log_identifier_field: identifier}
+        return {}
+
+    def build_log(self, identifier, extra, details=None, **fields):
+        """Unsaved request log row; ``fields`` missing from the log model are dropped."""
+        values = {**self.log_identity(identifier, extra), self.log_detail_field: details, **fields}
+        return self.log_model(**{key: value for key, value in values.items() if key in self._log_fields})
+
+
+class DrivingLicenseService(KycService):
+    """Driving licences are looked up by number and date of birth."""
+
+    def parse(self, row, strict=False):
+        dob = str(row.get("dob") or "").strip()
+        missing = [field for field, value in (("license_no", self.raw_identifier(row)), ("dob", dob)) if not value]
+        if missing:
+            raise ValueError(f"Missing required fields: {', '.join(missing)}")
+        identifier, extra = super().parse(row, strict)
+        for fmt in DOB_FORMATS:
+            try:
+                return identifier, {"dob": datetime.strptime(dob, fmt).date().isoformat()}
+            except ValueError:
+                continue
+        raise ValueError("Invalid DOB format")
+
+    def request_data(self, identifier, extra, row=None):
+        # The DL handlers take the date as DD-MM-YYYY, as clients send it
+        dob = datetime.strptime(extra["dob"], "%Y-%m-%d").strftime("%d-%m-%Y")
+        return {**(row or {}), self.columns[0]: identifier, "dob": dob}
+
+    def cached(self, identifier, extra, since):
+        return self.model.objects.filter(
+            dl_number=identifier,
+            dob=extra["dob"],
+            created_at__gte=since,
+        )
+
+    def flight_parts(self, identifier, extra):
+        return (identifier, extra["dob"])
+
+    def normalize(self, vendor_name, data, request_data):
+        return self.normalize_response(vendor_name, data, request_data)
+
+
+class BillService(KycService):
+    """Electricity bills are looked up by consumer number; the provider goes to the vendor."""
+
+    def parse(self, row, strict=False):
+        customer_id = str(self.raw_identifier(row) or "").strip()
+        service_provider = str(row.get("service_provider") or "").strip()
+        missing = [field for field, value in (("consumer_id", customer_id), ("service_provider", service_provider))
+                   if not value]
+        if missing:
+            raise ValueError(f"Missing required fields: {', '.join(missing)}")
+        return customer_id, {"service_provider": service_provider}
+
+    def request_data(self, identifier, extra, row=None):
+        return {**(row or {}), "consumer_id": identifier, "service_provider": extra["service_provider"]}
+
+    def log_identity(self, identifier, extra):
+        return {"customer_id": identifier, "operator_code": extra.get("service_provider")}
+
+
+class NameMatchService(KycService):
+    """Name matches are keyed by both names, compared case-insensitively."""
+
+    def parse(self, row, strict=False):
+        name_1 = str(row.get("name_1") or "").strip()
+        name_2 = str(row.get("name_2") or "").strip()
+        missing = [field for field, value in (("name1", name_1), ("name2", name_2)) if not value]
+        if missing:
+            raise ValueError(f"Missing required fields: {', '.join(missing)}")
+        return name_1, {"name_2": name_2}
+
+    def request_data(self, identifier, extra, row=None):
+        return {**(row or {}), "name_1": identifier, "name_2": extra["name_2"]}
+
+    def cached(self, identifier, extra, since):
+        return self.model.objects.alias(
+            name_1_upper=Upper("name_1"),
+            name_2_upper=Upper("name_2"),
+        ).filter(
+            name_1_upper=identifier.upper(),
+            name_2_upper=extra["name_2"].upper(),
+            created_at__gte=since,
+        )
+
+    def flight_parts(self, identifier, extra):
+        return (identifier, extra["name_2"])
+
+    def normalize(self, vendor_name, data, request_data):
+        return self.normalize_response(vendor_name, data, request_data)
+
+    def log_identity(self, identifier, extra):
+        return {"name_1": identifier, "name_2": extra.get("name_2")}
+
+
+PAN_COLUMNS = ("pan", "pan_number")
+VOTER_COLUMNS = ("id_number", "voter_id", "epic_no")
+RC_COLUMNS = ("rc_number",)
+DL_COLUMNS = ("license_no", "dl_number")
+BILL_COLUMNS = ("consumer_id", "id_number")
+NAME_COLUMNS = ("name_1",)
+
+KYC_SERVICES = {
+    ("PAN", "pro"): KycService(
+        "PAN", "pro", ProPanDetails, ProPanDetailsSerializer, PAN_COLUMNS, "pan_number",
+        pro_pan.call_vendor_api, pro_pan.normalize_vendor_response, pro_pan.save_pan_data,
+        ProPanRequestLog, "pan_details", "pan_number", pattern=PAN_PATTERN,
+    ),
+    ("PAN", "uat"): KycService(
+        "PAN", "uat", UatPanDetails, UatPanDetailsSerializer, PAN_COLUMNS, "pan_number",
+        uat_pan.call_vendor_api, uat_pan.normalize_vendor_response, uat_pan.save_pan_data,
+        UatPanRequestLog, "pan_details", "pan_number", pattern=PAN_PATTERN,
+    ),
+    ("VOTER", "pro"): KycService(
+        "VOTER", "pro", ProVoterDetail, ProVoterDetailSerializer, VOTER_COLUMNS, "voter_id",
+        pro_voter.call_voter_vendor_api, pro_voter.normalize_vendor_response, pro_voter.save_voter_data,
+        ProVoterRequestLog, "voter_detail", missing_error="Voter ID required",
+    ),
+    ("VOTER", "uat"): KycService(
+        "VOTER", "uat", UatVoterDetail, UatVoterDetailSerializer, VOTER_COLUMNS, "voter_id",
+        uat_voter.call_voter_vendor_api, uat_voter.normalize_vendor_response, uat_voter.save_voter_data,
+        UatVoterRequestLog, "voter_detail", missing_error="Voter ID required",
+    ),
+    ("RC", "pro"): KycService(
+        "RC", "pro", ProRcDetails, ProRcDetailsSerializer, RC_COLUMNS, "rc_number",
+        pro_rc.call_rc_vendor_api, pro_rc.normalize_response, pro_rc.save_data,
+        ProRcRequestLog, "rc_details", "rc_number", missing_error="RC number required",
+    ),
+    ("RC", "uat"): KycService(
+        "RC", "uat", UatRcDetails, UatRcDetailsSerializer, RC_COLUMNS, "rc_number",
+        uat_rc.call_rc_vendor_api, uat_rc.normalize_rc_response, uat_rc.save_rc_data,
+        UatRcRequestLog, "rc_details", "rc_number", missing_error="RC number required",
+    ),
+    ("DRIVING", "pro"): DrivingLicenseService(
+        "DRIVING", "pro", ProDrivingLicense, ProDrivingLicenseSerializer, DL_COLUMNS, "dl_number",
+        pro_dl.call_vendor_api_pro, pro_dl.normalize_vendor_response, pro_dl.save_pro,
+        ProDrivingLicenseRequestLog, "driving_license", "dl_number",
+    ),
+    ("DRIVING", "uat"): DrivingLicenseService(
+        "DRIVING", "uat", UatDrivingLicense, UatDrivingLicenseSerializer, DL_COLUMNS, "dl_number",
+        uat_dl.call_vendor_api_uat, uat_dl.normalize_vendor_response, uat_dl.save_uat,
+        UatDrivingLicenseRequestLog, "driving_license", "dl_number",
+    ),
+    ("BILL", "pro"): BillService(
+        "BILL", "pro", ProElectricityBill, ProElectricityBillSerializer, BILL_COLUMNS, "customer_id",
+        pro_bill.call_vendor_api, pro_bill.normalize_vendor_response, pro_bill.save_bill_data,
+        ProBillRequestLog, "bill_details",
+    ),
+    ("BILL", "uat"): BillService(
+        "BILL", "uat", UatElectricityBill, UatElectricityBillSerializer, BILL_COLUMNS, "customer_id",
+        uat_bill.call_vendor_api_uat, uat_bill.normalize_vendor_response, uat_bill.save_bill_data,
+        UatBillRequestLog, "bill_details",
+    ),
+    ("NAME", "pro"): NameMatchService(
+        "NAME", "pro", ProNameMatch, ProNameMatchSerializer, NAME_COLUMNS, "name_1",
+        pro_name.call_vendor_api, pro_name.normalize_vendor_response, pro_name.save_name_match,
+        ProNameMatchRequestLog, "name_match",
+    ),
+    ("NAME", "uat"): NameMatchService(
+        "NAME", "uat", UatNameMatch, UatNameMatchSerializer, NAME_COLUMNS, "name_1",
+        uat_name.call_vendor_api_uat, uat_name.normalize_vendor_response, uat_name.save_name_match_uat,
+        UatNameMatchRequestLog, "name_match",
+    ),
+}
+
+
+def get_kyc_service(service, environment):
+    """The ``KycService`` for a service/environment pair, or None if there is none."""
+    return KYC_SERVICES.get((str(service or "").upper(), str(environment or "").lower()))
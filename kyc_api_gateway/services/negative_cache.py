@@ -0,0 +1,25 @@
+from django.conf import settings
+
+from auth_system.utils.cache import TTLCache
+
+
+# Single-flight key (service:environment:identifier) -> InvalidIdentifier, for
+# lookups a vendor has definitively rejected. Short TTL: a document number that
+# was just issued should start resolving again soon.
+negative_cache = TTLCache(
+    maxsize=settings.KYC_NEGATIVE_CACHE_SIZE,
+    ttl=settings.KYC_NEGATIVE_CACHE_TTL,
+)
+
+
+def get_invalid_identifier(key):
+    if settings.KYC_NEGATIVE_CACHE_TTL <= 0:
+        return None
+    return negative_cache.get(key)
+
+
+def remember_invalid_identifier(key, invalid):
+    if settings.KYC_NEGATIVE_CACHE_TTL <= 0:
+        return
+    print(f"[INFO] Caching invalid identifier {key} ({invalid.vendor_name}: {invalid.reason})")
+    negative_cache.set(key, invalid)
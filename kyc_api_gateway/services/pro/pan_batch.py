@@ -0,0 +1,269 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connections
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+from kyc_api_gateway.models import ProPanDetails
+from kyc_api_gateway.models.pro_pan_request_log import ProPanRequestLog
+from kyc_api_gateway.services.circuit_breaker import VendorCircuitBreakerGuard
+from kyc_api_gateway.services.detail_store import store_details
+from kyc_api_gateway.services.negative_cache import get_invalid_identifier, remember_invalid_identifier
+from kyc_api_gateway.services.pro.pan_handler import (
+    call_vendor_api,
+    normalize_vendor_response,
+    pan_detail_fields,
+    save_pan_data,
+)
+from kyc_api_gateway.services.revalidate import get_stale_cutoff, schedule_refresh
+from kyc_api_gateway.services.vendor_chain import get_hedge_delay, iter_vendor_attempts
+from kyc_api_gateway.utils.deadline import Deadline
+from kyc_api_gateway.utils.identifiers import detect_invalid_identifier
+from kyc_api_gateway.utils.single_flight import single_flight
+from auth_system.utils.log_sink import log_sink
+from constant import KYC_MY_SERVICES
+
+
+SERVICE_NAME = "PAN"
+ENVIRONMENT = "pro"
+
+INVALID_ITEM_ERROR = "Missing or invalid pan"
+
+# Shared by every batch request so the total number of concurrent vendor
+# lookups stays bounded however many batches arrive at once.
+_batch_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, "KYC_BATCH_MAX_WORKERS", 8),
+    thread_name_prefix="kyc-pan-batch",
+)
+
+
+class PanBatchItem:
+    """Outcome of one PAN in a batch."""
+
+    def __init__(self, pan):
+        self.pan = pan
+        self.details = None      # ProPanDetails, from cache or freshly saved
+        self.normalized = None   # vendor result waiting to be saved
+        self.source = None       # "CACHE" or the vendor name
+        self.stale = False
+        self.invalid = None      # InvalidIdentifier
+        self.error = None
+        self.status = None       # HTTP-style status of the item when it failed
+        self.deadline = None     # this PAN's own time budget, started when its lookup starts
+        self.logs = []           # ProPanRequestLog entries, unsaved
+
+    @property
+    def flight_key(self):
+        return single_flight(SERVICE_NAME, ENVIRONMENT, self.pan).key
+
+
+def verify_pan_batch(pans, client, client_service, vendors, log_context):
+    """
+    Verify a list of unique, normalized PANs for ``client``.
+
+    Cache hits are resolved with one query returning the newest row per PAN,
+    the misses are looked up concurrently on the shared batch pool (vendor
+    calls only; no DB writes in the workers), then the new details and all
+    request logs are written in bulk. ``log_context`` holds the endpoint/ip_address/user_agent for the
+    request logs. Returns a ``PanBatchItem`` per PAN, in the order given.
+    """
+    items = [PanBatchItem(pan) for pan in pans]
+
+    pending = []
+    for item in items:
+        item.invalid = get_invalid_identifier(item.flight_key)
+        if item.invalid:
+            item.status = 404
+            item.logs.append(_log(item, "NEGATIVE_CACHE", 404, "fail", log_context, error=item.invalid.reason))
+        else:
+            pending.append(item)
+
+    misses = _resolve_cached(pending, client, client_service, vendors, log_context)
+    if not misses:
+        return _finish(items)
+
+    if not vendors:
+        for item in misses:
+            item.error, item.status = "No vendors assigned for this service", 403
+        return _finish(items)
+
+    batch_deadline = Deadline(settings.KYC_BATCH_DEADLINE_SECONDS)
+    breaker = VendorCircuitBreakerGuard(KYC_MY_SERVICES[SERVICE_NAME], ENVIRONMENT)
+    futures = [
+        _batch_executor.submit(_lookup, item, vendors, batch_deadline, client_service, breaker, log_context)
+        for item in misses
+    ]
+    for future in futures:
+        future.result()
+
+    found = [item for item in misses if item.normalized]
+    saved = store_details(ProPanDetails, [pan_detail_fields(item.normalized, client.id) for item in found])
+    for item, details in zip(found, saved):
+        item.details = details
+        item.logs.append(_log(item, item.source, 200, "success", log_context, details=details))
+
+    for item in misses:
+        if item.invalid:
+            remember_invalid_identifier(item.flight_key, item.invalid)
+        elif not item.details and not item.error:
+            if item.deadline is None or item.deadline.expired():
+                item.error, item.status = "Request deadline exceeded", 504
+            else:
+                item.error, item.status = "No vendor returned valid data", 404
+
+    return _finish(items)
+
+
+def _resolve_cached(items, client, client_service, vendors, log_context):
+    """Fill in cache hits for ``items`` with a single query; return the misses."""
+    if not items:
+        return []
+
+    fresh_after = timezone.now() - timedelta(days=client_service.day)
+    serve_after = get_stale_cutoff(client_service, fresh_after)
+
+    newest = {row.pan_number: row for row in newest_cached([item.pan for item in items], serve_after)}
+
+    misses = []
+    for item in items:
+        cached = newest.get(item.pan)
+        if not cached:
+            misses.append(item)
+            continue
+
+        item.details = cached
+        item.source = "CACHE"
+        item.stale = cached.created_at < fresh_after
+        if item.stale:
+            _schedule_refresh(item.pan, fresh_after, client, client_service, vendors)
+        item.logs.append(
+            _log(item, "CACHE_STALE" if item.stale else "CACHE", 200, "success", log_context, details=cached)
+        )
+    return misses
+
+
+def newest_cached(pans, serve_after):
+    """The newest ProPanDetails row created since ``serve_after`` for each of ``pans``, one row per PAN."""
+    rows = ProPanDetails.objects.filter(pan_number__in=pans, created_at__gte=serve_after)
+    if connections[rows.db].vendor == "postgresql":
+        # DISTINCT ON reads each PAN's rows newest first off the
+        # (pan_number, -created_at) index and keeps the first
+        return rows.order_by("pan_number", "-created_at", "-id").distinct("pan_number")
+    return rows.annotate(
+        recency=Window(RowNumber(), partition_by=F("pan_number"), order_by=[F("created_at").desc(), F("id").desc()]),
+    ).filter(recency=1)
+
+
+def _schedule_refresh(pan, fresh_after, client, client_service, vendors):
+    schedule_refresh(
+        single_flight(SERVICE_NAME, ENVIRONMENT, pan).key,
+        lambda: ProPanDetails.objects.filter(pan_number=pan, created_at__gte=fresh_after).first(),
+        [vp.vendor for vp in vendors],
+        lambda vendor, timeout: call_vendor_api(vendor, {"pan": pan}, timeout=timeout),
+        normalize_vendor_response,
+        lambda normalized: save_pan_data(normalized, client.id),
+        client_service,
+        breaker=VendorCircuitBreakerGuard(KYC_MY_SERVICES[SERVICE_NAME], ENVIRONMENT),
+    )
+
+
+def _lookup(item, vendors, batch_deadline, client_service, breaker, log_context):
+    """
+    Vendor chain for one PAN. Runs on the batch pool; only the breaker touches
+    the DB. The PAN gets the service's full deadline from when its lookup
+    starts, not from when the batch arrived, capped by what is left of
+    ``batch_deadline``; once that is spent the remaining PANs are not looked up.
+    """
+    if batch_deadline.expired():
+        item.error, item.status = "Batch deadline exceeded", 504
+        return
+
+    item.deadline = Deadline.for_service(client_service)
+    if item.deadline.remaining() > batch_deadline.remaining():
+        item.deadline = Deadline(batch_deadline.remaining())
+    deadline = item.deadline
+
+    close_old_connections()
+    try:
+        attempts = iter_vendor_attempts(
+            [vp.vendor for vp in vendors],
+            lambda vendor, timeout: call_vendor_api(vendor, {"pan": item.pan}, timeout=timeout),
+            deadline,
+            hedge_delay=get_hedge_delay(client_service),
+            breaker=breaker,
+        )
+        for attempt in attempts:
+            vendor_name = attempt.vendor.vendor_name
+            if attempt.error:
+                item.logs.append(_log(item, vendor_name, 500, "fail", log_context, error=str(attempt.error)))
+                continue
+
+            response = attempt.response
+            item.invalid = detect_invalid_identifier(vendor_name, response)
+            if item.invalid:
+                item.status = 404
+                item.logs.append(
+                    _log(item, vendor_name, 404, "fail", log_context, response=response, error=item.invalid.reason)
+                )
+                return
+
+            if isinstance(response, dict) and response.get("http_error"):
+                item.logs.append(_log(
+                    item, vendor_name, response.get("status_code") or 500, "fail", log_context,
+                    response=response.get("vendor_response"), error=response.get("error_message"),
+                ))
+                continue
+
+            normalized = normalize_vendor_response(vendor_name, response or {})
+            if not normalized:
+                item.logs.append(_log(item, vendor_name, 204, "fail", log_context, error="No valid data returned"))
+                continue
+
+            item.normalized = normalized
+            item.source = vendor_name
+            return
+    except Exception as e:
+        print(f"[ERROR] Batch lookup failed for PAN {item.pan}: {e}")
+        item.error, item.status = str(e), 500
+    finally:
+        close_old_connections()
+
+
+def _log(item, vendor_name, status_code, status, log_context, details=None, response=None, error=None):
+    return ProPanRequestLog(
+        pan_number=item.pan,
+        vendor=vendor_name,
+        endpoint=log_context.get("endpoint"),
+        status_code=status_code,
+        status=status,
+        request_payload={"pan": item.pan},
+        response_payload=response,
+        error_message=error,
+        pan_details=details,
+        ip_address=log_context.get("ip_address"),
+        user_agent=log_context.get("user_agent"),
+    )
+
+
+def log_invalid_items(values, log_context):
+    """Request log entries (400) for batch items that are not PANs, so were never looked up."""
+    log_sink.submit_many([
+        ProPanRequestLog(
+            endpoint=log_context.get("endpoint"),
+            status_code=400,
+            status="fail",
+            request_payload={"pan": value},
+            error_message=INVALID_ITEM_ERROR,
+            ip_address=log_context.get("ip_address"),
+            user_agent=log_context.get("user_agent"),
+        )
+        for value in values
+    ])
+
+
+def _finish(items):
+    log_sink.submit_many([log for item in items for log in item.logs])
+    return items
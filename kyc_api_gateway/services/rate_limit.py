@@ -0,0 +1,292 @@
+import atexit
+import math
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from constant import QUOTA_DAY, QUOTA_MONTH
+from kyc_api_gateway.models import KycClientUsage
+
+
+class Throttled:
+    """Why a client's request was refused, and when it is worth retrying."""
+
+    def __init__(self, reason, retry_after):
+        self.reason = reason
+        self.retry_after = max(math.ceil(retry_after), 1)  # whole seconds, for Retry-After
+
+
+class TokenBucket:
+    """
+    ``rate`` tokens per second, holding at most ``burst``. A request bigger than
+    the burst (a PAN batch) is let through once the bucket is full and leaves
+    it in debt, so the client then waits as long as the batch would have taken.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+
+    def take(self, count=1):
+        """Take ``count`` tokens; returns 0, or the seconds to wait before retrying."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+        needed = min(count, self.burst)
+        if self.tokens >= needed:
+            self.tokens -= count
+            return 0
+        return (needed - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """Token bucket per client service, in this worker process."""
+
+    def __init__(self):
+        self.throttled = 0
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def take(self, client_service, count=1):
+        rate = client_service.rate_limit_per_second
+        if not rate or rate <= 0:
+            return 0
+
+        processes = max(settings.KYC_WORKER_PROCESSES, 1)
+        burst = client_service.rate_limit_burst or rate
+        rate, burst = rate / processes, max(burst / processes, 1)
+
+        with self._lock:
+            bucket = self._buckets.get(client_service.pk)
+            if bucket is None or (bucket.rate, bucket.burst) != (rate, burst):
+                # New client service, or its limits were changed
+                bucket = self._buckets[client_service.pk] = TokenBucket(rate, burst)
+            wait = bucket.take(count)
+            if wait:
+                self.throttled += 1
+            return wait
+
+    def clear(self):
+        with self._lock:
+            self._buckets = {}
+
+
+def quota_limits(client_service):
+    """``[(period, quota)]`` for the quotas set on a client service."""
+    limits = []
+    if client_service.daily_quota is not None:
+        limits.append((QUOTA_DAY, client_service.daily_quota))
+    if client_service.monthly_quota is not None:
+        limits.append((QUOTA_MONTH, client_service.monthly_quota))
+    return limits
+
+
+def get_period_start(period, today):
+    return today if period == QUOTA_DAY else today.replace(day=1)
+
+
+def seconds_until_next_period(period, now):
+    today = now.date()
+    if period == QUOTA_DAY:
+        next_start = today + timedelta(days=1)
+    else:
+        next_start = (today.replace(day=28) + timedelta(days=4)).replace(day=1)
+    boundary = timezone.make_aware(datetime.combine(next_start, datetime.min.time()), now.tzinfo)
+    return (boundary - now).total_seconds()
+
+
+class QuotaCounter:
+    """
+    Per-process view of quota usage in kyc_client_usage. ``_totals`` holds each
+    (client, service, period, period_start) count as last read from the DB plus
+    what this process has flushed since; ``_pending`` what it admitted and has
+    not flushed yet. Checks only read memory. A background thread adds the
+    pending counts with one F() update per row every ``flush_interval`` seconds
+    and re-reads the totals, which is how usage from other workers shows up.
+    """
+
+    def __init__(self, flush_interval=None):
+        self.flush_interval = flush_interval or settings.KYC_QUOTA_FLUSH_SECONDS
+        self.rejected = 0
+        self.flush_failures = 0
+
+        self._totals = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self._stopped = threading.Event()
+
+    def consume(self, client_service, count=1, now=None):
+        """Count ``count`` requests; returns ``Throttled`` instead if a quota would be exceeded."""
+        limits = quota_limits(client_service)
+        if not limits:
+            return None
+
+        self._ensure_started()
+        now = timezone.localtime(now)
+        keys = [
+            (client_service.client_id, client_service.myservice_id, period, get_period_start(period, now.date()))
+            for period, _ in limits
+        ]
+        missing = [key for key in keys if key not in self._totals]
+        if missing:
+            # First request of the period seen by this process
+            self._load(missing)
+
+        with self._lock:
+            for (period, quota), key in zip(limits, keys):
+                used = self._totals.get(key, 0) + self._pending.get(key, 0)
+                if used + count > quota:
+                    self.rejected += 1
+                    return Throttled(
+                        f"{'Daily' if period == QUOTA_DAY else 'Monthly'} quota of {quota} requests exceeded",
+                        seconds_until_next_period(period, now),
+                    )
+            for key in keys:
+                self._pending[key] = self._pending.get(key, 0) + count
+        return None
+
+    def flush(self):
+        """Write pending counts to kyc_client_usage and re-read the totals."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            for key, count in pending.items():
+                self._totals[key] = self._totals.get(key, 0) + count
+
+        for key, count in pending.items():
+            try:
+                add_usage(key, count)
+            except Exception as e:
+                self.flush_failures += 1
+                print(f"[ERROR] Quota usage flush failed for {key}: {e}")
+                with self._lock:
+                    self._totals[key] -= count
+                    self._pending[key] = self._pending.get(key, 0) + count
+
+        self._prune()
+        with self._lock:
+            keys = list(self._totals)
+        if keys:
+            self._load(keys)
+
+    def stop(self, timeout=5.0):
+        if self._thread is None or self._pid != os.getpid():
+            return
+        self._stopped.set()
+        self._thread.join(timeout)
+        self._thread = None
+        self.flush()
+
+    def clear(self):
+        with self._lock:
+            self._totals = {}
+            self._pending = {}
+
+    def stats(self):
+        with self._lock:
+            return {
+                "tracked": len(self._totals),
+                "pending": sum(self._pending.values()),
+                "rejected": self.rejected,
+                "flush_failures": self.flush_failures,
+            }
+
+    def _load(self, keys):
+        condition = Q()
+        for client_id, service_id, period, period_start in keys:
+            condition |= Q(client_id=client_id, my_service_id=service_id, period=period, period_start=period_start)
+        counts = {
+            (row["client_id"], row["my_service_id"], row["period"], row["period_start"]): row["request_count"]
+            for row in KycClientUsage.objects.filter(condition).values(
+                "client_id", "my_service_id", "period", "period_start", "request_count"
+            )
+        }
+        with self._lock:
+            for key in keys:
+                self._totals[key] = counts.get(key, 0)
+
+    def _prune(self):
+        # Drop periods that have ended; their rows stay in the DB
+        today = timezone.localdate()
+        current = {QUOTA_DAY: get_period_start(QUOTA_DAY, today), QUOTA_MONTH: get_period_start(QUOTA_MONTH, today)}
+        with self._lock:
+            for key in list(self._totals):
+                if key[3] < current[key[2]] and key not in self._pending:
+                    del self._totals[key]
+
+    def _ensure_started(self):
+        # A forked worker (gunicorn --preload) inherits the object but not the thread
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._stopped = threading.Event()
+            self._thread = threading.Thread(target=self._run, name="quota-flush", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stopped.wait(self.flush_interval):
+            close_old_connections()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[ERROR] Quota usage flush failed: {e}")
+
+
+def add_usage(key, count):
+    client_id, service_id, period, period_start = key
+    rows = KycClientUsage.objects.filter(
+        client_id=client_id, my_service_id=service_id, period=period, period_start=period_start
+    )
+    if rows.update(request_count=F("request_count") + count, updated_at=timezone.now()):
+        return
+    try:
+        with transaction.atomic():
+            KycClientUsage.objects.create(
+                client_id=client_id,
+                my_service_id=service_id,
+                period=period,
+                period_start=period_start,
+                request_count=count,
+            )
+    except IntegrityError:
+        # Another worker created the row first
+        rows.update(request_count=F("request_count") + count, updated_at=timezone.now())
+
+
+rate_limiter = RateLimiter()
+quota_counter = QuotaCounter()
+
+atexit.register(quota_counter.stop)
+
+
+def check_rate_limit(client_service, count=1):
+    """
+    Admit ``count`` requests for a client service: ``None`` if they are within
+    its rate limit and quotas, else ``Throttled``. Refused requests do not use
+    up quota.
+    """
+    if not settings.KYC_RATE_LIMIT_ENABLED:
+        return None
+
+    wait = rate_limiter.take(client_service, count)
+    if wait:
+        return Throttled("Rate limit exceeded", wait)
+
+    try:
+        return quota_counter.consume(client_service, count)
+    except Exception as e:
+        print(f"[ERROR] Quota check failed for client={client_service.client_id}: {e}")
+        return None
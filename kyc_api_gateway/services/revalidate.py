@@ -0,0 +1,93 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from kyc_api_gateway.services.vendor_chain import get_hedge_delay, iter_vendor_attempts
+from kyc_api_gateway.utils.deadline import Deadline
+from kyc_api_gateway.utils.single_flight import SingleFlight
+
+
+# Background vendor calls refreshing records served stale. Kept small: a refresh
+# is never on a client's critical path.
+_refresh_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, "KYC_REVALIDATE_MAX_WORKERS", 4),
+    thread_name_prefix="kyc-revalidate",
+)
+
+# Single-flight keys with a refresh queued or running in this process
+_pending = set()
+_pending_lock = threading.Lock()
+
+
+def get_stale_cutoff(client_service, fresh_after):
+    """Oldest ``created_at`` that may still be served (stale) for the client service."""
+    grace_days = max(getattr(client_service, "stale_grace_days", 0) or 0, 0)
+    return fresh_after - timedelta(days=grace_days)
+
+
+def schedule_refresh(key, fetch_fresh, vendors, call, normalize, save, client_service, breaker=None):
+    """
+    Refresh a record that was just served stale, through the normal vendor
+    priority chain, without holding up the request.
+
+    ``key`` is the single-flight key of the lookup, so a refresh never runs
+    twice at once for the same identifier and coalesces with foreground
+    misses. ``fetch_fresh()`` returns a fresh record if one appeared meanwhile;
+    ``normalize(vendor_name, data)`` and ``save(normalized)`` are the view's
+    handler functions. Returns False if a refresh for ``key`` is already queued.
+    """
+    with _pending_lock:
+        if key in _pending:
+            return False
+        _pending.add(key)
+
+    try:
+        _refresh_executor.submit(
+            _refresh, key, fetch_fresh, vendors, call, normalize, save, client_service, breaker
+        )
+    except RuntimeError as e:
+        # Interpreter shutting down
+        print(f"[WARN] Could not schedule refresh for {key}: {e}")
+        _discard(key)
+        return False
+    return True
+
+
+def _refresh(key, fetch_fresh, vendors, call, normalize, save, client_service, breaker):
+    close_old_connections()
+    try:
+        with SingleFlight(key) as flight:
+            if flight.lookup(fetch_fresh):
+                return
+
+            attempts = iter_vendor_attempts(
+                vendors,
+                call,
+                Deadline.for_service(client_service),
+                hedge_delay=get_hedge_delay(client_service),
+                breaker=breaker,
+            )
+            for attempt in attempts:
+                response = attempt.response
+                if attempt.error or not isinstance(response, dict) or response.get("http_error"):
+                    continue
+                normalized = normalize(attempt.vendor.vendor_name, response)
+                if normalized:
+                    save(normalized)
+                    print(f"[INFO] Refreshed stale record {key} from {attempt.vendor.vendor_name}")
+                    return
+
+            print(f"[WARN] Background refresh for {key} got no valid data, keeping stale record")
+    except Exception as e:
+        print(f"[ERROR] Background refresh failed for {key}: {e}")
+    finally:
+        _discard(key)
+        close_old_connections()
+
+
+def _discard(key):
+    with _pending_lock:
+        _pending.discard(key)
@@ -0,0 +1,80 @@
+from django.conf import settings
+
+from auth_system.utils.cache import TTLCache
+from kyc_api_gateway.models import KycClientServicesManagement, KycVendorPriority
+
+
+class Route:
+    """
+    Everything the KYC views need to know before calling a vendor for one
+    (client, service): the client service row (status, cache days, SLA,
+    hedging) and the vendor priority rows in order, with vendors loaded.
+    """
+
+    def __init__(self, client_service, vendors):
+        self.client_service = client_service
+        self.vendors = vendors
+
+    def uses_vendor(self, vendor_id):
+        return any(vp.vendor_id == vendor_id for vp in self.vendors)
+
+    def uses_priority(self, priority_id):
+        return any(vp.pk == priority_id for vp in self.vendors)
+
+
+# (client_id, service_id) -> Route. Signals in kyc_api_gateway/signals.py drop
+# the affected routes when the admin views change config rows; the next request
+# rebuilds just that route. The TTL bounds staleness on the other workers.
+routing_table = TTLCache(
+    maxsize=settings.KYC_ROUTING_CACHE_SIZE,
+    ttl=settings.KYC_ROUTING_CACHE_TTL,
+)
+
+
+def get_route(client, service_id):
+    key = (client.id, service_id)
+    route = routing_table.get(key)
+    if route is None:
+        route = build_route(client.id, service_id)
+        routing_table.set(key, route)
+    return route
+
+
+def build_route(client_id, service_id):
+    client_service = KycClientServicesManagement.objects.filter(
+        client_id=client_id,
+        myservice__id=service_id,
+        deleted_at__isnull=True,
+    ).first()
+
+    vendors = list(
+        KycVendorPriority.objects.filter(
+            client_id=client_id,
+            my_service_id=service_id,
+            deleted_at__isnull=True,
+        )
+        .select_related("vendor")
+        .order_by("priority")
+    )
+    return Route(client_service, vendors)
+
+
+def invalidate_route(client_id, service_id):
+    routing_table.delete((client_id, service_id))
+
+
+def invalidate_client_service(client_service):
+    invalidate_route(client_service.client_id, client_service.myservice_id)
+    # The row may have been moved to another client/service
+    routing_table.delete_where(
+        lambda key, route: route.client_service is not None and route.client_service.pk == client_service.pk
+    )
+
+
+def invalidate_vendor_priority(priority):
+    invalidate_route(priority.client_id, priority.my_service_id)
+    routing_table.delete_where(lambda key, route: route.uses_priority(priority.pk))
+
+
+def invalidate_vendor(vendor):
+    routing_table.delete_where(lambda key, route: route.uses_vendor(vendor.pk))
@@ -0,0 +1,724 @@
+from datetime import datetime
+from decimal import Decimal
+
+from decouple import config
+
+from kyc_api_gateway.services.bulkhead import BulkheadFull, vendor_bulkheads
+from kyc_api_gateway.utils.async_http import vendor_post_json as avendor_post_json
+from kyc_api_gateway.utils.constants import (
+    VENDOR_BILL_SERVICE_ENDPOINTS,
+    VENDOR_DRIVING_LICENSE_ENDPOINTS,
+    VENDOR_NAME_SERVICE_ENDPOINTS,
+    VENDOR_RC_SERVICE_ENDPOINTS,
+    VENDOR_SERVICE_ENDPOINTS,
+    VENDOR_VOTER_SERVICE_ENDPOINTS,
+)
+from kyc_api_gateway.utils.http_pool import vendor_post_json
+
+SUREPASS_TOKEN = config("SUREPASS_TOKEN", default=None)
+if not SUREPASS_TOKEN:
+    raise ValueError("SUREPASS_TOKEN is not set in your environment variables.")
+
+
+# Field getters. Every compiled map entry is a callable
+# ``getter(raw_data, result, request_data)``; paths are split once, when the
+# adapter is registered, not on every call.
+
+_SOURCES = {"raw": 0, "result": 1, "request": 2}
+
+
+def _compile_path(path):
+    return tuple(int(part) if part.isdigit() else part for part in path.split("."))
+
+
+def _walk(value, path):
+    for part in path:
+        if isinstance(value, dict):
+            value = value.get(part)
+        elif isinstance(value, list) and isinstance(part, int):
+            value = value[part] if part < len(value) else None
+        else:
+            return None
+    return value
+
+
+def field(*paths, default=None, then=None, source="result"):
+    """
+    Value at the first of ``paths`` ("a.b.0.c") that is set, in the vendor's
+    result object, the whole vendor response (``source="raw"``) or the request
+    data (``source="request"``). Like ``a or b``, the last path's value is used
+    when none is truthy. ``then`` converts the value.
+    """
+    index = _SOURCES[source]
+    compiled = tuple(_compile_path(path) for path in paths)
+
+    def get(*context):
+        value = None
+        for path in compiled:
+            value = _walk(context[index], path)
+            if value:
+                break
+        if value is None or value == "":
+            value = default
+        return then(value) if then else value
+
+    return get
+
+
+def raw_field(*paths, **kwargs):
+    return field(*paths, source="raw", **kwargs)
+
+
+def request_field(*paths, **kwargs):
+    return field(*paths, source="request", **kwargs)
+
+
+def first(*getters):
+    """The first truthy value of ``getters``, else the last one's value."""
+    def get(*context):
+        value = None
+        for getter in getters:
+            value = getter(*context)
+            if value:
+                break
+        return value
+
+    return get
+
+
+def whole_response(raw_data, result, request_data):
+    return raw_data
+
+
+def compile_map(mapping):
+    """
+    Compile a field map (output key -> getter, nested map or constant) into
+    ``build(raw_data, result, request_data)`` returning a fresh dict.
+    """
+    compiled = []
+    for key, spec in mapping.items():
+        if isinstance(spec, dict):
+            compiled.append((key, compile_map(spec)))
+        elif callable(spec):
+            compiled.append((key, spec))
+        else:
+            compiled.append((key, lambda *context, value=spec: value))
+    compiled = tuple(compiled)
+
+    def build(raw_data, result, request_data):
+        return {key: getter(raw_data, result, request_data) for key, getter in compiled}
+
+    return build
+
+
+# Field converters
+
+def sanitize_decimal(value):
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.replace(",", "").strip()
+    try:
+        return Decimal(str(value))
+    except Exception:
+        return None
+
+
+def parse_dmy_date(value):
+    """DD-MM-YYYY string -> date, None if it isn't one."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%d-%m-%Y").date()
+    except (TypeError, ValueError):
+        return None
+
+
+def dmy_to_iso(value):
+    """DD-MM-YYYY -> YYYY-MM-DD; anything else is passed through."""
+    parsed = parse_dmy_date(value)
+    return parsed.isoformat() if parsed else value
+
+
+def surepass_gender(value):
+    return "male" if str(value or "").lower().startswith("m") else "female"
+
+
+def nth(index):
+    return lambda values: values[index] if len(values) > index else None
+
+
+# Auth header strategies: ``auth(vendor, environment) -> headers``
+
+def api_key_header(header):
+    """The vendor's own pro/uat API key in ``header``."""
+    def auth(vendor, environment):
+        return {header: vendor.prod_api_key if environment == "pro" else vendor.uat_api_key}
+
+    return auth
+
+
+def bearer_token(token):
+    def auth(vendor, environment):
+        return {"Authorization": f"Bearer {token}"}
+
+    return auth
+
+
+class VendorAdapter:
+    """
+    How one vendor serves one KYC service: endpoint, auth header strategy,
+    request template and response field map. The templates are compiled once,
+    so building a request or normalizing a response is a flat pass over
+    precomputed getters.
+
+    ``result_keys`` locate the result object in the vendor response (first
+    truthy one); with ``require_result`` an empty result means no data.
+    ``accept(raw_data)`` can reject a response outright (e.g. a failure
+    status code inside an HTTP 200).
+    """
+
+    def __init__(self, vendor, service, endpoint, auth, request, response,
+                 result_keys=("result", "data"), require_result=True, accept=None):
+        self.vendor = vendor
+        self.service = service
+        self.endpoint = endpoint.lstrip("/")
+        self.auth = auth
+        self.result_keys = result_keys
+        self.require_result = require_result
+        self.accept = accept
+        self._build_request = compile_map(request)
+        self._build_response = compile_map(response)
+
+    def build_request(self, request_data):
+        return self._build_request(None, None, request_data or {})
+
+    def vendor_request(self, vendor, environment, request_data):
+        """``(url, payload, headers)`` for ``vendor`` in ``environment``, or None if it has no base URL."""
+        base_url = vendor.prod_base_url if environment == "pro" else vendor.uat_base_url
+        if not base_url:
+            return None
+
+        headers = {"Content-Type": "application/json", **self.auth(vendor, environment)}
+        return f"{base_url.rstrip('/')}/{self.endpoint}", self.build_request(request_data), headers
+
+    def normalize(self, raw_data, request_data=None):
+        if not isinstance(raw_data, dict):
+            return None
+        if self.accept and not self.accept(raw_data):
+            return None
+
+        result = None
+        for key in self.result_keys:
+            result = raw_data.get(key)
+            if result:
+                break
+        if not result:
+            if self.require_result:
+                return None
+            result = {}
+        return self._build_response(raw_data, result, request_data or {})
+
+
+VENDOR_ADAPTERS = {}
+
+
+def register_adapter(adapter):
+    VENDOR_ADAPTERS[(adapter.vendor, adapter.service)] = adapter
+    return adapter
+
+
+def get_adapter(vendor_name, service):
+    """The adapter for a vendor (by name, any case) and KYC service name, or None."""
+    return VENDOR_ADAPTERS.get(((vendor_name or "").lower(), service))
+
+
+def _not_configured(vendor):
+    return {
+        "http_error": True,
+        "status_code": None,
+        "vendor_response": None,
+        "error_message": f"Vendor '{vendor.vendor_name}' not configured properly."
+    }
+
+
+def _bulkhead_full(vendor, error):
+    # Not the vendor's fault, so the circuit breaker ignores it
+    return {
+        "http_error": True,
+        "status_code": 503,
+        "vendor_response": None,
+        "error_message": f"Vendor {vendor.vendor_name} is at its concurrency limit ({error})",
+        "bulkhead_full": True,
+    }
+
+
+def call_vendor(service, environment, vendor, request_data, timeout=None):
+    """
+    Call ``vendor`` for ``service``; returns the vendor JSON or an
+    ``http_error`` dict, as every handler's call function does. With
+    ``max_in_flight`` set on the vendor the call first takes a slot of its
+    bulkhead; if none frees up in time the error dict says so and the vendor
+    chain moves on to the next vendor.
+    """
+    adapter = get_adapter(vendor.vendor_name, service)
+    vendor_request = adapter.vendor_request(vendor, environment, request_data) if adapter else None
+    if vendor_request is None:
+        return _not_configured(vendor)
+
+    url, payload, headers = vendor_request
+    bulkhead = vendor_bulkheads.get(vendor, service)
+    if bulkhead is None:
+        return vendor_post_json(vendor, url, payload, headers, timeout=timeout)
+    try:
+        with bulkhead.slot():
+            return vendor_post_json(vendor, url, payload, headers, timeout=timeout)
+    except BulkheadFull as e:
+        return _bulkhead_full(vendor, e)
+
+
+async def acall_vendor(service, environment, vendor, request_data, timeout=None):
+    """Async counterpart of ``call_vendor``, through the pooled httpx client."""
+    adapter = get_adapter(vendor.vendor_name, service)
+    vendor_request = adapter.vendor_request(vendor, environment, request_data) if adapter else None
+    if vendor_request is None:
+        return _not_configured(vendor)
+
+    url, payload, headers = vendor_request
+    bulkhead = vendor_bulkheads.get(vendor, service)
+    if bulkhead is None:
+        return await avendor_post_json(vendor, url, payload, headers, timeout=timeout)
+    try:
+        async with bulkhead.aslot():
+            return await avendor_post_json(vendor, url, payload, headers, timeout=timeout)
+    except BulkheadFull as e:
+        return _bulkhead_full(vendor, e)
+
+
+def normalize_response(service, vendor_name, raw_data, request_data=None):
+    """A vendor response as the service's save function expects it, or None if it has no usable data."""
+    adapter = get_adapter(vendor_name, service)
+    return adapter.normalize(raw_data, request_data) if adapter else None
+
+
+karza_auth = api_key_header("x-karza-key")
+surepass_auth = bearer_token(SUREPASS_TOKEN)
+
+
+# PAN
+
+register_adapter(VendorAdapter(
+    "karza", "PAN", VENDOR_SERVICE_ENDPOINTS["karza"], karza_auth,
+    request={
+        "pan": request_field("pan"),
+        "aadhaarLastFour": "",
+        "dob": "",
+        "name": "",
+        "address": "",
+        "getContactDetails": "Y",
+        "PANStatus": "Y",
+        "isSalaried": "Y",
+        "isDirector": "Y",
+        "isSoleProp": "Y",
+        "consent": "Y",
+    },
+    response={
+        "request_id": raw_field("requestId"),
+        "pan_number": field("pan"),
+        "full_name": field("name"),
+        "first_name": field("firstName"),
+        "middle_name": field("middleName"),
+        "last_name": field("lastName"),
+        "dob": field("dob"),
+        "gender": field("gender"),
+        "phone_number": field("mobileNo"),
+        "email": field("emailId"),
+        "aadhaar_linked": field("aadhaarLinked"),
+        "masked_aadhaar": field("masked_aadhaar"),
+        "aadhaar_match": field("aadhaarMatch"),
+        "pan_status": field("status"),
+        "is_salaried": field("isSalaried"),
+        "is_director": field("isDirector"),
+        "is_sole_prop": field("isSoleProp"),
+        "issue_date": field("issueDate"),
+        "address": {
+            "line_1": field("buildingName"),
+            "line_2": field("locality"),
+            "street_name": field("streetName"),
+            "city": field("city"),
+            "state": field("state"),
+            "zip": field("pinCode"),
+            "country": field("country"),
+            "full": field("fullAddress"),
+        },
+    },
+))
+
+register_adapter(VendorAdapter(
+    "surepass", "PAN", VENDOR_SERVICE_ENDPOINTS["surepass"], surepass_auth,
+    request={
+        "id_number": request_field("pan"),
+    },
+    response={
+        "client_id": field("client_id"),
+        "pan_number": field("pan_number"),
+        "full_name": field("full_name"),
+        "first_name": field("full_name_split", default=(), then=nth(0)),
+        "middle_name": field("full_name_split", default=(), then=nth(1)),
+        "last_name": field("full_name_split", default=(), then=nth(2)),
+        "dob": field("dob", "input_dob"),
+        "gender": field("gender", then=surepass_gender),
+        "phone_number": field("phone_number"),
+        "email": field("email"),
+        "aadhaar_linked": field("aadhaar_linked"),
+        "masked_aadhaar": field("masked_aadhaar"),
+        "dob_verified": field("dob_verified"),
+        "dob_check": field("dob_check"),
+        "category": field("category"),
+        "less_info": field("less_info"),
+        "address": field("address", default={}),
+    },
+))
+
+
+# Voter ID
+
+register_adapter(VendorAdapter(
+    "karza", "VOTER", VENDOR_VOTER_SERVICE_ENDPOINTS["karza"], karza_auth,
+    request={
+        "consent": request_field("consent", default="Y"),
+        "epicNo": request_field("id_number"),
+        "clientData": {"caseId": request_field("case_id", default="123456")},
+    },
+    response={
+        "vendor": "karza",
+        "client_id": raw_field("clientData.caseId"),
+        "epic_no": field("epicNo"),
+        "input_voter_id": field("epicNo"),
+        "name": field("name"),
+        "relation_name": field("rlnName"),
+        "relation_type": field("rlnType"),
+        "gender": field("gender"),
+        "dob": field("dob"),
+        "age": field("age", default="", then=str),
+        "district": field("district"),
+        "state": field("state"),
+        "assembly_constituency": field("acName"),
+        "assembly_constituency_number": field("acNo"),
+        "polling_station": field("psName"),
+        "part_no": field("partNo"),
+        "part_name": field("partName"),
+        "slno_in_part": field("slNoInPart"),
+        "ps_lat_long": field("psLatLong"),
+        "name_v1": field("nameV1"),
+        "name_v2": field("nameV2"),
+        "name_v3": field("nameV3"),
+        "rln_name_v1": field("rlnNameV1"),
+        "rln_name_v2": field("rlnNameV2"),
+        "rln_name_v3": field("rlnNameV3"),
+        "house_no": field("houseNo"),
+        "last_update": field("lastUpdate"),
+        "st_code": field("stCode"),
+        "parliamentary_name": field("pcName"),
+        "parliamentary_number": field("acNo"),
+    },
+    accept=lambda raw_data: raw_data.get("statusCode") == 101,
+))
+
+register_adapter(VendorAdapter(
+    "surepass", "VOTER", VENDOR_VOTER_SERVICE_ENDPOINTS["surepass"], surepass_auth,
+    request={
+        "id_number": request_field("id_number"),
+    },
+    response={
+        "vendor": "surepass",
+        "client_id": field("client_id"),
+        "epic_no": field("epic_no"),
+        "input_voter_id": field("epic_no"),
+        "name": field("name"),
+        "relation_name": field("name_v1"),
+        "relation_type": None,
+        "gender": field("gender", then=surepass_gender),
+        "dob": field("dob"),
+        "age": field("age", default="", then=str),
+        "district": field("district"),
+        "state": field("state"),
+        "assembly_constituency": field("assembly_constituency"),
+        "assembly_constituency_number": field("assembly_constituency_number"),
+        "polling_station": field("polling_station"),
+        "part_no": field("part_number"),
+        "part_name": field("part_name"),
+        "slno_in_part": field("slno_in_part"),
+        "ps_lat_long": field("ps_lat_long"),
+        "name_v1": field("name_v1"),
+        "name_v2": field("name_v2"),
+        "name_v3": field("name_v3"),
+        "rln_name_v1": field("rln_name_v1"),
+        "rln_name_v2": field("rln_name_v2"),
+        "rln_name_v3": field("rln_name_v3"),
+        "house_no": field("house_no"),
+        "last_update": field("last_update"),
+        "st_code": field("st_code"),
+        "parliamentary_name": field("parliamentary_name"),
+        "parliamentary_number": field("parliamentary_number"),
+    },
+    accept=lambda raw_data: bool(raw_data.get("success")),
+))
+
+
+# Vehicle RC
+
+register_adapter(VendorAdapter(
+    "karza", "RC", VENDOR_RC_SERVICE_ENDPOINTS["karza"], karza_auth,
+    request={
+        "reg_no": request_field("rc_number"),
+        "consent": request_field("consent", default="Y"),
+        "clientData": {"caseId": request_field("clientData.caseId", default="123456")},
+    },
+    response={
+        "vendor": "karza",
+        "client_id": raw_field("clientData.caseId"),
+        "rc_number": field("rc_regn_no"),
+        "owner_name": field("rc_owner_name"),
+        "father_name": field("rc_f_name"),
+        "present_address": field("rc_present_address"),
+        "mobile_number": field("rc_mobile_no"),
+        "maker_model": field("rc_maker_model"),
+        "maker_description": field("rc_maker_desc"),
+        "body_type": field("rc_body_type_desc"),
+        "fuel_type": field("rc_fuel_desc"),
+        "color": field("rc_color"),
+        "insurance_company": field("rc_insurance_comp"),
+        "insurance_policy_number": field("rc_insurance_policy_no"),
+        "insurance_upto": field("rc_insurance_upto"),
+        "fit_upto": field("rc_fit_upto"),
+        "registration_date": field("rc_regn_dt"),
+        "registered_at": field("rc_registered_at"),
+        "tax_upto": field("rc_tax_upto"),
+        "financer": field("rc_financer"),
+        "rc_status": field("rc_status_as_on"),
+    },
+    result_keys=("result",),
+    require_result=False,
+))
+
+register_adapter(VendorAdapter(
+    "surepass", "RC", VENDOR_RC_SERVICE_ENDPOINTS["surepass"], surepass_auth,
+    request={
+        "id_number": request_field("rc_number"),
+    },
+    response={
+        "vendor": "surepass",
+        "client_id": field("client_id"),
+        "rc_number": field("rc_number"),
+        "owner_name": field("owner_name"),
+        "father_name": field("father_name"),
+        "present_address": field("present_address"),
+        "permanent_address": field("permanent_address"),
+        "mobile_number": field("mobile_number"),
+        "maker_model": field("maker_model"),
+        "maker_description": field("maker_description"),
+        "body_type": field("body_type"),
+        "fuel_type": field("fuel_type"),
+        "color": field("color"),
+        "insurance_company": field("insurance_company"),
+        "insurance_policy_number": field("insurance_policy_number"),
+        "insurance_upto": field("insurance_upto"),
+        "fit_upto": field("fit_up_to"),
+        "registration_date": field("registration_date"),
+        "registered_at": field("registered_at"),
+        "tax_upto": field("tax_upto"),
+        "cubic_capacity": field("cubic_capacity"),
+        "vehicle_gross_weight": field("vehicle_gross_weight"),
+        "seat_capacity": field("seat_capacity"),
+        "unladen_weight": field("unladen_weight"),
+        "rc_status": field("rc_status"),
+    },
+    result_keys=("data",),
+    require_result=False,
+))
+
+
+# Driving licence
+
+def _karza_permanent_address(raw_data, result, request_data):
+    addresses = result.get("address") or []
+    if not isinstance(addresses, list) or not addresses:
+        return ""
+    for address in addresses:
+        if (address.get("type") or "").lower() == "permanent":
+            return address.get("completeAddress", "")
+    return addresses[0].get("completeAddress", "")
+
+
+register_adapter(VendorAdapter(
+    "karza", "DRIVING", VENDOR_DRIVING_LICENSE_ENDPOINTS["karza"], karza_auth,
+    request={
+        "dlNo": request_field("license_no", "dlNo"),
+        "dob": request_field("dob"),
+        "additionalDetails": True,
+        "consent": "Y",
+        "clientData": {"caseId": "123456"},
+    },
+    response={
+        "client_id": raw_field("requestId"),
+        "request_id": raw_field("requestId"),
+        "dl_number": first(field("dlNumber"), request_field("license_no")),
+        "dob": first(field("dob", then=parse_dmy_date), request_field("dob", then=parse_dmy_date)),
+        "name": field("name"),
+        "father_name": field("father/husband"),
+        "issue_date": field("issueDate", then=parse_dmy_date),
+        "valid_till": first(
+            field("validity.nonTransport", then=parse_dmy_date),
+            field("validity.transport", then=parse_dmy_date),
+        ),
+        "non_transport_validity": field("validity.nonTransport", then=parse_dmy_date),
+        "transport_validity": field("validity.transport", then=parse_dmy_date),
+        "address": _karza_permanent_address,
+        "state": field("address.0.state"),
+        "rto_code": None,
+        "blood_group": field("bloodGroup"),
+        "photo": field("img"),
+        "signature": None,
+        "is_verified": field("status", then=lambda status: status == "ACTIVE"),
+        "vendor_name": "karza",
+        "dl_status": field("status"),
+        "issuing_authority": field("endorsementAndHazardousDetails.initialIssuingOffice"),
+        "full_response": whole_response,
+    },
+    result_keys=("result",),
+    require_result=False,
+))
+
+register_adapter(VendorAdapter(
+    "surepass", "DRIVING", VENDOR_DRIVING_LICENSE_ENDPOINTS["surepass"], surepass_auth,
+    request={
+        "id_number": request_field("license_no", "dlNo"),
+        "dob": request_field("dob", then=dmy_to_iso),
+    },
+    response={
+        "client_id": field("client_id"),
+        "request_id": first(raw_field("request_id"), field("client_id")),
+        "dl_number": field("license_number"),
+        "name": field("name"),
+        "father_name": field("father_or_husband_name"),
+        "dob": field("dob"),
+        "issue_date": field("doi"),
+        "valid_till": field("doe"),
+        "non_transport_validity": field("transport_doi"),
+        "transport_validity": field("transport_doe"),
+        "address": field("permanent_address"),
+        "state": field("state"),
+        "rto_code": field("ola_code"),
+        "issuing_authority": field("ola_name"),
+        "blood_group": field("blood_group"),
+        "photo": field("profile_image"),
+        "dl_status": field("dl_status", default="Active"),
+        "vendor_name": "surepass",
+        "status": field("status"),
+    },
+    result_keys=("data",),
+    require_result=False,
+))
+
+
+# Electricity bill
+
+register_adapter(VendorAdapter(
+    "karza", "BILL", VENDOR_BILL_SERVICE_ENDPOINTS["karza"], karza_auth,
+    request={
+        "consumer_id": request_field("consumer_id"),
+        "service_provider": request_field("service_provider"),
+        "district": request_field("district", default=""),
+        "regMobileNo": request_field("regMobileNo", default=""),
+        "consent": {"consent": "Y"},
+        "clientData": {"caseId": request_field("caseId", default="123456")},
+    },
+    response={
+        "client_id": raw_field("request_id"),
+        "consumer_id": field("consumer_number", "consumer_id"),
+        "customer_id": field("consumer_number", "consumer_id"),
+        "full_name": field("consumer_name"),
+        "address": field("address"),
+        "mobile": field("mobile_number"),
+        "email": field("email_address"),
+        "bill_number": field("bill_no"),
+        "bill_amount": field("bill_amount", "amount_payable", then=sanitize_decimal),
+        "bill_due_date": field("bill_due_date", "dueDate"),
+        "bill_issue_date": field("bill_issue_date", "bill_date"),
+        "bill_status": field("status"),
+        "service_provider": field("service_provider"),
+        "district": field("district"),
+        "operator_code": field("operator_code"),
+    },
+))
+
+register_adapter(VendorAdapter(
+    "surepass", "BILL", VENDOR_BILL_SERVICE_ENDPOINTS["surepass"], surepass_auth,
+    request={
+        "id_number": request_field("consumer_id"),
+        "operator_code": request_field("service_provider"),
+    },
+    response={
+        "client_id": field("client_id"),
+        "consumer_id": field("customer_id", "id_number"),
+        "customer_id": field("customer_id", "id_number"),
+        "operator_code": field("operator_code"),
+        "state": field("state"),
+        "full_name": field("full_name"),
+        "address": field("address"),
+        "mobile": field("mobile"),
+        "email": field("user_email"),
+        "bill_number": field("bill_number"),
+        "bill_amount": field("bill_amount", then=sanitize_decimal),
+        "bill_due_date": field("bill_due_date"),
+        "bill_issue_date": field("bill_issue_date"),
+        "bill_status": field("bill_status"),
+        "document_link": field("document_link"),
+    },
+))
+
+
+# Name match
+
+register_adapter(VendorAdapter(
+    "karza", "NAME", VENDOR_NAME_SERVICE_ENDPOINTS["karza"], karza_auth,
+    request={
+        "name1": request_field("name_1", "name1"),
+        "name2": request_field("name_2", "name2"),
+        "type": request_field("type", default="individual"),
+        "preset": "s",
+        "allowPartialMatch": True,
+        "suppressReorderPenalty": True,
+        "clientData": {"caseId": request_field("case_id", default="123456")},
+    },
+    response={
+        "client_id": raw_field("requestId"),
+        "request_id": raw_field("requestId"),
+        "name_1": request_field("name_1", "name1"),
+        "name_2": request_field("name_2", "name2"),
+        "match_score": field("score", then=sanitize_decimal),
+        "match_status": field("result"),
+    },
+    result_keys=("result",),
+    require_result=False,
+))
+
+register_adapter(VendorAdapter(
+    "surepass", "NAME", VENDOR_NAME_SERVICE_ENDPOINTS["surepass"], surepass_auth,
+    request={
+        "name_1": request_field("name_1"),
+        "name_2": request_field("name_2"),
+        "name_type": request_field("name_type", default="person"),
+    },
+    response={
+        "client_id": field("client_id"),
+        "request_id": None,
+        "name_1": field("name_1"),
+        "name_2": field("name_2"),
+        "match_score": field("match_score", then=sanitize_decimal),
+        "match_status": field("match_status"),
+    },
+    result_keys=("data",),
+    require_result=False,
+))
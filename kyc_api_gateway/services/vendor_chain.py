@@ -0,0 +1,284 @@
+import asyncio
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+
+# Shared, bounded pool for hedged vendor calls. Only the HTTP call runs here;
+# normalizing, saving and logging stay on the request thread.
+_hedge_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, "KYC_HEDGE_MAX_WORKERS", 16),
+    thread_name_prefix="kyc-hedge",
+)
+
+# Pool for the plain fallback chain. Socket timeouts only bound each read, so a
+# vendor trickling bytes could hold the request thread past its deadline; the
+# request thread waits on the future instead and gives up on time.
+_call_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, "KYC_VENDOR_CALL_MAX_WORKERS", 32),
+    thread_name_prefix="kyc-vendor",
+)
+
+
+class VendorAttempt:
+    """Outcome of one vendor call: the handler response, or the exception it raised."""
+
+    def __init__(self, vendor, response=None, error=None, elapsed=0.0, hedged=False):
+        self.vendor = vendor
+        self.response = response
+        self.error = error
+        self.elapsed = elapsed
+        self.hedged = hedged
+
+
+def get_hedge_delay(client_service):
+    """Hedge delay in seconds for the client service, or None when hedging is off."""
+    if not getattr(client_service, "hedge_enabled", False):
+        return None
+    return max(client_service.hedge_delay_ms or 0, 0) / 1000
+
+
+def iter_vendor_attempts(vendors, call, deadline, hedge_delay=None, breaker=None):
+    """
+    Yield a ``VendorAttempt`` per vendor call, in the order they finish.
+
+    ``call(vendor, timeout)`` performs the vendor request. The caller inspects
+    each attempt and stops iterating on the first valid one; moving on to the
+    next attempt means the previous one failed and the next vendor is called.
+
+    With ``hedge_delay`` set, the next-priority vendor is also fired whenever
+    the in-flight calls have not answered within the delay, so the slowest
+    vendor no longer dictates the latency. Calls still in flight when the
+    caller picks a winner (or the deadline passes) are ignored and logged.
+
+    ``breaker`` (a ``VendorCircuitBreakerGuard``) skips vendors whose circuit is
+    open and is told the outcome of every attempt that completes.
+    """
+    vendors = list(vendors)
+
+    def allow(vendor):
+        if breaker is None or breaker.allow(vendor):
+            return True
+        print(f"[INFO] Circuit open, skipping vendor {vendor.vendor_name}")
+        return False
+
+    if hedge_delay is None:
+        attempts = _iter_sequential(vendors, call, deadline, allow)
+    else:
+        attempts = _iter_hedged(vendors, call, deadline, hedge_delay, allow)
+
+    try:
+        for attempt in attempts:
+            if breaker is not None:
+                breaker.record(attempt)
+            yield attempt
+    finally:
+        attempts.close()
+
+
+def _iter_sequential(vendors, call, deadline, allow):
+    vendor_count = len(vendors)
+    for index, vendor in enumerate(vendors):
+        if deadline.expired():
+            print(f"[WARN] Request deadline reached, skipping vendor {vendor.vendor_name}")
+            return
+        if not allow(vendor):
+            continue
+        yield _call_within_deadline(vendor, call, deadline, vendor_count - index)
+
+
+def _call_within_deadline(vendor, call, deadline, vendors_left):
+    """Call the vendor on the pool, giving up once its share of the deadline is spent."""
+    started = time.monotonic()
+    limit = deadline.share(vendors_left)
+    future = _call_executor.submit(_call_vendor, vendor, call, deadline.timeout_for(vendor, vendors_left))
+    try:
+        return future.result(timeout=limit)
+    except FutureTimeoutError:
+        if not future.cancel():
+            future.add_done_callback(_log_ignored(vendor, "late"))
+        print(f"[WARN] Vendor {vendor.vendor_name} did not answer within {limit:.3f}s of the request deadline")
+        return VendorAttempt(vendor, error=_deadline_error(vendor), elapsed=time.monotonic() - started)
+
+
+def _iter_hedged(vendors, call, deadline, hedge_delay, allow):
+    pending = {}
+    next_index = 0
+
+    def launch(hedged):
+        nonlocal next_index
+        while next_index < len(vendors) and not allow(vendors[next_index]):
+            next_index += 1
+        if next_index >= len(vendors):
+            return
+        vendor = vendors[next_index]
+        next_index += 1
+        if hedged:
+            print(f"[INFO] Hedging KYC request to vendor {vendor.vendor_name} after {hedge_delay}s")
+        # Hedged calls overlap, so each may use the whole remaining budget
+        timeout = deadline.timeout_for(vendor)
+        future = _hedge_executor.submit(_call_vendor, vendor, call, timeout, hedged)
+        pending[future] = vendor
+
+    if vendors:
+        launch(hedged=False)
+
+    try:
+        while pending:
+            if deadline.expired():
+                print("[WARN] Request deadline reached with hedged vendor calls still in flight")
+                return
+
+            wait_for = deadline.remaining()
+            if next_index < len(vendors):
+                wait_for = min(wait_for, hedge_delay)
+
+            done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            if not done:
+                if next_index < len(vendors):
+                    launch(hedged=True)
+                continue
+
+            for future in done:
+                pending.pop(future)
+                yield future.result()
+
+                # Caller kept going, so that vendor failed: fall back right away
+                if next_index < len(vendors):
+                    launch(hedged=False)
+    finally:
+        for future, vendor in pending.items():
+            if not future.cancel():
+                future.add_done_callback(_log_ignored(vendor))
+            else:
+                print(f"[INFO] Cancelled hedged call to vendor {vendor.vendor_name} before it started")
+
+
+async def aiter_vendor_attempts(vendors, call, deadline, hedge_delay=None, breaker=None):
+    """
+    Async counterpart of ``iter_vendor_attempts`` for the async views.
+    ``call(vendor, timeout)`` returns an awaitable; hedged calls run as tasks
+    on the event loop, and calls that lose the race are cancelled outright.
+    Circuit breaker checks and updates go through the sync ORM in a thread.
+    """
+    vendors = list(vendors)
+
+    async def allow(vendor):
+        if breaker is None or await sync_to_async(breaker.allow)(vendor):
+            return True
+        print(f"[INFO] Circuit open, skipping vendor {vendor.vendor_name}")
+        return False
+
+    if hedge_delay is None:
+        attempts = _aiter_sequential(vendors, call, deadline, allow)
+    else:
+        attempts = _aiter_hedged(vendors, call, deadline, hedge_delay, allow)
+
+    try:
+        async for attempt in attempts:
+            if breaker is not None:
+                await sync_to_async(breaker.record)(attempt)
+            yield attempt
+    finally:
+        await attempts.aclose()
+
+
+async def _aiter_sequential(vendors, call, deadline, allow):
+    vendor_count = len(vendors)
+    for index, vendor in enumerate(vendors):
+        if deadline.expired():
+            print(f"[WARN] Request deadline reached, skipping vendor {vendor.vendor_name}")
+            return
+        if not await allow(vendor):
+            continue
+        yield await _acall_vendor(
+            vendor, call, deadline.timeout_for(vendor, vendor_count - index),
+            limit=deadline.share(vendor_count - index),
+        )
+
+
+async def _aiter_hedged(vendors, call, deadline, hedge_delay, allow):
+    pending = {}
+    next_index = 0
+
+    async def launch(hedged):
+        nonlocal next_index
+        while next_index < len(vendors) and not await allow(vendors[next_index]):
+            next_index += 1
+        if next_index >= len(vendors):
+            return
+        vendor = vendors[next_index]
+        next_index += 1
+        if hedged:
+            print(f"[INFO] Hedging KYC request to vendor {vendor.vendor_name} after {hedge_delay}s")
+        task = asyncio.ensure_future(_acall_vendor(vendor, call, deadline.timeout_for(vendor), hedged))
+        pending[task] = vendor
+
+    if vendors:
+        await launch(hedged=False)
+
+    try:
+        while pending:
+            if deadline.expired():
+                print("[WARN] Request deadline reached with hedged vendor calls still in flight")
+                return
+
+            wait_for = deadline.remaining()
+            if next_index < len(vendors):
+                wait_for = min(wait_for, hedge_delay)
+
+            done, _ = await asyncio.wait(set(pending), timeout=wait_for, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                if next_index < len(vendors):
+                    await launch(hedged=True)
+                continue
+
+            for task in done:
+                pending.pop(task)
+                yield task.result()
+
+                if next_index < len(vendors):
+                    await launch(hedged=False)
+    finally:
+        for task, vendor in pending.items():
+            task.cancel()
+            print(f"[INFO] Cancelled losing hedged call to vendor {vendor.vendor_name}")
+
+
+async def _acall_vendor(vendor, call, timeout, hedged=False, limit=None):
+    started = time.monotonic()
+    try:
+        response = await asyncio.wait_for(call(vendor, timeout), limit)
+        return VendorAttempt(vendor, response=response, elapsed=time.monotonic() - started, hedged=hedged)
+    except asyncio.TimeoutError:
+        print(f"[WARN] Vendor {vendor.vendor_name} did not answer within {limit:.3f}s of the request deadline")
+        return VendorAttempt(vendor, error=_deadline_error(vendor), elapsed=time.monotonic() - started, hedged=hedged)
+    except Exception as e:
+        return VendorAttempt(vendor, error=e, elapsed=time.monotonic() - started, hedged=hedged)
+
+
+def _call_vendor(vendor, call, timeout, hedged=False):
+    started = time.monotonic()
+    try:
+        response = call(vendor, timeout)
+        return VendorAttempt(vendor, response=response, elapsed=time.monotonic() - started, hedged=hedged)
+    except Exception as e:
+        return VendorAttempt(vendor, error=e, elapsed=time.monotonic() - started, hedged=hedged)
+
+
+def _deadline_error(vendor):
+    return TimeoutError(f"Vendor {vendor.vendor_name} did not answer before the request deadline")
+
+
+def _log_ignored(vendor, reason="losing hedged"):
+    def callback(future):
+        attempt = future.result()
+        failed = attempt.error or (isinstance(attempt.response, dict) and attempt.response.get("http_error"))
+        print(
+            f"[INFO] Ignored {reason} {'error' if failed else 'response'} "
+            f"from vendor {vendor.vendor_name} after {attempt.elapsed:.3f}s"
+        )
+    return callback
@@ -0,0 +1,54 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from auth_system.utils.counters import invalidate_counters, touches_fields
+from kyc_api_gateway.models import (
+    ApiManagement,
+    ClientManagement,
+    KycClientServicesManagement,
+    KycVendorPriority,
+    VendorManagement,
+)
+from kyc_api_gateway.services.client_resolver import invalidate_client
+from kyc_api_gateway.services.routing import (
+    invalidate_client_service,
+    invalidate_vendor,
+    invalidate_vendor_priority,
+)
+
+
+@receiver(post_save, sender=ClientManagement)
+@receiver(post_delete, sender=ClientManagement)
+def invalidate_client_cache(sender, instance, **kwargs):
+    # Covers key rotation, status changes and soft delete (which is a save)
+    invalidate_client(instance)
+    if touches_fields(kwargs.get("update_fields"), ("status", "deleted_at")):
+        invalidate_counters("clients")
+
+
+@receiver(post_save, sender=KycClientServicesManagement)
+@receiver(post_delete, sender=KycClientServicesManagement)
+def invalidate_client_service_route(sender, instance, **kwargs):
+    invalidate_client_service(instance)
+
+
+@receiver(post_save, sender=KycVendorPriority)
+@receiver(post_delete, sender=KycVendorPriority)
+def invalidate_vendor_priority_route(sender, instance, **kwargs):
+    invalidate_vendor_priority(instance)
+
+
+@receiver(post_save, sender=VendorManagement)
+@receiver(post_delete, sender=VendorManagement)
+def invalidate_vendor_routes(sender, instance, **kwargs):
+    invalidate_vendor(instance)
+    if touches_fields(kwargs.get("update_fields"), ("status", "deleted_at")):
+        invalidate_counters("vendors")
+
+
+@receiver(post_save, sender=ApiManagement)
+@receiver(post_delete, sender=ApiManagement)
+def invalidate_api_counters(sender, instance, **kwargs):
+    # total_api is shown above the client list
+    if touches_fields(kwargs.get("update_fields"), ("deleted_at",)):
+        invalidate_counters("clients")
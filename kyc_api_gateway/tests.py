@@ -1,3 +1,882 @@
-from django.test import TestCase
+import asyncio
+import threading
+import time
+from datetime import timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from constant import KYC_MY_SERVICES, QUOTA_DAY
+from kyc_api_gateway.models import (
+    ClientManagement,
+    KycClientServicesManagement,
+    KycClientUsage,
+    KycDetailHistory,
+    KycMyServices,
+    KycVendorPriority,
+    ProDrivingLicense,
+    ProPanDetails,
+    ProPanRequestLog,
+    VendorManagement,
+)
+from kyc_api_gateway.services.bulkhead import Bulkhead, BulkheadFull
+from kyc_api_gateway.services.client_resolver import client_cache
+from kyc_api_gateway.services.detail_store import store_detail
+from kyc_api_gateway.services.kyc_pipeline import AsyncKycPipeline, KycPipelineContext, get_pipeline
+from kyc_api_gateway.services.kyc_services import get_kyc_service
+from kyc_api_gateway.services.negative_cache import negative_cache
+from kyc_api_gateway.services.pro.pan_batch import newest_cached
+from kyc_api_gateway.services.rate_limit import QuotaCounter, TokenBucket
+from kyc_api_gateway.services.routing import routing_table
+from kyc_api_gateway.services.vendor_adapters import normalize_response
+from kyc_api_gateway.services.vendor_chain import aiter_vendor_attempts, iter_vendor_attempts
+from kyc_api_gateway.utils.deadline import Deadline
+from kyc_api_gateway.utils.identifiers import detect_invalid_identifier
+
+
+def surepass_ok(data):
+    return {"success": True, "status_code": 200, "message_code": "success", "data": data}
+
+
+def http_error(status_code, vendor_response=None, error_message="Vendor error"):
+    """What the handlers' call functions return for a non-2xx vendor answer."""
+    return {
+        "http_error": True,
+        "status_code": status_code,
+        "vendor_response": vendor_response,
+        "error_message": error_message,
+    }
+
+
+# service -> (request body, Surepass "data" for it, message when the identifier is missing)
+PIPELINE_CASES = {
+    "PAN": (
+        {"pan": "abcde1234f"},
+        {"client_id": "pan_1", "pan_number": "ABCDE1234F", "full_name": "RAVI KUMAR"},
+        "Missing required field: pan",
+    ),
+    "VOTER": (
+        {"id_number": "ABC1234567"},
+        {"client_id": "voter_1", "epic_no": "ABC1234567", "name": "RAVI KUMAR"},
+        "Voter ID required",
+    ),
+    "RC": (
+        {"rc_number": "MH12AB1234"},
+        {"client_id": "rc_1", "rc_number": "MH12AB1234", "owner_name": "RAVI KUMAR"},
+        "RC number required",
+    ),
+    "DRIVING": (
+        {"license_no": "MH1220110012345", "dob": "01-01-1990"},
+        {"client_id": "dl_1", "license_number": "MH1220110012345", "name": "RAVI KUMAR", "dob": "1990-01-01"},
+        "Missing required fields: license_no, dob",
+    ),
+    "BILL": (
+        {"consumer_id": "100200300", "service_provider": "MSEDCL"},
+        {"client_id": "bill_1", "customer_id": "100200300", "full_name": "RAVI KUMAR", "bill_amount": "1,250.00"},
+        "Missing required fields: consumer_id, service_provider",
+    ),
+    "NAME": (
+        {"name_1": "Ravi Kumar", "name_2": "Ravi K"},
+        {"client_id": "name_1", "name_1": "Ravi Kumar", "name_2": "Ravi K", "match_score": "0.92",
+         "match_status": True},
+        "Missing required fields: name1, name2",
+    ),
+}
+
+# Wording the endpoints have always used where it differs per service
+SUCCESS_MESSAGES = {"RC": "Data retrieved from surepass"}
+EXHAUSTED_ERRORS = {"RC": "All vendors failed"}
+UNCONFIGURED_STATUSES = {"DRIVING": 403}
+
+ENVIRONMENTS = ("pro", "uat")
+API_KEYS = {"pro": "test-production-key", "uat": "test-uat-key"}
+SERVICE_ENVIRONMENTS = [(service, environment) for service in PIPELINE_CASES for environment in ENVIRONMENTS]
+
+
+@override_settings(
+    LOG_SINK_ENABLED=False,
+    CIRCUIT_BREAKER_ENABLED=False,
+    KYC_RATE_LIMIT_ENABLED=False,
+    KYC_SINGLE_FLIGHT="local",
+)
+class KycPipelineContractTests(TestCase):
+    """
+    Response bodies of the pipeline for every service in both environments:
+    the status codes and wording the endpoints returned before the pipeline.
+    Vendor calls are replaced by ``respond(vendor_name, request_data)``.
+    """
+
+    def setUp(self):
+        routing_table.clear()
+        client_cache.clear()
+        negative_cache.clear()
+
+        self.client_row = ClientManagement.objects.create(
+            company_name="Acme", business_type="b", registration_number="r", tax_id="t", website="w",
+            industry="i", name="n", email="ops@acme.test", phone="1", position="p", risk_level="low",
+            compliance_level="basic", production_key=API_KEYS["pro"], uat_key=API_KEYS["uat"], created_by=1,
+        )
+        self.vendors = [
+            VendorManagement.objects.create(
+                vendor_name=name, prod_base_url="http://vendor.test/", uat_base_url="http://vendor.test/",
+                prod_api_key="k", uat_api_key="k", created_by=1, status=True,
+            )
+            for name in ("karza", "surepass")
+        ]
+        self.client_services = {}
+        for service, service_id in KYC_MY_SERVICES.items():
+            my_service = KycMyServices.objects.create(
+                id=service_id, name=service, uat_url="u", prod_url="p", created_by=1,
+            )
+            self.client_services[service] = KycClientServicesManagement.objects.create(
+                client=self.client_row, myservice=my_service, day=30, priority=service_id, created_by=1,
+            )
+            for priority, vendor in enumerate(self.vendors, start=1):
+                KycVendorPriority.objects.create(
+                    client=self.client_row, vendor=vendor, my_service=my_service, priority=priority, created_by=1,
+                )
+
+    def run_pipeline(self, service, environment, respond=None, body=None, api_key=None):
+        pipeline = get_pipeline(service, environment)
+        default_body, data, _ = PIPELINE_CASES[service]
+
+        if respond is None:
+            def respond(vendor_name, request_data):
+                if vendor_name == "surepass":
+                    return surepass_ok(data)
+                return http_error(500)
+
+        def call(vendor, request_data, timeout=None):
+            return respond(vendor.vendor_name, request_data)
+
+        ctx = KycPipelineContext(
+            default_body if body is None else body,
+            API_KEYS[environment] if api_key is None else api_key,
+            {"endpoint": f"/test/{service}", "request_payload": body, "ip_address": "127.0.0.1", "user_agent": ""},
+        )
+        with mock.patch.object(pipeline.spec, "call", side_effect=call) as vendor_call:
+            status_code, response = pipeline.run(ctx)
+        return status_code, response, vendor_call
+
+    def assertError(self, result, status_code, error):
+        self.assertEqual(result[:2], (status_code, {"success": False, "status": status_code, "error": error}))
+
+    def test_body_must_be_an_object(self):
+        for service, environment in SERVICE_ENVIRONMENTS:
+            with self.subTest(service=service, environment=environment):
+                self.assertError(self.run_pipeline(service, environment, body=["x"]), 400,
+                                 "Request body must be a JSON object")
+
+    def test_missing_identifier(self):
+        for service, environment in SERVICE_ENVIRONMENTS:
+            with self.subTest(service=service, environment=environment):
+                self.assertError(self.run_pipeline(service, environment, body={}), 400, PIPELINE_CASES[service][2])
+
+    def test_api_key(self):
+        for service, environment in SERVICE_ENVIRONMENTS:
+            with self.subTest(service=service, environment=environment):
+                self.assertError(self.run_pipeline(service, environment, api_key=""), 401, "Missing API key")
+                self.assertError(self.run_pipeline(service, environment, api_key="wrong"), 401, "Invalid API key")
+
+    def test_keys_are_per_environment(self):
+        other = {"pro": "uat", "uat": "pro"}
+        for service, environment in SERVICE_ENVIRONMENTS:
+            with self.subTest(service=service, environment=environment):
+                result = self.run_pipeline(service, environment, api_key=API_KEYS[other[environment]])
+                self.assertError(result, 401, "Invalid API key")
+
+    def test_service_not_permitted(self):
+        for client_service in self.client_services.values():
+            client_service.status = False
+            client_service.save()
+        for service, environment in SERVICE_ENVIRONMENTS:
+            with self.subTest(service=service, environment=environment):
+                self.assertError(self.run_pipeline(service, environment), 403, "Service is not permitted for client")
+
+    def test_service_not_configured(self):
+        KycClientServicesManagement.objects.all().delete()
+        routing_table.clear()
+        for service, environment in SERVICE_ENVIRONMENTS:
+            with self.subTest(service=service, environment=environment):
+                self.assertError(
+                    self.run_pipeline(service, environment),
+                    UNCONFIGURED_STATUSES.get(service, 500),
+                    f"Cache days not configured for client={self.client_row.id}, service_id={KYC_MY_SERVICES[service]}",
+                )
+
+    def test_no_vendors(self):
+        KycVendorPriority.objects.all().delete()
+        routing_table.clear()
+        for service, environment in SERVICE_ENVIRONMENTS:
+            with self.subTest(service=service, environment=environment):
+                self.assertError(self.run_pipeline(service, environment), 403, "No vendors assigned for this service")
+
+    def test_vendors_exhausted(self):
+        for service, environment in SERVICE_ENVIRONMENTS:
+            with self.subTest(service=service, environment=environment):
+                result = self.run_pipeline(
+                    service, environment, respond=lambda vendor_name, request_data: http_error(500),
+                )
+                self.assertError(result, 404, EXHAUSTED_ERRORS.get(service, "No vendor returned valid data"))
+                self.assertEqual(result[2].call_count, 2)
+
+    def test_deadline_exceeded(self):
+        with mock.patch.object(Deadline, "for_service", return_value=Deadline(0)):
+            for service, environment in SERVICE_ENVIRONMENTS:
+                with self.subTest(service=service, environment=environment):
+                    result = self.run_pipeline(service, environment)
+                    self.assertError(result, 504, "Request deadline exceeded")
+                    result[2].assert_not_called()
+
+    def test_invalid_identifier(self):
+        def respond(vendor_name, request_data):
+            if vendor_name == "karza":
+                return http_error(500)
+            return http_error(404, {"message_code": "not_found", "message": "No record found"})
+
+        for service, environment in SERVICE_ENVIRONMENTS:
+            with self.subTest(service=service, environment=environment):
+                self.assertError(self.run_pipeline(service, environment, respond=respond), 404, "No record found")
+                # Remembered, so the repeat does not reach the vendors
+                result = self.run_pipeline(service, environment, respond=respond)
+                self.assertError(result, 404, "No record found")
+                result[2].assert_not_called()
+
+    def test_karza_invalid_identifier_stops_the_chain(self):
+        def respond(vendor_name, request_data):
+            return {"statusCode": 102, "result": {}}
+
+        for service, environment in SERVICE_ENVIRONMENTS:
+            with self.subTest(service=service, environment=environment):
+                result = self.run_pipeline(service, environment, respond=respond)
+                self.assertError(result, 404, "Invalid ID number or combination of inputs")
+                self.assertEqual(result[2].call_count, 1)
+
+    def test_vendor_then_cached(self):
+        for service, environment in SERVICE_ENVIRONMENTS:
+            with self.subTest(service=service, environment=environment):
+                status_code, response, vendor_call = self.run_pipeline(service, environment)
+                self.assertEqual(status_code, 200, response)
+                self.assertEqual(
+                    (response["success"], response["status"], response["message"]),
+                    (True, 200, SUCCESS_MESSAGES.get(service, "Data from surepass")),
+                )
+                self.assertNotIn("stale", response)
+                self.assertEqual(vendor_call.call_count, 2)
+
+                status_code, response, vendor_call = self.run_pipeline(service, environment)
+                self.assertEqual(status_code, 200, response)
+                self.assertEqual(
+                    (response["success"], response["status"], response["message"], response["stale"]),
+                    (True, 200, "Cached data", False),
+                )
+                self.assertTrue(response["data"])
+                vendor_call.assert_not_called()
+
+    def test_pipeline_options(self):
+        for environment in ENVIRONMENTS:
+            for pipeline_class in (None, AsyncKycPipeline):
+                args = (pipeline_class,) if pipeline_class else ()
+                rc = get_pipeline("RC", environment, *args)
+                dl = get_pipeline("DRIVING", environment, *args)
+                pan = get_pipeline("PAN", environment, *args)
+                self.assertEqual((rc.success_message, rc.exhausted_error), ("Data retrieved from {vendor}",
+                                                                            "All vendors failed"))
+                self.assertEqual(dl.unconfigured_status, 403)
+                self.assertEqual(
+                    (pan.success_message, pan.exhausted_error, pan.unconfigured_status),
+                    ("Data from {vendor}", "No vendor returned valid data", 500),
+                )
+                self.assertIs(get_pipeline("RC", environment, *args), rc)
+
+    async def test_async_pipeline_parity(self):
+        pipeline = get_pipeline("RC", "pro", AsyncKycPipeline)
+        body, data, _ = PIPELINE_CASES["RC"]
+
+        async def call(vendor, request_data, timeout=None):
+            if vendor.vendor_name == "surepass":
+                return surepass_ok(data)
+            return http_error(500)
+
+        def context(api_key=API_KEYS["pro"]):
+            return KycPipelineContext(body, api_key, {"endpoint": "/test/RC", "request_payload": body})
+
+        with mock.patch.object(pipeline.spec, "acall", side_effect=call):
+            self.assertEqual(
+                await pipeline.arun(context("wrong")),
+                (401, {"success": False, "status": 401, "error": "Invalid API key"}),
+            )
+            status_code, response = await pipeline.arun(context())
+            self.assertEqual((status_code, response["message"]), (200, "Data retrieved from surepass"))
+            status_code, response = await pipeline.arun(context())
+            self.assertEqual((status_code, response["message"], response["stale"]), (200, "Cached data", False))
+
+    def test_failed_vendor_call_falls_through(self):
+        def respond(vendor_name, request_data):
+            if vendor_name == "karza":
+                raise ConnectionError("connection refused")
+            return surepass_ok(PIPELINE_CASES["PAN"][1])
+
+        status_code, response, vendor_call = self.run_pipeline("PAN", "pro", respond=respond)
+        self.assertEqual((status_code, response["message"]), (200, "Data from surepass"))
+        self.assertEqual(response["data"]["pan_number"], "ABCDE1234F")
+
+
+class VendorChainDeadlineTests(SimpleTestCase):
+    """Vendors that keep the connection busy past their socket timeouts still lose to the deadline."""
+
+    BUDGET = 0.6
+    SLACK = 0.25
+
+    def setUp(self):
+        self.vendors = [
+            SimpleNamespace(vendor_name=name, connect_timeout=3.0, read_timeout=10.0)
+            for name in ("karza", "surepass")
+        ]
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+
+    def assertTimedOut(self, attempts, started):
+        self.assertLess(time.monotonic() - started, self.BUDGET + self.SLACK)
+        self.assertEqual([attempt.vendor.vendor_name for attempt in attempts], ["karza", "surepass"])
+        for attempt in attempts:
+            with self.subTest(vendor=attempt.vendor.vendor_name):
+                self.assertIsInstance(attempt.error, TimeoutError)
+                self.assertLess(attempt.elapsed, self.BUDGET)
+
+    def test_two_vendor_chain_stays_within_budget(self):
+        def trickle(vendor, timeout):
+            # Each read would finish inside ``timeout``; the call as a whole never does
+            self.release.wait(5)
+
+        started = time.monotonic()
+        attempts = list(iter_vendor_attempts(self.vendors, trickle, Deadline(self.BUDGET)))
+        self.assertTimedOut(attempts, started)
+
+    def test_async_two_vendor_chain_stays_within_budget(self):
+        async def trickle(vendor, timeout):
+            await asyncio.sleep(5)
+
+        async def run():
+            return [attempt async for attempt in aiter_vendor_attempts(self.vendors, trickle, Deadline(self.BUDGET))]
+
+        started = time.monotonic()
+        attempts = asyncio.run(run())
+        self.assertTimedOut(attempts, started)
+
+
+class VendorAdapterNormalizationTests(SimpleTestCase):
+    """Karza and Surepass responses mapped to what the services' save functions expect."""
+
+    def test_karza_pan(self):
+        raw = {
+            "requestId": "req-1",
+            "statusCode": 101,
+            "result": {
+                "pan": "ABCDE1234F",
+                "name": "RAVI KUMAR",
+                "firstName": "RAVI",
+                "lastName": "KUMAR",
+                "status": "Active",
+                "aadhaarLinked": True,
+                "city": "PUNE",
+                "pinCode": "411001",
+            },
+        }
+        normalized = normalize_response("PAN", "Karza", raw)
+        self.assertEqual(normalized["request_id"], "req-1")
+        self.assertEqual(normalized["pan_number"], "ABCDE1234F")
+        self.assertEqual(normalized["full_name"], "RAVI KUMAR")
+        self.assertEqual(normalized["pan_status"], "Active")
+        self.assertIsNone(normalized["middle_name"])
+        self.assertEqual(normalized["address"]["city"], "PUNE")
+        self.assertEqual(normalized["address"]["zip"], "411001")
+
+    def test_surepass_pan(self):
+        raw = surepass_ok({
+            "client_id": "pan_1",
+            "pan_number": "ABCDE1234F",
+            "full_name": "RAVI KUMAR SHARMA",
+            "full_name_split": ["RAVI", "KUMAR", "SHARMA"],
+            "input_dob": "1990-01-01",
+            "gender": "M",
+            "address": {"city": "PUNE"},
+        })
+        normalized = normalize_response("PAN", "surepass", raw)
+        self.assertEqual(
+            (normalized["first_name"], normalized["middle_name"], normalized["last_name"]),
+            ("RAVI", "KUMAR", "SHARMA"),
+        )
+        self.assertEqual(normalized["dob"], "1990-01-01")
+        self.assertEqual(normalized["gender"], "male")
+        self.assertEqual(normalized["address"], {"city": "PUNE"})
+
+    def test_surepass_pan_defaults(self):
+        normalized = normalize_response("PAN", "surepass", surepass_ok({"pan_number": "ABCDE1234F"}))
+        self.assertIsNone(normalized["first_name"])
+        self.assertEqual(normalized["gender"], "female")
+        self.assertEqual(normalized["address"], {})
+
+    def test_no_result_means_no_data(self):
+        self.assertIsNone(normalize_response("PAN", "karza", {"statusCode": 101, "result": {}}))
+        self.assertIsNone(normalize_response("PAN", "surepass", {"success": True, "data": None}))
+        self.assertIsNone(normalize_response("PAN", "surepass", "not json"))
+
+    def test_unknown_vendor(self):
+        self.assertIsNone(normalize_response("PAN", "someone-else", surepass_ok({"pan_number": "ABCDE1234F"})))
+
+    def test_voter_status_is_checked(self):
+        karza = {"statusCode": 101, "clientData": {"caseId": "case-9"},
+                 "result": {"epicNo": "ABC1234567", "name": "RAVI", "rlnName": "RAM", "age": 34}}
+        normalized = normalize_response("VOTER", "karza", karza)
+        self.assertEqual(
+            (normalized["vendor"], normalized["client_id"], normalized["epic_no"], normalized["relation_name"]),
+            ("karza", "case-9", "ABC1234567", "RAM"),
+        )
+        self.assertEqual(normalized["age"], "34")
+        self.assertIsNone(normalize_response("VOTER", "karza", {**karza, "statusCode": 103}))
+
+        surepass = surepass_ok({"epic_no": "ABC1234567", "name": "RAVI", "part_number": "12", "gender": "F"})
+        normalized = normalize_response("VOTER", "surepass", surepass)
+        self.assertEqual((normalized["part_no"], normalized["gender"]), ("12", "female"))
+        self.assertIsNone(normalized["relation_type"])
+        self.assertIsNone(normalize_response("VOTER", "surepass", {**surepass, "success": False}))
+
+    def test_rc_without_result_is_still_a_row(self):
+        normalized = normalize_response("RC", "karza", {"statusCode": 101, "clientData": {"caseId": "c"}})
+        self.assertEqual((normalized["vendor"], normalized["client_id"]), ("karza", "c"))
+        self.assertIsNone(normalized["rc_number"])
+
+        normalized = normalize_response("RC", "surepass", surepass_ok({"rc_number": "MH12AB1234", "fit_up_to": "2030"}))
+        self.assertEqual((normalized["rc_number"], normalized["fit_upto"]), ("MH12AB1234", "2030"))
+
+    def test_karza_driving_licence(self):
+        raw = {
+            "requestId": "req-2",
+            "result": {
+                "name": "RAVI KUMAR",
+                "dob": "01-01-1990",
+                "issueDate": "15-06-2010",
+                "validity": {"nonTransport": "14-06-2030", "transport": ""},
+                "status": "ACTIVE",
+                "address": [
+                    {"type": "present", "completeAddress": "FLAT 1, PUNE", "state": "MH"},
+                    {"type": "Permanent", "completeAddress": "HOUSE 2, NASIK", "state": "MH"},
+                ],
+            },
+        }
+        request_data = {"license_no": "MH1220110012345", "dob": "01-01-1990"}
+        normalized = normalize_response("DRIVING", "karza", raw, request_data)
+        self.assertEqual(normalized["dl_number"], "MH1220110012345")
+        self.assertEqual(str(normalized["dob"]), "1990-01-01")
+        self.assertEqual(str(normalized["valid_till"]), "2030-06-14")
+        self.assertIsNone(normalized["transport_validity"])
+        self.assertEqual(normalized["address"], "HOUSE 2, NASIK")
+        self.assertEqual(normalized["state"], "MH")
+        self.assertTrue(normalized["is_verified"])
+        self.assertIs(normalized["full_response"], raw)
+
+    def test_surepass_driving_licence(self):
+        raw = surepass_ok({"client_id": "dl_1", "license_number": "MH1220110012345", "doe": "2030-06-14",
+                           "ola_name": "RTO PUNE"})
+        normalized = normalize_response("DRIVING", "surepass", raw, {"license_no": "MH1220110012345"})
+        self.assertEqual(normalized["request_id"], "dl_1")
+        self.assertEqual((normalized["valid_till"], normalized["issuing_authority"]), ("2030-06-14", "RTO PUNE"))
+        self.assertEqual(normalized["dl_status"], "Active")
+
+    def test_bill_amounts(self):
+        normalized = normalize_response("BILL", "karza", {"result": {"consumer_number": "100200300",
+                                                                     "amount_payable": "1,250.50"}})
+        self.assertEqual((normalized["consumer_id"], normalized["customer_id"]), ("100200300", "100200300"))
+        self.assertEqual(normalized["bill_amount"], Decimal("1250.50"))
+
+        normalized = normalize_response("BILL", "surepass", surepass_ok({"id_number": "100200300",
+                                                                         "bill_amount": "n/a"}))
+        self.assertEqual(normalized["customer_id"], "100200300")
+        self.assertIsNone(normalized["bill_amount"])
+
+    def test_name_match(self):
+        request_data = {"name_1": "Ravi Kumar", "name_2": "Ravi K"}
+        normalized = normalize_response("NAME", "karza", {"requestId": "req-3", "result": {"score": 0.92,
+                                                                                          "result": True}},
+                                        request_data)
+        self.assertEqual((normalized["name_1"], normalized["name_2"]), ("Ravi Kumar", "Ravi K"))
+        self.assertEqual((normalized["match_score"], normalized["match_status"]), (Decimal("0.92"), True))
+
+        normalized = normalize_response("NAME", "surepass", surepass_ok({"name_1": "A", "name_2": "B",
+                                                                         "match_score": "87"}), request_data)
+        self.assertEqual((normalized["name_1"], normalized["match_score"]), ("A", Decimal("87")))
+        self.assertIsNone(normalized["request_id"])
+
+
+class DetectInvalidIdentifierTests(SimpleTestCase):
+
+    def test_karza_status_codes(self):
+        self.assertEqual(detect_invalid_identifier("Karza", {"statusCode": 102}).reason,
+                         "Invalid ID number or combination of inputs")
+        self.assertEqual(detect_invalid_identifier("karza", {"statusCode": "103"}).reason,
+                         "No records found for the given ID")
+        for response in ({"statusCode": 101}, {"statusCode": 104}, {"statusCode": None}, {}):
+            self.assertIsNone(detect_invalid_identifier("karza", response))
+
+    def test_karza_http_error_body(self):
+        response = http_error(400, {"statusCode": 102})
+        self.assertEqual(detect_invalid_identifier("karza", response).vendor_name, "karza")
+        self.assertIsNone(detect_invalid_identifier("karza", http_error(503, None)))
+
+    def test_surepass_needs_a_known_message_code(self):
+        invalid = detect_invalid_identifier("surepass", http_error(422, {"message_code": "verification_failed"}))
+        self.assertEqual(invalid.reason, "Invalid ID number or combination of inputs")
+        invalid = detect_invalid_identifier("Surepass", http_error(404, {"message_code": "not_found",
+                                                                         "message": "PAN not found"}))
+        self.assertEqual(invalid.reason, "PAN not found")
+
+        # Wrong path or a rejected payload, not an unknown document
+        self.assertIsNone(detect_invalid_identifier("surepass", http_error(404, {"detail": "Not Found"})))
+        self.assertIsNone(detect_invalid_identifier("surepass", http_error(422, {"message_code": "bad_dob"})))
+        self.assertIsNone(detect_invalid_identifier("surepass", http_error(404, None)))
+        self.assertIsNone(detect_invalid_identifier("surepass", http_error(500, {"message_code": "not_found"})))
+
+    def test_successes_and_outages_never_count(self):
+        self.assertIsNone(detect_invalid_identifier("surepass", {"message_code": "not_found", "status_code": 404}))
+        self.assertIsNone(detect_invalid_identifier("surepass", None))
+        self.assertIsNone(detect_invalid_identifier("karza", "timeout"))
+        self.assertIsNone(detect_invalid_identifier("other", {"statusCode": 102}))
+
+
+class TokenBucketTests(SimpleTestCase):
+
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch("kyc_api_gateway.services.rate_limit.time.monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=2, burst=3)
+        self.assertEqual([bucket.take() for _ in range(3)], [0, 0, 0])
+        self.assertAlmostEqual(bucket.take(), 0.5)
+
+        self.now += 0.5
+        self.assertEqual(bucket.take(), 0)
+        self.assertAlmostEqual(bucket.take(), 0.5)
+
+    def test_refill_is_capped_at_burst(self):
+        bucket = TokenBucket(rate=10, burst=2)
+        self.now += 60
+        self.assertEqual([bucket.take(), bucket.take()], [0, 0])
+        self.assertAlmostEqual(bucket.take(), 0.1)
+
+    def test_request_larger_than_burst_leaves_debt(self):
+        bucket = TokenBucket(rate=1, burst=5)
+        self.assertEqual(bucket.take(20), 0)
+        self.assertEqual(bucket.tokens, -15)
+        self.assertAlmostEqual(bucket.take(), 16)
+
+        self.now += 16
+        self.assertEqual(bucket.take(), 0)
+
+
+class QuotaCounterTests(TestCase):
+
+    def setUp(self):
+        client = ClientManagement.objects.create(
+            company_name="Acme", business_type="b", registration_number="r", tax_id="t", website="w",
+            industry="i", name="n", email="ops@acme.test", phone="1", position="p", risk_level="low",
+            compliance_level="basic", production_key="quota-key", created_by=1,
+        )
+        my_service = KycMyServices.objects.create(name="PAN", uat_url="u", prod_url="p", created_by=1)
+        self.client_service = KycClientServicesManagement.objects.create(
+            client=client, myservice=my_service, day=1, daily_quota=5, created_by=1,
+        )
+        self.counter = QuotaCounter(flush_interval=3600)
+        # Flushes are driven by the tests, not the background thread
+        patcher = mock.patch.object(QuotaCounter, "_ensure_started")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def usage(self):
+        return KycClientUsage.objects.get(client=self.client_service.client, period=QUOTA_DAY).request_count
+
+    def test_quota_is_enforced_in_memory(self):
+        with self.assertNumQueries(1):
+            for _ in range(5):
+                self.assertIsNone(self.counter.consume(self.client_service))
+        throttled = self.counter.consume(self.client_service)
+        self.assertEqual(throttled.reason, "Daily quota of 5 requests exceeded")
+        self.assertGreaterEqual(throttled.retry_after, 1)
+        self.assertEqual(self.counter.stats()["pending"], 5)
+        self.assertEqual(self.counter.rejected, 1)
+
+    def test_flush_writes_pending_counts(self):
+        self.counter.consume(self.client_service, count=3)
+        self.counter.flush()
+        self.assertEqual(self.usage(), 3)
+        self.assertEqual(self.counter.stats()["pending"], 0)
+
+        self.counter.consume(self.client_service, count=2)
+        self.counter.flush()
+        self.assertEqual(self.usage(), 5)
+        self.assertIsNotNone(self.counter.consume(self.client_service))
+
+    def test_flush_picks_up_other_workers(self):
+        self.counter.consume(self.client_service)
+        self.counter.flush()
+        KycClientUsage.objects.filter(client=self.client_service.client).update(request_count=5)
+        self.assertIsNone(self.counter.consume(self.client_service), "read before the next flush")
+        self.counter.flush()
+        self.assertIsNotNone(self.counter.consume(self.client_service))
+
+    def test_batch_over_quota_is_refused_whole(self):
+        self.assertIsNotNone(self.counter.consume(self.client_service, count=6))
+        self.assertIsNone(self.counter.consume(self.client_service, count=5))
+
+    def test_no_quota(self):
+        self.client_service.daily_quota = None
+        with self.assertNumQueries(0):
+            self.assertIsNone(self.counter.consume(self.client_service, count=10 ** 6))
+
+
+class BulkheadTests(SimpleTestCase):
+
+    def hold(self, bulkhead, entered, release):
+        def run():
+            with bulkhead.slot():
+                entered.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        self.assertTrue(entered.wait(5))
+        return thread
+
+    def test_full_without_queue(self):
+        bulkhead = Bulkhead("karza/PAN", max_in_flight=1)
+        release = threading.Event()
+        thread = self.hold(bulkhead, threading.Event(), release)
+        try:
+            with self.assertRaises(BulkheadFull):
+                with bulkhead.slot():
+                    pass
+        finally:
+            release.set()
+            thread.join()
+        self.assertEqual(bulkhead.stats()["rejected_full"], 1)
+        with bulkhead.slot():
+            self.assertEqual(bulkhead.in_flight, 1)
+        self.assertEqual(bulkhead.in_flight, 0)
+
+    def test_queued_caller_gets_the_released_slot(self):
+        bulkhead = Bulkhead("karza/PAN", max_in_flight=1, max_queue=1, queue_timeout=5)
+        release = threading.Event()
+        thread = self.hold(bulkhead, threading.Event(), release)
+        threading.Timer(0.05, release.set).start()
+        with bulkhead.slot():
+            self.assertEqual(bulkhead.in_flight, 1)
+        thread.join()
+
+        stats = bulkhead.stats()
+        self.assertEqual((stats["calls"], stats["queued_calls"], stats["peak_in_flight"]), (2, 1, 1))
+        self.assertEqual((stats["in_flight"], stats["queued"]), (0, 0))
+
+    def test_queue_timeout(self):
+        bulkhead = Bulkhead("karza/PAN", max_in_flight=1, max_queue=1, queue_timeout=0.05)
+        release = threading.Event()
+        thread = self.hold(bulkhead, threading.Event(), release)
+        try:
+            started = time.monotonic()
+            with self.assertRaisesMessage(BulkheadFull, "no free slot within 0.05s"):
+                with bulkhead.slot():
+                    pass
+            self.assertGreaterEqual(time.monotonic() - started, 0.05)
+        finally:
+            release.set()
+            thread.join()
+
+        stats = bulkhead.stats()
+        self.assertEqual((stats["rejected_timeout"], stats["queued"], stats["in_flight"]), (1, 0, 0))
+
+    def test_queue_is_bounded(self):
+        bulkhead = Bulkhead("karza/PAN", max_in_flight=1, max_queue=1, queue_timeout=5)
+        release = threading.Event()
+        holder = self.hold(bulkhead, threading.Event(), release)
+        queued = threading.Thread(target=self._take_and_release, args=(bulkhead,))
+        queued.start()
+        try:
+            for _ in range(500):
+                if bulkhead.stats()["queued"]:
+                    break
+                time.sleep(0.01)
+            with self.assertRaisesMessage(BulkheadFull, "queue full"):
+                with bulkhead.slot():
+                    pass
+        finally:
+            release.set()
+            holder.join()
+            queued.join()
+        self.assertEqual(bulkhead.stats()["calls"], 2)
+        self.assertEqual(bulkhead.stats()["in_flight"], 0)
+
+    def _take_and_release(self, bulkhead):
+        with bulkhead.slot():
+            pass
+
+    def test_async_waiter_shares_the_slots(self):
+        bulkhead = Bulkhead("karza/PAN", max_in_flight=1, max_queue=1, queue_timeout=5)
+        release = threading.Event()
+        thread = self.hold(bulkhead, threading.Event(), release)
+
+        async def call():
+            asyncio.get_running_loop().call_later(0.05, release.set)
+            async with bulkhead.aslot():
+                return bulkhead.in_flight
+
+        try:
+            self.assertEqual(asyncio.run(call()), 1)
+        finally:
+            release.set()
+            thread.join()
+        self.assertEqual(bulkhead.stats()["in_flight"], 0)
+
+    def test_cancelled_async_waiter_gives_up_its_place(self):
+        bulkhead = Bulkhead("karza/PAN", max_in_flight=1, max_queue=1, queue_timeout=5)
+        release = threading.Event()
+        thread = self.hold(bulkhead, threading.Event(), release)
+
+        async def call():
+            async with bulkhead.aslot():
+                pass
+
+        async def cancel():
+            task = asyncio.ensure_future(call())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        try:
+            asyncio.run(cancel())
+            self.assertEqual(bulkhead.stats()["queued"], 0)
+        finally:
+            release.set()
+            thread.join()
+        self.assertEqual(bulkhead.stats()["in_flight"], 0)
+
+
+@override_settings(KYC_DETAILS_WRITE_MODE="upsert", KYC_DETAILS_KEEP_HISTORY=True)
+class DetailStoreUpsertTests(TestCase):
+
+    def test_current_row_is_updated_in_place(self):
+        first = store_detail(ProPanDetails, pan_number="ABCDE1234F", full_name="OLD NAME", created_by=1)
+        second = store_detail(ProPanDetails, pan_number="ABCDE1234F", full_name="NEW NAME", created_by=1)
+        self.assertEqual(second.pk, first.pk)
+        self.assertEqual(ProPanDetails.objects.get().full_name, "NEW NAME")
+        self.assertEqual(KycDetailHistory.objects.get().snapshot["full_name"], "OLD NAME")
+
+    def test_driving_licence_is_keyed_by_number_and_dob(self):
+        spec = get_kyc_service("DRIVING", "pro")
+        since = timezone.now() - timedelta(days=1)
+        for dob, name in (("1990-01-01", "RAVI"), ("1991-02-02", "RAVI K"), ("1990-01-01", "RAVI KUMAR")):
+            store_detail(ProDrivingLicense, dl_number="MH1220110012345", dob=dob, name=name, created_by=1)
+
+        self.assertEqual(ProDrivingLicense.objects.filter(is_current=True).count(), 2)
+        # Each dob keeps its own cache entry
+        self.assertEqual(spec.find_cached("MH1220110012345", {"dob": "1990-01-01"}, since).name, "RAVI KUMAR")
+        self.assertEqual(spec.find_cached("MH1220110012345", {"dob": "1991-02-02"}, since).name, "RAVI K")
+
+    def test_missing_identifier_appends(self):
+        store_detail(ProDrivingLicense, dl_number="MH1220110012345", dob=None, created_by=1)
+        store_detail(ProDrivingLicense, dl_number="MH1220110012345", dob=None, created_by=1)
+        self.assertEqual(ProDrivingLicense.objects.filter(is_current__isnull=True).count(), 2)
+
+
+@override_settings(
+    LOG_SINK_ENABLED=False,
+    CIRCUIT_BREAKER_ENABLED=False,
+    KYC_RATE_LIMIT_ENABLED=False,
+    KYC_BATCH_MAX_ITEMS=3,
+)
+class PanBatchTests(TestCase):
+
+    def setUp(self):
+        routing_table.clear()
+        client_cache.clear()
+        negative_cache.clear()
+
+        client = ClientManagement.objects.create(
+            company_name="Acme", business_type="b", registration_number="r", tax_id="t", website="w",
+            industry="i", name="n", email="ops@acme.test", phone="1", position="p", risk_level="low",
+            compliance_level="basic", production_key=API_KEYS["pro"], created_by=1,
+        )
+        my_service = KycMyServices.objects.create(
+            id=KYC_MY_SERVICES["PAN"], name="PAN", uat_url="u", prod_url="p", created_by=1,
+        )
+        self.client_service = KycClientServicesManagement.objects.create(
+            client=client, myservice=my_service, day=30, created_by=1,
+        )
+        vendor = VendorManagement.objects.create(
+            vendor_name="surepass", prod_base_url="http://vendor.test/", uat_base_url="http://vendor.test/",
+            prod_api_key="k", uat_api_key="k", created_by=1, status=True,
+        )
+        KycVendorPriority.objects.create(client=client, vendor=vendor, my_service=my_service, priority=1, created_by=1)
+
+    def post(self, body):
+        def call(vendor, request_data, timeout=None):
+            return surepass_ok({"client_id": "pan_1", "pan_number": request_data["pan"], "full_name": "RAVI KUMAR"})
+
+        with mock.patch("kyc_api_gateway.services.pro.pan_batch.call_vendor_api", side_effect=call):
+            return self.client.post(
+                reverse("prod_pan_details_batch"), body, content_type="application/json",
+                headers={"X-API-KEY": API_KEYS["pro"]},
+            )
+
+    def test_batch_rejections_are_logged(self):
+        for body, error in (
+            ({}, "Field 'pans' must be a non-empty list"),
+            ({"pans": "ABCDE1234F"}, "Field 'pans' must be a non-empty list"),
+            ({"pans": ["A", "B", "C", "D"]}, "At most 3 PANs per batch"),
+        ):
+            with self.subTest(body=body):
+                response = self.post(body)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json(), {"success": False, "status": 400, "error": error})
+                log = ProPanRequestLog.objects.latest("id")
+                self.assertEqual((log.status_code, log.status, log.error_message), (400, "fail", error))
+                self.assertEqual(log.request_payload, body)
+
+    def test_service_rejections_are_logged(self):
+        self.client_service.status = False
+        self.client_service.save()
+        response = self.post({"pans": ["ABCDE1234F"]})
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(ProPanRequestLog.objects.get().error_message, "Service is not permitted for client")
+
+    def test_malformed_items_are_logged(self):
+        response = self.post({"pans": ["abcde1234f", 7, ""]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([result["status"] for result in response.json()["data"]], [200, 400, 400])
+
+        logs = ProPanRequestLog.objects.order_by("id")
+        self.assertEqual(
+            [(log.pan_number, log.status_code, log.request_payload) for log in logs],
+            [(None, 400, {"pan": 7}), (None, 400, {"pan": ""}), ("ABCDE1234F", 200, {"pan": "ABCDE1234F"})],
+        )
+
+    def test_cache_reads_only_the_newest_row_per_pan(self):
+        for pan, names in (("ABCDE1234F", ["OLD", "NEWER", "NEWEST"]), ("FGHIJ5678K", ["ONLY"])):
+            for name in names:
+                ProPanDetails.objects.create(pan_number=pan, full_name=name, created_by=1)
+        since = timezone.now() - timedelta(days=1)
+
+        rows = list(newest_cached(["ABCDE1234F", "FGHIJ5678K", "KLMNO9012P"], since))
+        self.assertEqual(sorted((row.pan_number, row.full_name) for row in rows),
+                         [("ABCDE1234F", "NEWEST"), ("FGHIJ5678K", "ONLY")])
+
+        response = self.post({"pans": ["ABCDE1234F", "FGHIJ5678K"]})
+        results = response.json()["data"]
+        self.assertEqual([(result["source"], result["data"]["full_name"]) for result in results],
+                         [("CACHE", "NEWEST"), ("CACHE", "ONLY")])
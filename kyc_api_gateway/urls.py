@@ -27,6 +27,20 @@ from kyc_api_gateway.views.kyc_client_services_management_view import (
     KycClientServicesDetail,
 )
 
+from kyc_api_gateway.views.vendor_circuit_breaker_view import (
+    VendorCircuitBreakerList,
+    VendorCircuitBreakerDetail,
+)
+
+from kyc_api_gateway.views.vendor_bulkhead_view import VendorBulkheadStats
+from kyc_api_gateway.views.kyc_client_usage_view import KycClientUsageList
+
+from kyc_api_gateway.views.bulk_job_view import (
+    KycBulkJobCreate,
+    KycBulkJobDetail,
+    KycBulkJobResults,
+)
+
 
 
 # from kyc_api_gateway.views.uat.pan_details_view import PanUatDetailsAPIView
@@ -45,11 +59,15 @@ from kyc_api_gateway.views.uat.driving_license_details_view import UatDrivingLic
 #production
 from kyc_api_gateway.views.pro.bill_details_view import ProBillDetailsAPIView   
 from kyc_api_gateway.views.pro.pan_details_view import ProPanDetailsAPIView   
+from kyc_api_gateway.views.pro.pan_batch_view import ProPanBatchAPIView
 from kyc_api_gateway.views.pro.name_details_view import ProNameMatchAPIView
 from kyc_api_gateway.views.pro.rc_detailsi_view import ProRcAPIView
 from kyc_api_gateway.views.pro.voter_details_view import ProVoterDetailsAPIView
 from kyc_api_gateway.views.pro.driving_license_details_view import ProDrivingLicenseAPIView
 
+#async (ASGI)
+from kyc_api_gateway.views.async_kyc_view import AsyncKycDetailsView
+
 
 urlpatterns = [
     path("client_management/",ClientManagementListCreate.as_view(), name="client_management_list_create",),
@@ -68,6 +86,17 @@ urlpatterns = [
     path("vendor_priority/", KycVendorPriorityListCreate.as_view(), name="vendor_priority_list_create"),
     path("vendor_priority/<int:pk>/", KycVendorPriorityDetail.as_view(), name="vendor_priority_detail"),
 
+    path("vendor_circuit_breakers/", VendorCircuitBreakerList.as_view(), name="vendor_circuit_breaker_list"),
+    path("vendor_circuit_breakers/<int:pk>/", VendorCircuitBreakerDetail.as_view(), name="vendor_circuit_breaker_detail"),
+
+    path("vendor_bulkheads/", VendorBulkheadStats.as_view(), name="vendor_bulkhead_stats"),
+
+    path("client_usage/", KycClientUsageList.as_view(), name="client_usage_list"),
+
+    path("bulk_jobs/", KycBulkJobCreate.as_view(), name="bulk_job_create"),
+    path("bulk_jobs/<int:pk>/", KycBulkJobDetail.as_view(), name="bulk_job_detail"),
+    path("bulk_jobs/<int:pk>/results/", KycBulkJobResults.as_view(), name="bulk_job_results"),
+
     #uat
     # path("vendor_active_count/", VendorAllCount.as_view(), name="Vendor_all_count"),
     path("vendors_api_list/", VendorApiList.as_view(), name="vendor_api_list"),
@@ -87,9 +116,24 @@ urlpatterns = [
     #production
     path("prod_bill_details/", ProBillDetailsAPIView.as_view(), name="prod_bill_details"),
     path("prod_pan_details/", ProPanDetailsAPIView.as_view(), name="prod_pan_details"),
+    path("prod_pan_details/batch/", ProPanBatchAPIView.as_view(), name="prod_pan_details_batch"),
     path("prod_name_details/", ProNameMatchAPIView.as_view(), name="prod_name_details"),
     path("prod_voter_details/", ProVoterDetailsAPIView.as_view(), name="prod_voter_details"),
     path("prod_rc_details/", ProRcAPIView.as_view(), name="prod_rc_details"),
     path("prod_driving_license_details/", ProDrivingLicenseAPIView.as_view(), name="prod_driving_license_details"),
 
+    #async (ASGI only, 501 under WSGI): same contracts as the endpoints above
+    path("async/uat_pan_details/", AsyncKycDetailsView.as_view(service="PAN", environment="uat"), name="async_uat_pan_details"),
+    path("async/uat_bill_details/", AsyncKycDetailsView.as_view(service="BILL", environment="uat"), name="async_uat_bill_details"),
+    path("async/uat_name_details/", AsyncKycDetailsView.as_view(service="NAME", environment="uat"), name="async_uat_name_details"),
+    path("async/uat_voter_details/", AsyncKycDetailsView.as_view(service="VOTER", environment="uat"), name="async_uat_voter_details"),
+    path("async/uat_rc_details/", AsyncKycDetailsView.as_view(service="RC", environment="uat"), name="async_uat_rc_details"),
+    path("async/uat_driving_license_details/", AsyncKycDetailsView.as_view(service="DRIVING", environment="uat"), name="async_uat_driving_license_details"),
+    path("async/prod_bill_details/", AsyncKycDetailsView.as_view(service="BILL", environment="pro"), name="async_prod_bill_details"),
+    path("async/prod_pan_details/", AsyncKycDetailsView.as_view(service="PAN", environment="pro"), name="async_prod_pan_details"),
+    path("async/prod_name_details/", AsyncKycDetailsView.as_view(service="NAME", environment="pro"), name="async_prod_name_details"),
+    path("async/prod_voter_details/", AsyncKycDetailsView.as_view(service="VOTER", environment="pro"), name="async_prod_voter_details"),
+    path("async/prod_rc_details/", AsyncKycDetailsView.as_view(service="RC", environment="pro"), name="async_prod_rc_details"),
+    path("async/prod_driving_license_details/", AsyncKycDetailsView.as_view(service="DRIVING", environment="pro"), name="async_prod_driving_license_details"),
+
 ]
\ No newline at end of file
@@ -0,0 +1,118 @@
+import asyncio
+import weakref
+from collections import defaultdict
+
+import httpx
+from django.conf import settings
+
+from kyc_api_gateway.utils.deadline import get_vendor_timeout
+from kyc_api_gateway.utils.http_pool import decode_vendor_response
+
+
+class AsyncVendorClientPool:
+    """
+    Async counterpart of ``VendorSessionPool`` for the ASGI views: one pooled
+    ``httpx.AsyncClient`` per vendor, so thousands of concurrent vendor calls
+    share a bounded set of keep-alive connections instead of a thread each.
+
+    ``VENDOR_ASYNC_MAX_CONNECTIONS`` bounds the connections per vendor and
+    ``VENDOR_ASYNC_MAX_IN_FLIGHT`` the requests in flight per vendor; a call
+    waiting for a slot spends its own timeout doing so. httpx clients and
+    asyncio primitives belong to one event loop, so each loop gets its own set;
+    that only pools connections under an ASGI server, whose one long-lived loop
+    serves every request (``AsyncKycDetailsView`` refuses to run under WSGI).
+    """
+
+    def __init__(self, max_connections=None, max_keepalive=None, max_in_flight=None):
+        self.max_connections = max_connections or getattr(settings, "VENDOR_ASYNC_MAX_CONNECTIONS", 100)
+        self.max_keepalive = max_keepalive or getattr(settings, "VENDOR_ASYNC_MAX_KEEPALIVE", 20)
+        self.max_in_flight = max_in_flight or getattr(settings, "VENDOR_ASYNC_MAX_IN_FLIGHT", 1000)
+        self._loops = weakref.WeakKeyDictionary()
+        self._stats = defaultdict(lambda: {"requests": 0, "in_flight": 0, "limited": 0})
+
+    def _state(self):
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is None:
+            state = {"clients": {}, "limits": {}}
+            self._loops[loop] = state
+        return state
+
+    def get_client(self, vendor):
+        clients = self._state()["clients"]
+        client = clients.get(vendor.id)
+        if client is None:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive,
+                ),
+                headers={"Connection": "keep-alive"},
+            )
+            clients[vendor.id] = client
+        return client
+
+    def _limit(self, vendor):
+        limits = self._state()["limits"]
+        limit = limits.get(vendor.id)
+        if limit is None:
+            limit = limits[vendor.id] = asyncio.Semaphore(self.max_in_flight)
+        return limit
+
+    async def post(self, vendor, url, timeout=None, **kwargs):
+        connect, read = timeout or get_vendor_timeout(vendor)
+        stats = self._stats[vendor.vendor_name]
+        limit = self._limit(vendor)
+
+        try:
+            await asyncio.wait_for(limit.acquire(), timeout=read)
+        except asyncio.TimeoutError:
+            stats["limited"] += 1
+            raise httpx.PoolTimeout(f"Vendor {vendor.vendor_name} has {self.max_in_flight} calls in flight")
+
+        stats["requests"] += 1
+        stats["in_flight"] += 1
+        try:
+            return await self.get_client(vendor).post(
+                url,
+                timeout=httpx.Timeout(read, connect=connect, pool=connect),
+                **kwargs,
+            )
+        finally:
+            stats["in_flight"] -= 1
+            limit.release()
+
+    async def aclose(self):
+        """Close the clients of the running event loop (ASGI lifespan shutdown)."""
+        clients = self._state()["clients"]
+        while clients:
+            _, client = clients.popitem()
+            await client.aclose()
+
+    def stats(self):
+        return {vendor_name: dict(counts) for vendor_name, counts in self._stats.items()}
+
+
+async_vendor_pool = AsyncVendorClientPool()
+
+
+async def vendor_post_json(vendor, url, payload, headers, timeout=None):
+    """Async counterpart of ``http_pool.vendor_post_json``."""
+    try:
+        response = await async_vendor_pool.post(vendor, url, json=payload, headers=headers, timeout=timeout)
+    except httpx.TimeoutException as e:
+        return {
+            "http_error": True,
+            "status_code": 504,
+            "vendor_response": None,
+            "error_message": f"Vendor {vendor.vendor_name} timed out: {e}"
+        }
+    except Exception as e:
+        return {
+            "http_error": True,
+            "status_code": None,
+            "vendor_response": None,
+            "error_message": f"{vendor.vendor_name} request failed: {str(e)}"
+        }
+
+    return decode_vendor_response(vendor, response)
@@ -0,0 +1,56 @@
+import time
+
+from django.conf import settings
+
+
+# Below this budget a vendor call cannot realistically complete, so the chain stops.
+MIN_VENDOR_TIMEOUT = 0.2
+
+
+def get_vendor_timeout(vendor):
+    """
+    ``(connect, read)`` timeout tuple configured on the vendor, falling back to
+    the global defaults for vendors saved before the fields existed.
+    """
+    connect = getattr(vendor, "connect_timeout", None) or settings.VENDOR_DEFAULT_CONNECT_TIMEOUT
+    read = getattr(vendor, "read_timeout", None) or settings.VENDOR_DEFAULT_READ_TIMEOUT
+    return (connect, read)
+
+
+class Deadline:
+    """
+    End-to-end time budget for one KYC request, shared by every vendor in the
+    fallback chain.
+
+    Each vendor gets an equal share of whatever is left, so a slow first vendor
+    can never eat the time reserved for the ones after it, and a fast failure
+    hands its unused time on to the next vendor.
+    """
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    @classmethod
+    def for_service(cls, client_service):
+        seconds = getattr(client_service, "sla_seconds", None) or settings.KYC_REQUEST_DEADLINE_SECONDS
+        return cls(seconds)
+
+    def remaining(self):
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self):
+        return self.remaining() < MIN_VENDOR_TIMEOUT
+
+    def share(self, vendors_left=1):
+        """Seconds the next vendor call may take, out of what is left for ``vendors_left`` vendors."""
+        return max(self.remaining() / max(vendors_left, 1), MIN_VENDOR_TIMEOUT)
+
+    def timeout_for(self, vendor, vendors_left=1):
+        """
+        Timeout tuple for the next vendor call: the vendor's own connect/read
+        timeouts, capped by its share of the remaining budget.
+        """
+        connect, read = get_vendor_timeout(vendor)
+        share = self.share(vendors_left)
+        return (min(connect, share), min(read, share))
@@ -0,0 +1,169 @@
+import threading
+from collections import defaultdict
+
+import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+
+from kyc_api_gateway.utils.deadline import get_vendor_timeout
+
+
+class VendorSessionPool:
+    """
+    Keeps one keep-alive ``requests.Session`` per vendor so repeated KYC calls
+    reuse open TCP/TLS connections instead of handshaking on every request.
+
+    Each session mounts an ``HTTPAdapter`` whose urllib3 pool is bounded by
+    ``VENDOR_HTTP_POOL_MAXSIZE``; with ``VENDOR_HTTP_POOL_BLOCK`` enabled, callers
+    wait for a free connection instead of opening extra ones.
+    """
+
+    def __init__(self, pool_connections=None, pool_maxsize=None, pool_block=None):
+        self.pool_connections = pool_connections or getattr(settings, "VENDOR_HTTP_POOL_CONNECTIONS", 10)
+        self.pool_maxsize = pool_maxsize or getattr(settings, "VENDOR_HTTP_POOL_MAXSIZE", 20)
+        self.pool_block = (
+            pool_block if pool_block is not None else getattr(settings, "VENDOR_HTTP_POOL_BLOCK", True)
+        )
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self._stats = defaultdict(lambda: {"hits": 0, "misses": 0, "reused": 0, "new_connections": 0})
+        self._metrics_hook = None
+
+    def set_metrics_hook(self, hook):
+        """
+        Register ``hook(event, vendor_name, **data)``. Events are ``"session"``
+        (``hit=True/False``) and ``"connection"`` (``reused=True/False``).
+        """
+        self._metrics_hook = hook
+
+    def get_session(self, vendor):
+        key = vendor.id
+        session = self._sessions.get(key)
+        if session is not None:
+            self._record(vendor.vendor_name, "hits")
+            self._emit("session", vendor.vendor_name, hit=True)
+            return session
+
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._build_session()
+                self._sessions[key] = session
+                self._record(vendor.vendor_name, "misses")
+                self._emit("session", vendor.vendor_name, hit=False)
+            else:
+                self._record(vendor.vendor_name, "hits")
+                self._emit("session", vendor.vendor_name, hit=True)
+        return session
+
+    def post(self, vendor, url, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = get_vendor_timeout(vendor)
+
+        session = self.get_session(vendor)
+        adapter = session.get_adapter(url)
+        connection_pool = adapter.poolmanager.connection_from_url(url)
+        connections_before = connection_pool.num_connections
+
+        response = session.post(url, **kwargs)
+
+        reused = connection_pool.num_connections == connections_before
+        self._record(vendor.vendor_name, "reused" if reused else "new_connections")
+        self._emit("connection", vendor.vendor_name, reused=reused)
+        return response
+
+    def close_vendor(self, vendor_id):
+        with self._lock:
+            session = self._sessions.pop(vendor_id, None)
+        if session is not None:
+            session.close()
+
+    def close_all(self):
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            session.close()
+
+    def stats(self):
+        return {vendor_name: dict(counts) for vendor_name, counts in self._stats.items()}
+
+    def _build_session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Connection": "keep-alive"})
+        return session
+
+    def _record(self, vendor_name, counter):
+        self._stats[vendor_name][counter] += 1
+
+    def _emit(self, event, vendor_name, **data):
+        if self._metrics_hook is None:
+            return
+        try:
+            self._metrics_hook(event, vendor_name, **data)
+        except Exception as e:
+            print(f"[ERROR] Vendor pool metrics hook failed: {e}")
+
+
+vendor_session_pool = VendorSessionPool()
+
+
+def vendor_post(vendor, url, **kwargs):
+    return vendor_session_pool.post(vendor, url, **kwargs)
+
+
+def decode_vendor_response(vendor, response):
+    """
+    What the handlers' call functions return for a vendor's HTTP response
+    (``requests`` or ``httpx``): the decoded JSON body, or an ``http_error``
+    dict for a non-2xx or non-JSON answer.
+    """
+    if response.status_code >= 400:
+        try:
+            error_content = response.json()
+        except ValueError:
+            error_content = response.text
+        return {
+            "http_error": True,
+            "status_code": response.status_code,
+            "vendor_response": error_content,
+            "error_message": f"Vendor {vendor.vendor_name} returned error {response.status_code}"
+        }
+
+    try:
+        return response.json()
+    except ValueError:
+        return {
+            "http_error": True,
+            "status_code": response.status_code,
+            "vendor_response": response.text,
+            "error_message": "Invalid JSON response"
+        }
+
+
+def vendor_post_json(vendor, url, payload, headers, timeout=None):
+    """POST ``payload`` to a vendor through the session pool; see ``decode_vendor_response``."""
+    try:
+        response = vendor_post(vendor, url, json=payload, headers=headers, timeout=timeout)
+    except requests.Timeout as e:
+        return {
+            "http_error": True,
+            "status_code": 504,
+            "vendor_response": None,
+            "error_message": f"Vendor {vendor.vendor_name} timed out: {e}"
+        }
+    except Exception as e:
+        return {
+            "http_error": True,
+            "status_code": None,
+            "vendor_response": None,
+            "error_message": f"{vendor.vendor_name} request failed: {str(e)}"
+        }
+
+    return decode_vendor_response(vendor, response)
@@ -0,0 +1,69 @@
+def normalize_identifier(value):
+    """
+    Canonical form of a document number (PAN, RC, DL, EPIC) as stored in the
+    *Details tables, so cache lookups can be plain equality on an index.
+    """
+    if value is None:
+        return None
+    return str(value).strip().upper()
+
+
+# Karza answers HTTP 200 with these statusCode values when the document itself
+# is bad, as opposed to 101 (success) or 104+/5xx (their side failing)
+KARZA_INVALID_STATUS_CODES = {
+    102: "Invalid ID number or combination of inputs",
+    103: "No records found for the given ID",
+}
+
+# Surepass reports an unknown/invalid document as HTTP 404 or 422 with one of
+# these message_code values. A 404/422 without one (wrong base URL or path, a
+# payload it rejects such as a bad DOB format) is an ordinary vendor failure.
+SUREPASS_INVALID_HTTP_STATUSES = {404, 422}
+SUREPASS_INVALID_MESSAGE_CODES = {
+    "not_found": "No records found for the given ID",
+    "verification_failed": "Invalid ID number or combination of inputs",
+    "invalid_id_number": "Invalid ID number",
+}
+
+
+class InvalidIdentifier:
+    """A vendor's definitive "this document does not exist / is invalid" answer."""
+
+    def __init__(self, vendor_name, reason):
+        self.vendor_name = vendor_name
+        self.reason = reason
+
+    def __repr__(self):
+        return f"InvalidIdentifier({self.vendor_name!r}, {self.reason!r})"
+
+
+def detect_invalid_identifier(vendor_name, response):
+    """
+    InvalidIdentifier if ``response`` (a handler result: the vendor JSON, or the
+    ``http_error`` dict for a non-2xx answer) says the identifier is invalid or
+    unknown, else None. Timeouts, auth errors and vendor outages never count.
+    """
+    if not isinstance(response, dict):
+        return None
+
+    vendor = (vendor_name or "").lower()
+    http_error = bool(response.get("http_error"))
+    body = response.get("vendor_response") if http_error else response
+    body = body if isinstance(body, dict) else {}
+
+    if vendor == "karza":
+        try:
+            code = int(body.get("statusCode"))
+        except (TypeError, ValueError):
+            return None
+        if code in KARZA_INVALID_STATUS_CODES:
+            return InvalidIdentifier(vendor_name, KARZA_INVALID_STATUS_CODES[code])
+
+    elif vendor == "surepass":
+        if not http_error or response.get("status_code") not in SUREPASS_INVALID_HTTP_STATUSES:
+            return None
+        message_code = body.get("message_code")
+        if message_code in SUREPASS_INVALID_MESSAGE_CODES:
+            return InvalidIdentifier(vendor_name, body.get("message") or SUREPASS_INVALID_MESSAGE_CODES[message_code])
+
+    return None
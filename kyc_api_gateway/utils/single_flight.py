@@ -0,0 +1,272 @@
+import asyncio
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection
+
+
+MODE_OFF = "off"
+MODE_LOCAL = "local"
+MODE_ADVISORY = "advisory"
+
+ADVISORY_POLL_SECONDS = 0.05
+
+
+class _KeyLocks:
+    """One lock per in-flight key, dropped again when nobody holds or waits on it."""
+
+    def __init__(self):
+        self._locks = {}
+        self._guard = threading.Lock()
+
+    def acquire(self, key, timeout):
+        with self._guard:
+            entry = self._locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        lock = entry[0]
+
+        if lock.acquire(blocking=False):
+            return True, False
+        if lock.acquire(timeout=timeout):
+            return True, True
+        self._release_ref(key)
+        return False, True
+
+    def release(self, key):
+        with self._guard:
+            entry = self._locks[key]
+        entry[0].release()
+        self._release_ref(key)
+
+    def _release_ref(self, key):
+        with self._guard:
+            entry = self._locks.get(key)
+            if entry is None:
+                return
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del self._locks[key]
+
+
+_key_locks = _KeyLocks()
+
+
+class _AsyncKeyLocks:
+    """``_KeyLocks`` for coroutines of one event loop."""
+
+    def __init__(self):
+        self._locks = {}
+
+    async def acquire(self, key, timeout):
+        entry = self._locks.setdefault(key, [asyncio.Lock(), 0])
+        entry[1] += 1
+        lock = entry[0]
+
+        if not lock.locked():
+            await lock.acquire()
+            return True, False
+        try:
+            await asyncio.wait_for(lock.acquire(), timeout=timeout)
+            return True, True
+        except asyncio.TimeoutError:
+            self._release_ref(key)
+            return False, True
+
+    def release(self, key):
+        self._locks[key][0].release()
+        self._release_ref(key)
+
+    def _release_ref(self, key):
+        entry = self._locks.get(key)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del self._locks[key]
+
+
+_async_key_locks = _AsyncKeyLocks()
+
+
+def _advisory_key(key):
+    digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent cache misses for the same KYC lookup so only one
+    request calls the vendors; the others wait and then read the row it saved.
+
+        with single_flight("PAN", "pro", pan) as flight:
+            cached = flight.lookup(lambda: ProPanDetails.objects.filter(...).first())
+            if cached:
+                ...
+            # only one request per key gets here at a time
+
+    ``lookup`` runs the cache query without any lock first. On a miss it takes
+    the lock for the key; if another request was already in flight it waits for
+    it and runs the query again. The lock is held until the ``with`` block ends.
+
+    KYC_SINGLE_FLIGHT selects the scope: "local" (threads of this process),
+    "advisory" (all workers, through a PostgreSQL session advisory lock) or
+    "off". Waiting is bounded by KYC_SINGLE_FLIGHT_WAIT_SECONDS; after that the
+    request calls the vendors itself rather than failing.
+    """
+
+    def __init__(self, key, mode=None, wait_seconds=None):
+        self.key = key
+        self.mode = mode or settings.KYC_SINGLE_FLIGHT
+        self.wait_seconds = wait_seconds if wait_seconds is not None else settings.KYC_SINGLE_FLIGHT_WAIT_SECONDS
+        self.waited = False
+        self._local_held = False
+        self._advisory_held = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+    def lookup(self, fetch, known_invalid=None):
+        """
+        ``known_invalid(key)``, if given, is consulted before ``fetch`` and again
+        after waiting; whatever it returns is passed back instead of a row.
+        """
+        if known_invalid is not None:
+            invalid = known_invalid(self.key)
+            if invalid:
+                return invalid
+
+        result = fetch()
+        if result or self.mode == MODE_OFF:
+            return result
+
+        self.acquire()
+        if self.waited:
+            if known_invalid is not None:
+                invalid = known_invalid(self.key)
+                if invalid:
+                    return invalid
+            result = fetch()
+        return result
+
+    def acquire(self):
+        started = time.monotonic()
+        # Threads of this process queue on the local lock, so at most one of
+        # them polls the advisory lock
+        self._local_held, self.waited = _key_locks.acquire(self.key, self.wait_seconds)
+        acquired = self._local_held
+
+        if acquired and self.mode == MODE_ADVISORY and connection.vendor == "postgresql":
+            remaining = max(self.wait_seconds - (time.monotonic() - started), 0)
+            self._advisory_held, waited = self._acquire_advisory(remaining)
+            self.waited = self.waited or waited
+            acquired = self._advisory_held
+
+        if not acquired:
+            print(f"[WARN] Single flight wait timed out for {self.key}, calling vendors anyway")
+
+    def release(self):
+        if self._advisory_held:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT pg_advisory_unlock(%s)", [_advisory_key(self.key)])
+            except Exception as e:
+                print(f"[ERROR] Could not release advisory lock for {self.key}: {e}")
+            self._advisory_held = False
+        if self._local_held:
+            _key_locks.release(self.key)
+            self._local_held = False
+
+    def _acquire_advisory(self, timeout):
+        lock_id = _advisory_key(self.key)
+        give_up_at = time.monotonic() + timeout
+        waited = False
+        try:
+            with connection.cursor() as cursor:
+                while True:
+                    cursor.execute("SELECT pg_try_advisory_lock(%s)", [lock_id])
+                    if cursor.fetchone()[0]:
+                        return True, waited
+                    if time.monotonic() >= give_up_at:
+                        return False, True
+                    waited = True
+                    time.sleep(ADVISORY_POLL_SECONDS)
+        except Exception as e:
+            print(f"[ERROR] Advisory lock failed for {self.key}: {e}")
+            return False, waited
+
+
+class AsyncSingleFlight:
+    """
+    ``SingleFlight`` for the async views:
+
+        async with async_single_flight("PAN", "pro", pan) as flight:
+            cached = await flight.lookup(lambda: ProPanDetails.objects.filter(...).afirst())
+
+    ``fetch`` returns an awaitable. Coalescing covers the requests served by
+    this process's event loop; "advisory" mode falls back to that too, since
+    a session advisory lock cannot be held across the async ORM's threads.
+    """
+
+    def __init__(self, key, mode=None, wait_seconds=None):
+        self.key = key
+        self.mode = mode or settings.KYC_SINGLE_FLIGHT
+        self.wait_seconds = wait_seconds if wait_seconds is not None else settings.KYC_SINGLE_FLIGHT_WAIT_SECONDS
+        self.waited = False
+        self._held = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+    async def lookup(self, fetch, known_invalid=None):
+        if known_invalid is not None:
+            invalid = known_invalid(self.key)
+            if invalid:
+                return invalid
+
+        result = await fetch()
+        if result or self.mode == MODE_OFF:
+            return result
+
+        await self.acquire()
+        if self.waited:
+            if known_invalid is not None:
+                invalid = known_invalid(self.key)
+                if invalid:
+                    return invalid
+            result = await fetch()
+        return result
+
+    async def acquire(self):
+        self._held, self.waited = await _async_key_locks.acquire(self.key, self.wait_seconds)
+        if not self._held:
+            print(f"[WARN] Single flight wait timed out for {self.key}, calling vendors anyway")
+
+    def release(self):
+        if self._held:
+            _async_key_locks.release(self.key)
+            self._held = False
+
+
+def flight_key(service, environment, *identifier):
+    parts = [str(part).strip().upper() for part in identifier]
+    return ":".join([service, environment, *parts])
+
+
+def single_flight(service, environment, *identifier):
+    """SingleFlight for one (service, environment, normalized identifier) lookup."""
+    return SingleFlight(flight_key(service, environment, *identifier))
+
+
+def async_single_flight(service, environment, *identifier):
+    """AsyncSingleFlight for one (service, environment, normalized identifier) lookup."""
+    return AsyncSingleFlight(flight_key(service, environment, *identifier))
@@ -31,7 +31,7 @@ class ApiManagementListCreate(APIView):
 
         apis = apis.order_by("id")
 
-        paginator = CustomPagination()
+        paginator = CustomPagination(cursor_fields=("created_at", "id"))
         page = paginator.paginate_queryset(apis, request)
         serializer = ApiManagementSerializer(page, many=True)
 
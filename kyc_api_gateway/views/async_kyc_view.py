@@ -0,0 +1,68 @@
+import json
+
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+
+from kyc_api_gateway.services.kyc_pipeline import AsyncKycPipeline, KycPipelineContext, get_pipeline
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncKycDetailsView(View):
+    """
+    Async variant of a pro/uat KYC details endpoint, for the ASGI app:
+
+        AsyncKycDetailsView.as_view(service="PAN", environment="pro")
+
+    Runs the same pipeline as the sync view through ``AsyncKycPipeline``:
+    vendor calls go through the pooled httpx client and the cache and log
+    paths use the async ORM, so a slow vendor call holds a coroutine rather
+    than a worker thread. DRF views cannot be async, hence a plain Django view.
+
+    Needs an ASGI server (``uvicorn config.asgi:application``). Under WSGI
+    Django would run every request in a new event loop, and with it a new set
+    of vendor clients and connections, so the view refuses with 501 instead.
+    """
+
+    http_method_names = ["post"]
+    service = None
+    environment = None
+
+    def get_client_ip(self, request):
+        x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+        if x_forwarded_for:
+            return x_forwarded_for.split(",")[0]
+        return request.META.get("REMOTE_ADDR")
+
+    async def post(self, request):
+        if not isinstance(request, ASGIRequest):
+            print(f"[ERROR] {request.path} needs an ASGI server, refusing under WSGI")
+            return JsonResponse(
+                {"success": False, "status": 501, "error": "This endpoint is only served by the ASGI application"},
+                status=501,
+            )
+
+        try:
+            body = json.loads(request.body or b"{}")
+        except ValueError:
+            body = None
+
+        ctx = KycPipelineContext(
+            body,
+            request.headers.get("X-API-KEY"),
+            {
+                "endpoint": request.path,
+                "request_payload": body,
+                "ip_address": self.get_client_ip(request),
+                "user_agent": request.META.get("HTTP_USER_AGENT", ""),
+            },
+        )
+        pipeline = get_pipeline(self.service, self.environment, AsyncKycPipeline)
+        status_code, body = await pipeline.arun(ctx)
+        response = JsonResponse(body, status=status_code)
+        for header, value in ctx.headers.items():
+            response[header] = value
+        response["Server-Timing"] = ctx.server_timing()
+        return response
@@ -0,0 +1,125 @@
+from django.http import StreamingHttpResponse
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from constant import BULK_JOB_SERVICES, KYC_MY_SERVICES
+from kyc_api_gateway.models.kyc_bulk_job import KycBulkJob
+from kyc_api_gateway.serializers.kyc_bulk_job_serializer import KycBulkJobSerializer
+from kyc_api_gateway.services.bulk_jobs import BulkUploadError, create_job, iter_results
+from kyc_api_gateway.services.client_resolver import resolve_client
+from kyc_api_gateway.services.routing import get_route
+
+
+class KycBulkJobAPIView(APIView):
+    """Bulk jobs are owned by the client whose X-API-KEY created them."""
+
+    authentication_classes = []
+    permission_classes = []
+
+    def _authenticate_client(self, request, environment):
+        api_key = request.headers.get("X-API-KEY")
+        if not api_key:
+            return Response({"success": False, "status": 401, "error": "Missing API key"}, status=401)
+
+        client = resolve_client(api_key, environment)
+        if not client:
+            return Response({"success": False, "status": 401, "error": "Invalid API key"}, status=401)
+        return client
+
+    def _get_job(self, request, pk):
+        job = KycBulkJob.objects.filter(pk=pk).first()
+        not_found = Response({"success": False, "status": 404, "error": "Bulk job not found"}, status=404)
+        if not job:
+            return not_found
+
+        client = self._authenticate_client(request, job.environment)
+        if isinstance(client, Response):
+            return client
+        if job.client_id != client.id:
+            return not_found
+        return job
+
+
+class KycBulkJobCreate(KycBulkJobAPIView):
+    """
+    Queue a bulk job from a multipart upload:
+
+        file         CSV with a header row, or NDJSON (.ndjson/.jsonl)
+        service      PAN / VOTER / RC / DRIVING
+        environment  pro (default) / uat
+
+    The file is validated and deduplicated while it is read; the lookups are
+    done by the run_bulk_jobs worker.
+    """
+
+    parser_classes = [MultiPartParser, FormParser]
+
+    def post(self, request):
+        service = (request.data.get("service") or "").strip().upper()
+        environment = (request.data.get("environment") or "pro").strip().lower()
+        upload = request.FILES.get("file")
+
+        if service not in BULK_JOB_SERVICES:
+            error_msg = f"Field 'service' must be one of: {', '.join(BULK_JOB_SERVICES)}"
+            return Response({"success": False, "status": 400, "error": error_msg}, status=400)
+        if environment not in ("pro", "uat"):
+            return Response({"success": False, "status": 400, "error": "Field 'environment' must be pro or uat"}, status=400)
+        if not upload:
+            return Response({"success": False, "status": 400, "error": "Missing required file"}, status=400)
+
+        client = self._authenticate_client(request, environment)
+        if isinstance(client, Response):
+            return client
+
+        client_service = get_route(client, KYC_MY_SERVICES[service]).client_service
+        if not client_service or client_service.status is False:
+            return Response({"success": False, "status": 403, "error": "Service is not permitted for client"}, status=403)
+
+        try:
+            job = create_job(client, service, environment, upload)
+        except BulkUploadError as e:
+            return Response({"success": False, "status": 400, "error": str(e)}, status=400)
+        except Exception as e:
+            print(f"[ERROR] Bulk job upload failed for client={client.id}: {e}")
+            return Response({"success": False, "status": 500, "error": "Could not create bulk job"}, status=500)
+
+        return Response({
+            "success": True,
+            "status": 201,
+            "message": "Bulk job queued",
+            "data": KycBulkJobSerializer(job).data,
+        }, status=201)
+
+
+class KycBulkJobDetail(KycBulkJobAPIView):
+    def get(self, request, pk):
+        job = self._get_job(request, pk)
+        if isinstance(job, Response):
+            return job
+
+        return Response({"success": True, "status": 200, "data": KycBulkJobSerializer(job).data})
+
+
+class KycBulkJobResults(KycBulkJobAPIView):
+    """
+    Stream a job's results, one line per uploaded row in file order:
+    ``?output=ndjson`` (default) or ``?output=csv``. Can be fetched while the
+    job is running; rows not processed yet have status "pending". A repeated
+    row gets the result of its first occurrence, whose line is in
+    ``duplicate_of``.
+    """
+
+    def get(self, request, pk):
+        job = self._get_job(request, pk)
+        if isinstance(job, Response):
+            return job
+
+        output = (request.GET.get("output") or "ndjson").strip().lower()
+        if output not in ("ndjson", "csv"):
+            return Response({"success": False, "status": 400, "error": "output must be ndjson or csv"}, status=400)
+
+        content_type = "text/csv" if output == "csv" else "application/x-ndjson"
+        response = StreamingHttpResponse(iter_results(job, output), content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="bulk_job_{job.pk}.{output}"'
+        return response
@@ -12,7 +12,18 @@ from rest_framework.permissions import IsAuthenticated
 from auth_system.permissions.token_valid import IsTokenValid
 from kyc_api_gateway.models.api_management import ApiManagement
 from auth_system.utils.pagination import CustomPagination
-from django.db.models import Q
+from auth_system.utils.counters import get_counters
+from django.db.models import Count, Q
+
+
+def client_counters():
+    """The client list dashboard counters; total_api is a count of another table."""
+    counts = ClientManagement.objects.filter(deleted_at__isnull=True).aggregate(
+        total_client=Count("id"),
+        total_active_client=Count("id", filter=Q(status=STATUS_ACTIVE)),
+    )
+    counts["total_api"] = ApiManagement.objects.filter(deleted_at__isnull=True).count()
+    return counts
 
 
 class ClientManagementListCreate(APIView):
@@ -22,9 +33,7 @@ class ClientManagementListCreate(APIView):
         search_query = request.GET.get("search", "").strip()
 
         clients = ClientManagement.objects.filter(deleted_at__isnull=True)
-        total_client = clients.count()
-        total_active_client = clients.filter(status=STATUS_ACTIVE).count()
-        total_api = ApiManagement.objects.filter(deleted_at__isnull=True).count()
+        counts = get_counters("clients", client_counters)
 
         if search_query:
             clients = clients.filter(
@@ -36,7 +45,7 @@ class ClientManagementListCreate(APIView):
 
         clients = clients.order_by("id")
 
-        paginator = CustomPagination()
+        paginator = CustomPagination(cursor_fields=("created_at", "id"))
         page = paginator.paginate_queryset(clients, request)
         serializer = ClientManagementSerializer(page, many=True)
 
@@ -45,9 +54,7 @@ class ClientManagementListCreate(APIView):
             extra_fields={
                 "success": True,
                 "message": "Client list retrieved successfully.",
-                "total_client": total_client,
-                "total_active_client": total_active_client,
-                "total_api": total_api,
+                **counts,
             },
         )
 
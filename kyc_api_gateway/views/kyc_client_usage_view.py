@@ -0,0 +1,49 @@
+from rest_framework.views import APIView
+
+from rest_framework.permissions import IsAuthenticated
+from auth_system.permissions.token_valid import IsTokenValid
+from auth_system.utils.pagination import CustomPagination
+
+from kyc_api_gateway.models.kyc_client_usage import KycClientUsage
+from kyc_api_gateway.serializers.kyc_client_usage_serializer import KycClientUsageSerializer
+
+
+class KycClientUsageList(APIView):
+    """
+    Per-client request counts behind the daily/monthly quotas. Counts are
+    flushed from the workers every KYC_QUOTA_FLUSH_SECONDS, so the current
+    period can lag by that much.
+    """
+
+    permission_classes = [IsAuthenticated, IsTokenValid]
+
+    def get(self, request):
+        usage = KycClientUsage.objects.select_related("client", "my_service")
+
+        client_id = request.GET.get("client_id")
+        service_id = request.GET.get("service_id")
+        period = request.GET.get("period", "").strip()
+        period_start = request.GET.get("period_start", "").strip()
+
+        if client_id:
+            usage = usage.filter(client_id=client_id)
+        if service_id:
+            usage = usage.filter(my_service_id=service_id)
+        if period:
+            usage = usage.filter(period=period)
+        if period_start:
+            usage = usage.filter(period_start=period_start)
+
+        usage = usage.order_by("-period_start", "client_id", "my_service_id", "period")
+
+        paginator = CustomPagination()
+        page = paginator.paginate_queryset(usage, request)
+        serializer = KycClientUsageSerializer(page, many=True)
+
+        return paginator.get_custom_paginated_response(
+            data=serializer.data,
+            extra_fields={
+                "success": True,
+                "message": "Client usage retrieved successfully.",
+            },
+        )
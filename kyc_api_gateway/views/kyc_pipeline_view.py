@@ -0,0 +1,87 @@
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from kyc_api_gateway.services.kyc_pipeline import KycPipelineContext, PipelineStop, get_pipeline
+from kyc_api_gateway.services.routing import get_route
+
+
+class KycPipelineAPIView(APIView):
+    """
+    A pro/uat KYC details endpoint run by ``KycPipeline``. Subclasses only
+    name the service and environment:
+
+        class ProPanDetailsAPIView(KycPipelineAPIView):
+            service = "PAN"
+            environment = "pro"
+
+    Stage timings are returned in a ``Server-Timing`` header.
+    """
+
+    authentication_classes = []
+    permission_classes = []
+
+    service = None
+    environment = None
+
+    def get_pipeline(self):
+        return get_pipeline(self.service, self.environment)
+
+    def get_client_ip(self, request):
+        x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+        if x_forwarded_for:
+            return x_forwarded_for.split(",")[0]
+        return request.META.get("REMOTE_ADDR")
+
+    def get_context(self, request):
+        return KycPipelineContext(
+            request.data,
+            request.headers.get("X-API-KEY"),
+            {
+                "endpoint": request.path,
+                "request_payload": request.data,
+                "ip_address": self.get_client_ip(request),
+                "user_agent": request.META.get("HTTP_USER_AGENT", ""),
+            },
+        )
+
+    def post(self, request):
+        ctx = self.get_context(request)
+        status_code, body = self.get_pipeline().run(ctx)
+        response = Response(body, status=status_code)
+        for header, value in ctx.headers.items():
+            response[header] = value
+        response["Server-Timing"] = ctx.server_timing()
+        return response
+
+    def _authenticate_client(self, request):
+        """The client for the request's X-API-KEY, or the 401 Response (logged)."""
+        pipeline = self.get_pipeline()
+        ctx = self.get_context(request)
+        pipeline.run_stage("authenticate", ctx)
+        if ctx.result is None:
+            return ctx.client
+
+        pipeline.run_stage("log", ctx)
+        status_code, body = ctx.result
+        return Response(body, status=status_code)
+
+    def _reject(self, request, status_code, error, headers=None):
+        """Error Response for a request refused outside the pipeline, logged like a pipeline stop."""
+        ctx = self.get_context(request)
+        ctx.stop(PipelineStop(status_code, error, headers=headers))
+        self.get_pipeline().run_stage("log", ctx)
+        response = Response(ctx.result[1], status=status_code)
+        for header, value in ctx.headers.items():
+            response[header] = value
+        return response
+
+    def _get_client_service(self, client, service_id):
+        cs = get_route(client, service_id).client_service
+        if not cs:
+            raise ValueError(f"Cache days not configured for client={client.id}, service_id={service_id}")
+        if cs.status is False:
+            raise PermissionError("Service is not permitted for client")
+        return cs
+
+    def _get_priority_vendors(self, client, service_id):
+        return get_route(client, service_id).vendors
@@ -0,0 +1,90 @@
+from django.conf import settings
+from rest_framework.response import Response
+
+from constant import KYC_MY_SERVICES
+from kyc_api_gateway.serializers.pro_pan_details_serializer import ProPanDetailsSerializer
+from kyc_api_gateway.services.pro.pan_batch import INVALID_ITEM_ERROR, log_invalid_items, verify_pan_batch
+from kyc_api_gateway.services.rate_limit import check_rate_limit
+from kyc_api_gateway.utils.identifiers import normalize_identifier
+from kyc_api_gateway.views.pro.pan_details_view import ProPanDetailsAPIView
+
+
+class ProPanBatchAPIView(ProPanDetailsAPIView):
+    """
+    Verify up to KYC_BATCH_MAX_ITEMS PANs in one call:
+
+        POST {"pans": ["ABCDE1234F", ...]}
+
+    Returns one result per input PAN, in input order. Each result has its own
+    success/status, so one bad PAN does not fail the batch. Rejections of the
+    whole batch and of malformed items are written to the request log like the
+    single-PAN endpoint's.
+    """
+
+    def post(self, request):
+        ip_address = self.get_client_ip(request)
+        user_agent = request.META.get("HTTP_USER_AGENT", "")
+        pans = request.data.get("pans")
+
+        if not isinstance(pans, list) or not pans:
+            return self._reject(request, 400, "Field 'pans' must be a non-empty list")
+
+        if len(pans) > settings.KYC_BATCH_MAX_ITEMS:
+            return self._reject(request, 400, f"At most {settings.KYC_BATCH_MAX_ITEMS} PANs per batch")
+
+        client = self._authenticate_client(request)
+        if isinstance(client, Response):
+            return client
+
+        service_id = KYC_MY_SERVICES.get("PAN")
+        try:
+            client_service = self._get_client_service(client, service_id)
+        except PermissionError as e:
+            return self._reject(request, 403, str(e))
+        except ValueError as e:
+            return self._reject(request, 500, str(e))
+
+        normalized = [normalize_identifier(pan) if isinstance(pan, str) else None for pan in pans]
+        unique = list(dict.fromkeys(pan for pan in normalized if pan))
+
+        # Each PAN looked up counts against the client's rate limit and quotas
+        throttled = check_rate_limit(client_service, count=len(unique)) if unique else None
+        if throttled:
+            return self._reject(request, 429, throttled.reason, {"Retry-After": str(throttled.retry_after)})
+
+        log_context = {"endpoint": request.path, "ip_address": ip_address, "user_agent": user_agent}
+        log_invalid_items([value for value, pan in zip(pans, normalized) if not pan], log_context)
+        items = verify_pan_batch(
+            unique,
+            client,
+            client_service,
+            self._get_priority_vendors(client, service_id),
+            log_context,
+        )
+        by_pan = {item.pan: item for item in items}
+
+        results = [self._item_result(pan, by_pan.get(pan)) for pan in normalized]
+        verified = sum(1 for result in results if result["success"])
+        return Response({
+            "success": True,
+            "status": 200,
+            "message": f"{verified} of {len(results)} PANs verified",
+            "data": results,
+        })
+
+    def _item_result(self, pan, item):
+        if item is None:
+            return {"pan": pan, "success": False, "status": 400, "error": INVALID_ITEM_ERROR}
+
+        if item.details is None:
+            error = item.invalid.reason if item.invalid else item.error
+            return {"pan": pan, "success": False, "status": item.status or 500, "error": error}
+
+        return {
+            "pan": pan,
+            "success": True,
+            "status": 200,
+            "source": item.source,
+            "stale": item.stale,
+            "data": ProPanDetailsSerializer(item.details).data,
+        }
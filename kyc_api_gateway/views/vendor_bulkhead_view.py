@@ -0,0 +1,40 @@
+import os
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from rest_framework.permissions import IsAuthenticated
+from auth_system.permissions.token_valid import IsTokenValid
+
+from kyc_api_gateway.services.bulkhead import vendor_bulkheads
+
+
+class VendorBulkheadStats(APIView):
+    """
+    Saturation of the vendor bulkheads in the worker process that serves the
+    request: slots in use, queue length, peaks and calls turned away.
+    """
+
+    permission_classes = [IsAuthenticated, IsTokenValid]
+
+    def get(self, request):
+        bulkheads = vendor_bulkheads.stats()
+
+        vendor_id = request.GET.get("vendor_id")
+        service = request.GET.get("service", "").strip().upper()
+        if vendor_id:
+            bulkheads = [row for row in bulkheads if str(row["vendor_id"]) == vendor_id]
+        if service:
+            bulkheads = [row for row in bulkheads if row["service"] == service]
+
+        return Response(
+            {
+                "success": True,
+                "message": "Vendor bulkheads retrieved successfully.",
+                "pid": os.getpid(),
+                "total_saturated": sum(1 for row in bulkheads if row["in_flight"] >= row["max_in_flight"]),
+                "data": bulkheads,
+            },
+            status=status.HTTP_200_OK,
+        )
@@ -0,0 +1,98 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from django.shortcuts import get_object_or_404
+
+from rest_framework.permissions import IsAuthenticated
+from auth_system.permissions.token_valid import IsTokenValid
+from auth_system.utils.pagination import CustomPagination
+
+from constant import CIRCUIT_OPEN, CIRCUIT_HALF_OPEN, CIRCUIT_STATE_CHOICES
+from kyc_api_gateway.models.vendor_circuit_breaker import VendorCircuitBreaker
+from kyc_api_gateway.serializers.vendor_circuit_breaker_serializer import (
+    VendorCircuitBreakerSerializer,
+)
+from kyc_api_gateway.services.circuit_breaker import set_breaker_state
+
+
+class VendorCircuitBreakerList(APIView):
+    permission_classes = [IsAuthenticated, IsTokenValid]
+
+    def get(self, request):
+        breakers = VendorCircuitBreaker.objects.select_related("vendor", "my_service")
+
+        total_breakers = breakers.count()
+        total_open = breakers.filter(state=CIRCUIT_OPEN).count()
+        total_half_open = breakers.filter(state=CIRCUIT_HALF_OPEN).count()
+
+        vendor_id = request.GET.get("vendor_id")
+        service_id = request.GET.get("service_id")
+        environment = request.GET.get("environment", "").strip()
+        state = request.GET.get("state", "").strip()
+
+        if vendor_id:
+            breakers = breakers.filter(vendor_id=vendor_id)
+        if service_id:
+            breakers = breakers.filter(my_service_id=service_id)
+        if environment:
+            breakers = breakers.filter(environment=environment)
+        if state:
+            breakers = breakers.filter(state=state)
+
+        breakers = breakers.order_by("vendor_id", "my_service_id", "environment")
+
+        paginator = CustomPagination()
+        page = paginator.paginate_queryset(breakers, request)
+        serializer = VendorCircuitBreakerSerializer(page, many=True)
+
+        return paginator.get_custom_paginated_response(
+            data=serializer.data,
+            extra_fields={
+                "success": True,
+                "message": "Vendor circuit breakers retrieved successfully.",
+                "total_breakers": total_breakers,
+                "total_open": total_open,
+                "total_half_open": total_half_open,
+            },
+        )
+
+
+class VendorCircuitBreakerDetail(APIView):
+    permission_classes = [IsAuthenticated, IsTokenValid]
+
+    def get(self, request, pk):
+        breaker = get_object_or_404(VendorCircuitBreaker, pk=pk)
+        serializer = VendorCircuitBreakerSerializer(breaker)
+        return Response(
+            {
+                "success": True,
+                "message": "Vendor circuit breaker retrieved successfully.",
+                "data": serializer.data,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    def patch(self, request, pk):
+        breaker = get_object_or_404(VendorCircuitBreaker, pk=pk)
+        new_state = request.data.get("state")
+
+        if new_state not in dict(CIRCUIT_STATE_CHOICES):
+            return Response(
+                {
+                    "success": False,
+                    "message": "Failed to update vendor circuit breaker.",
+                    "errors": {"state": [f"Must be one of: {', '.join(dict(CIRCUIT_STATE_CHOICES))}"]},
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        set_breaker_state(breaker, new_state, user_id=request.user.id)
+        serializer = VendorCircuitBreakerSerializer(breaker)
+        return Response(
+            {
+                "success": True,
+                "message": "Vendor circuit breaker updated successfully.",
+                "data": serializer.data,
+            },
+            status=status.HTTP_200_OK,
+        )
@@ -11,7 +11,16 @@ from kyc_api_gateway.serializers.vendor_management_serializer import (
 from rest_framework.permissions import IsAuthenticated
 from auth_system.permissions.token_valid import IsTokenValid
 from auth_system.utils.pagination import CustomPagination
-from django.db.models import Q
+from auth_system.utils.counters import get_counters
+from django.db.models import Count, Q
+
+
+def vendor_counters():
+    """The vendor list dashboard counters, in one conditional-aggregation query."""
+    return VendorManagement.objects.filter(deleted_at__isnull=True).aggregate(
+        total_vendor=Count("id"),
+        total_active_vendor=Count("id", filter=Q(status=True)),  # BooleanField
+    )
 
 
 class VendorManagementListCreate(APIView):
@@ -20,9 +29,7 @@ class VendorManagementListCreate(APIView):
     def get(self, request):
         search_query = request.GET.get("search", "").strip()
         vendors = VendorManagement.objects.filter(deleted_at__isnull=True)
-
-        total_vendor = vendors.count()
-        total_active_vendor = vendors.filter(status=True).count()  # BooleanField
+        counts = get_counters("vendors", vendor_counters)
 
         if search_query:
             vendors = vendors.filter(
@@ -36,7 +43,7 @@ class VendorManagementListCreate(APIView):
 
         vendors = vendors.order_by("id")
 
-        paginator = CustomPagination()
+        paginator = CustomPagination(cursor_fields=("created_at", "id"))
         page = paginator.paginate_queryset(vendors, request)
         serializer = VendorManagementSerializer(page, many=True)
 
@@ -45,8 +52,7 @@ class VendorManagementListCreate(APIView):
             extra_fields={
                 "success": True,
                 "message": "Vendor list retrieved successfully.",
-                "total_vendor": total_vendor,
-                "total_active_vendor": total_active_vendor,
+                **counts,
             },
         )
 